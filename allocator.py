@@ -0,0 +1,205 @@
+import os
+import random
+import string
+import threading
+
+# ======================================================
+# Asignación de valores únicos para datos de prueba
+# ======================================================
+# Los códigos IATA, IDs y emails de prueba se sacaban al azar
+# esperando que no existieran; con el volumen de la suite eso
+# terminaba en 400, reintentos y tests saltados. Aquí cada
+# espacio de valores se reparte entre los workers de xdist
+# (o el proceso, sin xdist), así que dos workers nunca
+# generan el mismo valor:
+#
+#   IATA   las 17.576 combinaciones AAA-ZZZ, en un bitset de
+#          2,2 KB. El worker i de n usa los índices ≡ i (mod n)
+#          y antes de la primera asignación marca como usados
+#          los códigos que ya existen en el servidor.
+#   ID     etiqueta de la corrida + worker + contador.
+#   email  lo mismo, dentro de un dominio de prueba.
+#
+# La etiqueta de la corrida (2 caracteres base36) también se
+# elige a partir del servidor: antes del primer ID o email se
+# descartan las etiquetas que ya aparecen en los IDs y emails
+# existentes, así una corrida no repite valores de las
+# anteriores. Queda un único caso sin cubrir: dos corridas que
+# se siembran a la vez, antes de que ninguna cree nada, pueden
+# elegir la misma etiqueta (1 en 1.296); la fábrica de
+# entidades reintenta esas colisiones al crear.
+#
+# Ninguna asignación hace requests (salvo las siembras).
+# ======================================================
+
+ALPHABET = string.ascii_uppercase
+IATA_SPACE = len(ALPHABET) ** 3
+BASE36 = string.digits + string.ascii_lowercase
+TAG_LENGTH = 2
+
+
+def worker_partition():
+    """
+    Devuelve (índice, total) del worker actual de pytest-xdist.
+
+    Sin xdist el proceso es el único worker: (0, 1).
+    """
+    worker = os.getenv("PYTEST_XDIST_WORKER", "")
+    count = int(os.getenv("PYTEST_XDIST_WORKER_COUNT", "1") or 1)
+    index = int(worker[2:]) if worker.startswith("gw") and worker[2:].isdigit() else 0
+    return index % max(count, 1), max(count, 1)
+
+
+def _base36(number, width):
+    digits = []
+    while number:
+        number, rest = divmod(number, 36)
+        digits.append(BASE36[rest])
+    return "".join(reversed(digits)).rjust(width, "0")
+
+
+def run_tag_of(value):
+    """
+    Etiqueta de corrida con la que pudo generarse un ID o email.
+
+    Ejemplos: "k302000f" → "k3"; "test.k3-02-15@demo.com" → "k3".
+    """
+    local, at, _ = value.partition("@")
+    if at:
+        return local.rpartition(".")[2].partition("-")[0]
+    return value[:TAG_LENGTH]
+
+
+def iata_code(index):
+    """Código IATA de la posición `index` (0 → "AAA", 17575 → "ZZZ")."""
+    first, rest = divmod(index, 26 * 26)
+    second, third = divmod(rest, 26)
+    return ALPHABET[first] + ALPHABET[second] + ALPHABET[third]
+
+
+def iata_index(code):
+    """Posición de un código IATA, o None si no es de 3 letras mayúsculas."""
+    if len(code) != 3 or any(char not in ALPHABET for char in code):
+        return None
+    return (ALPHABET.index(code[0]) * 26 + ALPHABET.index(code[1])) * 26 + ALPHABET.index(code[2])
+
+
+class ValueAllocator:
+    """Entrega códigos IATA, IDs y emails que no se repiten entre workers."""
+
+    def __init__(self, partition=None, run_tag=None, seed=None):
+        """
+        Args:
+            partition (tuple, optional): (índice, total) del worker. Por defecto
+                worker_partition().
+            run_tag (str, optional): Prefijo de la corrida para IDs y emails,
+                para no chocar con lo que dejaron corridas anteriores. Por
+                defecto API_RUN_TAG o una etiqueta libre según set_tag_seed()
+                (al azar si no hay siembra).
+            seed (callable, optional): Devuelve los códigos IATA que ya existen
+                en el servidor; se llama una vez, antes de la primera asignación.
+        """
+        self.index, self.count = partition or worker_partition()
+        fixed_tag = run_tag or os.getenv("API_RUN_TAG")
+        self.run_tag = fixed_tag or "".join(random.choices(BASE36, k=TAG_LENGTH))
+        self._tag_fixed = bool(fixed_tag)
+        self._tag_seed = None
+        self._seed = seed
+        self._lock = threading.Lock()
+        self._seed_lock = threading.Lock()
+        self._used = bytearray((IATA_SPACE + 7) // 8)
+        # Cada corrida arranca en otro punto de su partición
+        self._cursor = random.randrange(IATA_SPACE // self.count + 1)
+        self._counter = 0
+
+    # --------------------------------------------------
+    # Códigos IATA
+    # --------------------------------------------------
+    def set_seed(self, seed):
+        """Cambia la fuente de códigos existentes (se usa en la próxima asignación)."""
+        with self._seed_lock:
+            self._seed = seed
+
+    def mark_used(self, codes):
+        """Marca códigos IATA como ocupados (ej. los que ya existen o respondieron 'exists')."""
+        with self._lock:
+            for code in codes:
+                index = iata_index(code)
+                if index is not None:
+                    self._used[index >> 3] |= 1 << (index & 7)
+
+    def _is_used(self, index):
+        return self._used[index >> 3] & (1 << (index & 7))
+
+    def iata(self):
+        """
+        Devuelve un código IATA libre de la partición de este worker.
+
+        Raises:
+            RuntimeError: Si la partición no tiene códigos libres.
+        """
+        # Los demás hilos esperan a que termine la siembra
+        with self._seed_lock:
+            if self._seed is not None:
+                seed, self._seed = self._seed, None
+                self.mark_used(seed())
+
+        size = (IATA_SPACE - self.index + self.count - 1) // self.count
+        with self._lock:
+            for _ in range(size):
+                position = self._cursor % size
+                self._cursor += 1
+                index = self.index + position * self.count
+                if not self._is_used(index):
+                    self._used[index >> 3] |= 1 << (index & 7)
+                    return iata_code(index)
+        raise RuntimeError(f"No quedan códigos IATA libres para el worker {self.index}/{self.count}")
+
+    # --------------------------------------------------
+    # IDs y emails
+    # --------------------------------------------------
+    def set_tag_seed(self, seed):
+        """
+        Fuente de los IDs y emails que ya existen en el servidor.
+
+        `seed()` se llama una vez, antes del primer ID o email, y la etiqueta
+        de la corrida pasa a ser una que no aparece en ninguno de esos valores.
+        No tiene efecto si la etiqueta se fijó (argumento o API_RUN_TAG).
+        """
+        with self._seed_lock:
+            self._tag_seed = seed
+
+    def _ensure_tag(self):
+        with self._seed_lock:
+            if self._tag_seed is None:
+                return
+            seed, self._tag_seed = self._tag_seed, None
+            if self._tag_fixed:
+                return
+            taken = {run_tag_of(value) for value in seed()}
+            free = [
+                tag for tag in (_base36(n, TAG_LENGTH) for n in range(36 ** TAG_LENGTH))
+                if tag not in taken
+            ]
+            if free and self.run_tag in taken:
+                self.run_tag = random.choice(free)
+
+    def _next(self):
+        with self._lock:
+            self._counter += 1
+            return self._counter
+
+    def id(self, length=8):
+        """ID alfanumérico único: corrida + worker + contador (ej. "k302000f")."""
+        self._ensure_tag()
+        counter_width = max(length - len(self.run_tag) - 2, 1)
+        return f"{self.run_tag}{_base36(self.index, 2)}{_base36(self._next(), counter_width)}"
+
+    def email(self, prefix="test", domain="demo.com"):
+        """Email único (ej. "test.k3-02-15@demo.com")."""
+        self._ensure_tag()
+        return f"{prefix}.{self.run_tag}-{self.index:02d}-{self._next()}@{domain}"
+
+
+# Asignador compartido por el proceso (un worker de xdist)
+allocator = ValueAllocator()
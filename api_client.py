@@ -1,8 +1,30 @@
 import requests
 import time
 import os
-import jsonschema
-from jsonschema import validate
+import socket
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import NameResolutionError, NewConnectionError
+from urllib3.poolmanager import PoolManager
+import schema_registry
+from schema_registry import register_schema, validate
+from retry_policy import default_policy, parse_retry_after
+from rate_limiter import default_limiter, endpoint_group
+from response_cache import WRITE_METHODS, request_key
+from single_flight import default_group, share_response
+from token_cache import token_manager
+from json_stream import iter_json_array
+from api_response import APIResponse
+from endpoints import path_template
+from metrics import current_timing, metrics
+from inproc_adapter import INPROC_SCHEME, InProcessAdapter
+from cassette import CassetteAdapter
+from health_gate import GateAdapter
+from deadline import DeadlineExceeded, current_deadline
 
 # ======================================================
 # Configuración base del cliente API
@@ -13,18 +35,43 @@ BASE = os.getenv("BASE_URL", "http://localhost:8000")
 
 
 
-# Número máximo de reintentos en caso de error de red/servidor
+# Número máximo de intentos en caso de error de red/servidor (ver retry_policy.py)
 RETRIES = int(os.getenv("API_RETRIES", "3"))
 
 # Tiempo máximo de espera para cada request (en segundos)
 TIMEOUT = int(os.getenv("API_TIMEOUT", "5"))
 
+# Tamaño de los trozos leídos al recorrer respuestas en streaming (bytes)
+STREAM_CHUNK_SIZE = int(os.getenv("API_STREAM_CHUNK_SIZE", str(64 * 1024)))
+
+# Ruta de login: sus requests no llevan ni invalidan el token del cliente
+LOGIN_PATH = "/auth/login"
+
+# Paginación skip/limit: tamaño inicial de página y páginas pedidas por adelantado
+PAGE_SIZE = int(os.getenv("API_PAGE_SIZE", "50"))
+PAGE_PREFETCH = int(os.getenv("API_PAGE_PREFETCH", "3"))
+
+# Agrupar GETs idénticos en vuelo en una sola request (ver single_flight.py)
+COALESCE_GETS = os.getenv("API_COALESCE_GETS", "1") != "0"
+
+# Conexiones persistentes por host que mantiene el pool HTTP
+POOL_SIZE = int(os.getenv("API_POOL_SIZE", "10"))
+
+# Conexiones a abrir por adelantado al crear el cliente (0 = desactivado)
+POOL_PREWARM = int(os.getenv("API_POOL_PREWARM", "0"))
+
+# Opciones de socket: sin algoritmo de Nagle y keep-alive a nivel TCP
+SOCKET_OPTIONS = list(HTTPConnection.default_socket_options)
+for _option in [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1), (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]:
+    if _option not in SOCKET_OPTIONS:
+        SOCKET_OPTIONS.append(_option)
+
 # ======================================================
 # Esquemas de validación JSON
 # ======================================================
 # Estos esquemas definen la estructura esperada de las
 # respuestas de la API. Se validan automáticamente con
-# la librería `jsonschema`.
+# la librería `jsonschema` (importada al validar por primera vez).
 # ======================================================
 
 LOGIN_SCHEMA = {
@@ -57,6 +104,368 @@ SUCCESS_SCHEMA = {
     "additionalProperties": True  # Puede contener más propiedades
 }
 
+# Los validadores se compilan una sola vez (ver schema_registry.py)
+register_schema("login", LOGIN_SCHEMA)
+register_schema("error", ERROR_SCHEMA)
+register_schema("success", SUCCESS_SCHEMA)
+
+# ======================================================
+# Validación de respuestas
+# ======================================================
+
+def validate_json_response(response, schema):
+    """
+    Decodifica el JSON de una respuesta y lo valida contra un esquema.
+
+    Compartida por APIClient y AsyncAPIClient. El esquema puede ser un dict o
+    el nombre con que fue registrado; el validador compilado se toma del registro.
+
+    Args:
+        response: Respuesta con método `.json()` (ej. requests.Response).
+        schema (dict | str): Esquema JSON Schema (o su nombre registrado).
+
+    Returns:
+        dict: Respuesta JSON validada.
+
+    Raises:
+        Exception: Si la validación falla o la respuesta no es JSON válido.
+    """
+    try:
+        data = response.json()
+        validate(instance=data, schema=schema)
+        return data
+    except schema_registry.ValidationError as e:
+        raise Exception(f"Validación de esquema falló: {e}")
+    except ValueError as e:
+        raise Exception(f"Respuesta JSON inválida: {e}")
+
+# ======================================================
+# Pool de conexiones HTTP
+# ======================================================
+# Todas las requests del cliente pasan por una sesión de
+# `requests` con un adaptador propio. Así las conexiones
+# TCP/TLS se reutilizan entre llamadas (keep-alive), se
+# cuenta cuántas se abrieron y cuántas se reutilizaron, y
+# los reintentos se resuelven con una única RetryPolicy.
+# ======================================================
+
+class PoolStats:
+    """Contadores thread-safe de conexiones abiertas y reutilizadas."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.opened = 0
+        self.reused = 0
+
+    def record_open(self):
+        with self._lock:
+            self.opened += 1
+
+    def record_reuse(self):
+        with self._lock:
+            self.reused += 1
+
+    def snapshot(self):
+        """Devuelve una copia de los contadores como diccionario."""
+        with self._lock:
+            return {"opened": self.opened, "reused": self.reused}
+
+
+class _CountingConnectionMixin:
+    """
+    Registra en PoolStats cada conexión de socket nueva y, si hay una
+    medición en curso (metrics.py), los tiempos de DNS, conexión y TLS.
+    """
+
+    pool_stats = None
+
+    def _new_conn(self):
+        timing = current_timing()
+        if timing is None:
+            return super()._new_conn()
+
+        # Se resuelve el DNS aparte para poder medirlo sin repetir la consulta
+        start = time.perf_counter()
+        try:
+            addresses = socket.getaddrinfo(self._dns_host, self.port, 0, socket.SOCK_STREAM)
+        except socket.gaierror as e:
+            raise NameResolutionError(self.host, self, e) from e
+        resolved = time.perf_counter()
+        timing.dns += resolved - start
+
+        dns_host = self._dns_host
+        last_error = None
+        try:
+            for *_, sockaddr in addresses:
+                self._dns_host = sockaddr[0]
+                try:
+                    sock = super()._new_conn()
+                    break
+                except NewConnectionError as e:
+                    last_error = e
+            else:
+                raise last_error
+        finally:
+            self._dns_host = dns_host
+
+        timing.connect += time.perf_counter() - resolved
+        return sock
+
+    def connect(self):
+        timing = current_timing()
+        if timing is None:
+            super().connect()
+        else:
+            start = time.perf_counter()
+            before = timing.dns + timing.connect
+            super().connect()
+            if isinstance(self, HTTPSConnection):
+                socket_time = timing.dns + timing.connect - before
+                timing.tls += max(0.0, time.perf_counter() - start - socket_time)
+
+        if self.pool_stats is not None:
+            self.pool_stats.record_open()
+
+
+class _CountingHTTPConnection(_CountingConnectionMixin, HTTPConnection):
+    pass
+
+
+class _CountingHTTPSConnection(_CountingConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _CountingPoolMixin:
+    """Registra en PoolStats cada conexión ya abierta que se reutiliza."""
+
+    pool_stats = None
+
+    def _new_conn(self):
+        conn = super()._new_conn()
+        conn.pool_stats = self.pool_stats
+        return conn
+
+    def _get_conn(self, timeout=None):
+        conn = super()._get_conn(timeout=timeout)
+        if conn.sock is not None and self.pool_stats is not None:
+            self.pool_stats.record_reuse()
+        return conn
+
+
+class _CountingHTTPConnectionPool(_CountingPoolMixin, HTTPConnectionPool):
+    ConnectionCls = _CountingHTTPConnection
+
+
+class _CountingHTTPSConnectionPool(_CountingPoolMixin, HTTPSConnectionPool):
+    ConnectionCls = _CountingHTTPSConnection
+
+
+class _CountingPoolManager(PoolManager):
+    """PoolManager que crea pools con contadores compartidos."""
+
+    def __init__(self, pool_stats, **kwargs):
+        super().__init__(**kwargs)
+        self.pool_stats = pool_stats
+        self.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+
+    def _new_pool(self, scheme, host, port, request_context=None):
+        pool = super()._new_pool(scheme, host, port, request_context=request_context)
+        pool.pool_stats = self.pool_stats
+        return pool
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """
+    Adaptador HTTP con pool de conexiones persistentes por host.
+
+    - `pool_size` conexiones keep-alive por host.
+    - TCP_NODELAY y SO_KEEPALIVE en cada socket.
+    - Contadores de conexiones abiertas/reutilizadas en `pool_stats`.
+    - Reintentos según `retry_policy` (None = sin reintentos).
+    - Cada intento espera su turno en `rate_limiter` (None = sin límite).
+    """
+
+    def __init__(self, pool_size=POOL_SIZE, pool_block=False, retry_policy=None, rate_limiter=None,
+                 **kwargs):
+        self.pool_stats = PoolStats()
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        super().__init__(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            pool_block=pool_block,
+            **kwargs
+        )
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        pool_kwargs.setdefault("socket_options", SOCKET_OPTIONS)
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = _CountingPoolManager(
+            self.pool_stats,
+            num_pools=connections,
+            maxsize=maxsize,
+            block=block,
+            **pool_kwargs
+        )
+
+    def send(self, request, **kwargs):
+        """
+        Envía la request aplicando la política de reintentos del adaptador.
+
+        El timeout de cada intento y las esperas entre reintentos se recortan
+        al presupuesto del test en curso (ver deadline.py).
+        """
+        state = self.retry_policy.start(request.method, request.url) if self.retry_policy else None
+        attempt = 1
+        while True:
+            try:
+                response = self._send_attempt(request, attempt, **kwargs)
+            except DeadlineExceeded:
+                raise
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if current_deadline.expired:
+                    # El timeout vino del presupuesto del test, no del servidor
+                    raise current_deadline.error(str(e)) from e
+                delay = state.on_error(e) if state is not None else None
+                if delay is None or not current_deadline.allows(delay):
+                    raise
+            else:
+                delay = state.on_response(response) if state is not None else None
+                if delay is None or not current_deadline.allows(delay):
+                    return response
+                # Se consume el body para devolver la conexión al pool
+                response.content
+                response.close()
+            attempt += 1
+            time.sleep(delay)
+
+    def _send_attempt(self, request, attempt, timeout=None, **kwargs):
+        """
+        Envía un único intento y registra sus fases en metrics.
+
+        El timeout se recorta al presupuesto del test después de la espera en
+        el limitador, que tampoco puede pasarse del presupuesto.
+        """
+        endpoint = path_template(request.path_url)
+        group = endpoint_group(request.url)
+        if self.rate_limiter is not None:
+            waited = self.rate_limiter.acquire(group, deadline=current_deadline)
+            if waited:
+                metrics.observe(request.method, endpoint, "throttle", waited)
+        kwargs["timeout"] = current_deadline.cap_timeout(timeout)
+
+        timing = metrics.begin(attempt)
+        try:
+            response = super().send(request, **kwargs)
+            if timing is not None:
+                received = time.perf_counter()
+                network = timing.dns + timing.connect + timing.tls
+                timing.ttfb = max(0.0, received - timing.start - network)
+                if not kwargs.get("stream"):
+                    response.content
+                    timing.download = time.perf_counter() - received
+                response.timing = timing
+        except Exception:
+            metrics.finish(timing, request.method, endpoint, "error")
+            raise
+        metrics.finish(timing, request.method, endpoint, response.status_code)
+        if self.rate_limiter is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            self.rate_limiter.on_response(group, response.status_code, retry_after)
+        return response
+
+    def prewarm(self, url, connections, verify=True, cert=None):
+        """
+        Abre `connections` conexiones hacia el host de `url` y las deja en el pool.
+
+        `verify` y `cert` deben coincidir con los que usará la sesión, porque
+        forman parte de la clave con la que urllib3 elige el pool.
+
+        Los errores se ignoran: el pre-calentamiento es solo una optimización.
+
+        Returns:
+            int: Número de conexiones abiertas efectivamente.
+        """
+        # Se obtiene el pool igual que en send() para que la clave coincida
+        request = requests.Request("GET", url).prepare()
+        pool = self.get_connection_with_tls_context(request, verify=verify, cert=cert)
+        conns = [pool._get_conn() for _ in range(min(connections, self._pool_maxsize))]
+
+        def _connect(conn):
+            try:
+                if conn.sock is None:
+                    conn.connect()
+                return True
+            except OSError:
+                conn.close()
+                return False
+
+        with ThreadPoolExecutor(max_workers=max(len(conns), 1)) as executor:
+            opened = sum(executor.map(_connect, conns))
+
+        for conn in conns:
+            pool._put_conn(conn)
+        return opened
+
+
+def build_session(pool_size=POOL_SIZE, pool_block=False, retry_policy=default_policy,
+                  rate_limiter=default_limiter, cassette=None, health_gate=None):
+    """
+    Crea una sesión de `requests` respaldada por un PooledHTTPAdapter.
+
+    Args:
+        pool_size (int): Conexiones persistentes por host.
+        pool_block (bool): Si es True, espera a que se libere una conexión
+            en lugar de abrir una extra cuando el pool está lleno.
+        retry_policy (RetryPolicy, optional): Política de reintentos del
+            adaptador. Por defecto la política compartida del proceso.
+        rate_limiter (RateLimiter, optional): Limitador de tasa por grupo de
+            endpoints. Por defecto el limitador compartido del proceso.
+        cassette (Cassette, optional): Cassette donde grabar o de donde
+            reproducir las respuestas http/https (ver cassette.py).
+        health_gate (HealthGate, optional): Compuerta que corta las requests
+            http/https mientras la API está caída (ver health_gate.py).
+
+    Returns:
+        requests.Session: Sesión con el adaptador montado para http/https y
+        el transporte en proceso para `http+inproc://` (ver inproc_adapter.py).
+    """
+    session = requests.Session()
+    session.headers["Connection"] = "keep-alive"
+    adapter = PooledHTTPAdapter(
+        pool_size=pool_size, pool_block=pool_block, retry_policy=retry_policy, rate_limiter=rate_limiter
+    )
+    if cassette is not None and cassette.mode != "off":
+        adapter = CassetteAdapter(adapter, cassette)
+    if health_gate is not None:
+        adapter = GateAdapter(adapter, health_gate)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.mount(INPROC_SCHEME, _inproc_adapter)
+    return session
+
+
+# Transporte en proceso compartido por todas las sesiones (sin estado por sesión)
+_inproc_adapter = InProcessAdapter()
+
+_shared_session = None
+_shared_session_lock = threading.Lock()
+
+
+def get_shared_session():
+    """Devuelve la sesión con pool compartida por defecto (se crea una sola vez)."""
+    global _shared_session
+    if _shared_session is None:
+        with _shared_session_lock:
+            if _shared_session is None:
+                _shared_session = build_session()
+    return _shared_session
+
 # ======================================================
 # Clase principal del cliente de la API
 # ======================================================
@@ -64,16 +473,95 @@ SUCCESS_SCHEMA = {
 class APIClient:
     """Cliente unificado para interactuar con la API de la aerolínea con validación de esquemas"""
 
-    def __init__(self, base_url=BASE):
+    def __init__(self, base_url=None, session=None, pool_size=POOL_SIZE, prewarm=POOL_PREWARM,
+                 retry_policy=default_policy, cache=None, single_flight=default_group,
+                 rate_limiter=default_limiter, cassette=None, health_gate=None):
         """
         Inicializa el cliente API.
 
         Args:
-            base_url (str): URL base de la API. Por defecto usa la variable de entorno BASE_URL.
+            base_url (str, optional): URL base de la API. Por defecto la variable de
+                entorno BASE_URL (leída al crear el cliente) o BASE.
+            session (requests.Session, optional): Sesión a reutilizar. Si no se
+                indica, el cliente crea y administra su propio pool de conexiones.
+            pool_size (int): Conexiones persistentes por host del pool propio.
+            prewarm (int): Conexiones a abrir por adelantado hacia `base_url`.
+            retry_policy (RetryPolicy, optional): Política de reintentos del pool
+                propio. Se ignora si se pasa `session`.
+            rate_limiter (RateLimiter, optional): Limitador de tasa del pool
+                propio. Se ignora si se pasa `session`.
+            cache (ResponseCache, optional): Caché para las requests GET. Las
+                escrituras de este cliente invalidan la colección afectada.
+            single_flight (SingleFlight, optional): Grupo donde se coalescen los
+                GETs idénticos en vuelo. None lo desactiva (también API_COALESCE_GETS=0).
+            cassette (Cassette, optional): Graba o reproduce las respuestas del
+                pool propio (ver cassette.py). Se ignora si se pasa `session`.
+            health_gate (HealthGate, optional): Compuerta de salud del pool
+                propio (ver health_gate.py). Se ignora si se pasa `session`.
         """
-        self.base_url = base_url
+        self.base_url = base_url or os.getenv("BASE_URL", BASE)
         # Se puede pasar un token existente mediante la variable de entorno API_TOKEN
         self.token = os.getenv("API_TOKEN")
+        # (gestor, usuario) del token obtenido con authenticate(); se invalida ante un 401
+        self._token_source = None
+        self.cache = cache
+        self.single_flight = single_flight if COALESCE_GETS else None
+
+        self._owns_session = session is None
+        if session is None:
+            session = build_session(
+                pool_size=pool_size, retry_policy=retry_policy, rate_limiter=rate_limiter, cassette=cassette,
+                health_gate=health_gate
+            )
+        self.session = session
+        if prewarm:
+            self.prewarm(prewarm)
+
+    # --------------------------------------------------
+    # Pool de conexiones
+    # --------------------------------------------------
+    def _adapter(self):
+        """Devuelve el adaptador que atiende las requests hacia base_url (sin cassette ni compuerta)."""
+        adapter = self.session.get_adapter(self.base_url)
+        while hasattr(adapter, "inner"):
+            adapter = adapter.inner
+        return adapter
+
+    @property
+    def pool_stats(self):
+        """dict: Conexiones abiertas y reutilizadas por el pool del cliente."""
+        adapter = self._adapter()
+        if isinstance(adapter, PooledHTTPAdapter):
+            return adapter.pool_stats.snapshot()
+        return {"opened": 0, "reused": 0}
+
+    def prewarm(self, connections):
+        """
+        Abre conexiones hacia base_url antes de la primera request.
+
+        Returns:
+            int: Número de conexiones abiertas.
+        """
+        adapter = self._adapter()
+        if not isinstance(adapter, PooledHTTPAdapter):
+            return 0
+        settings = self.session.merge_environment_settings(
+            self.base_url, {}, None, self.session.verify, self.session.cert
+        )
+        return adapter.prewarm(
+            self.base_url, connections, verify=settings["verify"], cert=settings["cert"]
+        )
+
+    def close(self):
+        """Cierra el pool de conexiones si pertenece a este cliente."""
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
     # --------------------------------------------------
     # Validación de respuestas
@@ -92,14 +580,7 @@ class APIClient:
         Raises:
             Exception: Si la validación falla o la respuesta no es JSON válido.
         """
-        try:
-            data = response.json()
-            validate(instance=data, schema=schema)
-            return data
-        except jsonschema.ValidationError as e:
-            raise Exception(f"Validación de esquema falló: {e}")
-        except ValueError as e:
-            raise Exception(f"Respuesta JSON inválida: {e}")
+        return validate_json_response(response, schema)
 
     # --------------------------------------------------
     # Método genérico para requests
@@ -108,52 +589,111 @@ class APIClient:
         """
         Realiza una solicitud HTTP a la API con reintentos, manejo de token y validación opcional.
 
+        Los reintentos (backoff con jitter, Retry-After, presupuesto y circuit
+        breaker) los aplica el adaptador de la sesión según su RetryPolicy.
+
         Args:
             method (str): Método HTTP (GET, POST, PUT, DELETE).
             path (str): Ruta de la API (ej. "/flights").
             validate_schema (dict, optional): Esquema para validar la respuesta si es exitosa.
-            **kwargs: Parámetros adicionales que se pasan a requests.request().
+            **kwargs: Parámetros adicionales que se pasan a Session.request().
 
         Returns:
-            requests.Response: Objeto de respuesta HTTP.
+            APIResponse: Respuesta HTTP con `.json()` memorizado (ver api_response.py).
+
+        Raises:
+            requests.exceptions.RequestException: Si fallan todos los intentos.
+            retry_policy.CircuitOpenError: Si el circuito del endpoint está abierto.
         """
         url = f"{self.base_url}{path}"
+        endpoint = path_template(path)
+
+        # Agregar encabezado de autorización si hay token disponible. El login no
+        # lo lleva: un token viejo no tiene nada que ver con las credenciales enviadas.
+        headers = kwargs.get("headers", {})
+        token = None if endpoint.rstrip("/") == LOGIN_PATH else self.token
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+            kwargs["headers"] = headers
+
+        # Realizar la request HTTP (los reintentos los resuelve el adaptador del pool)
+        if self.single_flight is not None and method.upper() == "GET" and not kwargs.get("stream"):
+            # El grupo puede ser compartido: la sesión aporta sus propios headers y cookies
+            key = (id(self.session),) + request_key(
+                url, kwargs.get("params"), kwargs.get("headers"), kwargs.get("auth"), kwargs.get("cookies")
+            )
+            resp, shared = self.single_flight.do(
+                key, lambda: self._send_request(method, url, path, kwargs), deadline=current_deadline
+            )
+            if shared:
+                resp = share_response(resp)
+                metrics.increment("coalesced", "GET", endpoint)
+        else:
+            resp = self._send_request(method, url, path, kwargs)
 
-        for i in range(RETRIES):
-            try:
-                # Agregar encabezado de autorización si hay token disponible
-                headers = kwargs.get("headers", {})
-                if self.token:
-                    headers["Authorization"] = f"Bearer {self.token}"
-                    kwargs["headers"] = headers
-
-                # Realizar la request HTTP
-                resp = requests.request(method, url, timeout=TIMEOUT, **kwargs)
-
-                # Si es exitosa (<500) o estamos en el último intento, procesar
-                if resp.status_code < 500 or i == RETRIES - 1:
-                    # Guardar token si está en la respuesta
-                    try:
-                        data = resp.json()
-                        if "access_token" in data:
-                            self.token = data["access_token"]
-                            os.environ["API_TOKEN"] = self.token
-                    except ValueError:
-                        pass  # respuesta no es JSON válido
-
-                    # Validar contra esquema si corresponde
-                    if validate_schema and 200 <= resp.status_code < 300:
-                        self.validate_response(resp, validate_schema)
+        # Token revocado o rotado: que ningún proceso siga usándolo desde la caché
+        if resp.status_code == 401 and token and self._token_source is not None:
+            manager, username = self._token_source
+            manager.invalidate(self.base_url, username, token)
 
-                    return resp
+        # El JSON se decodifica una sola vez para token, esquema y llamador
+        resp = APIResponse(resp)
 
-            except requests.exceptions.RequestException as e:
-                # Si fue el último intento, propagar excepción
-                if i == RETRIES - 1:
-                    raise e
+        # Guardar token si está en la respuesta
+        start = time.perf_counter()
+        try:
+            data = resp.json()
+            if "access_token" in data:
+                self.token = data["access_token"]
+                os.environ["API_TOKEN"] = self.token
+        except ValueError:
+            pass  # respuesta no es JSON válido
+        metrics.observe(method.upper(), endpoint, "json_decode", time.perf_counter() - start)
+
+        # Validar contra esquema si corresponde
+        if validate_schema and 200 <= resp.status_code < 300:
+            start = time.perf_counter()
+            self.validate_response(resp, validate_schema)
+            metrics.observe(method.upper(), endpoint, "validation", time.perf_counter() - start)
+
+        return resp
+
+    def _send_request(self, method, url, path, kwargs):
+        """Envía la request, pasando por la caché de respuestas si el cliente tiene una."""
+        if self.cache is not None:
+            return self._cached_request(method, url, path, kwargs)
+        return self.session.request(method, url, timeout=TIMEOUT, **kwargs)
+
+    def _cached_request(self, method, url, path, kwargs):
+        """Resuelve la request a través de la caché de respuestas del cliente."""
+        if method.upper() != "GET":
+            resp = self.session.request(method, url, timeout=TIMEOUT, **kwargs)
+            if method.upper() in WRITE_METHODS:
+                self.cache.invalidate(path)
+            return resp
+
+        key = self.cache.key(
+            url, kwargs.get("params"), kwargs.get("headers"), kwargs.get("auth"), kwargs.get("cookies")
+        )
+        cached, etag = self.cache.lookup(key)
+        if cached is not None:
+            return cached
+
+        if etag:
+            conditional = dict(kwargs, headers=dict(kwargs.get("headers") or {}, **{"If-None-Match": etag}))
+            resp = self.session.request(method, url, timeout=TIMEOUT, **conditional)
+            if resp.status_code == 304:
+                revalidated = self.cache.revalidated(key)
+                if revalidated is not None:
+                    return revalidated
+                # La entrada se expulsó mientras tanto: el llamador no pidió un 304
+                resp.close()
+                resp = self.session.request(method, url, timeout=TIMEOUT, **kwargs)
+        else:
+            resp = self.session.request(method, url, timeout=TIMEOUT, **kwargs)
 
-            # Espera exponencial: 1s, 2s, 4s, etc.
-            time.sleep(1 << i)
+        self.cache.store(key, resp, path)
+        return resp
 
     # --------------------------------------------------
     # Método de login
@@ -174,7 +714,7 @@ class APIClient:
         """
         response = self.api_request(
             "POST",
-            "/auth/login",
+            LOGIN_PATH,
             validate_schema=LOGIN_SCHEMA,
             data={
                 "username": username,
@@ -193,6 +733,230 @@ class APIClient:
             except:
                 raise Exception(f"Login failed: {response.status_code} - {response.text}")
 
+    # --------------------------------------------------
+    # Lectura en streaming de colecciones
+    # --------------------------------------------------
+    def iter_items(self, path, schema=None, **kwargs):
+        """
+        Recorre un endpoint que devuelve un array JSON elemento por elemento.
+
+        El body se lee en trozos y se decodifica de forma incremental, así
+        que la memoria usada no depende del tamaño de la colección.
+
+        Args:
+            path (str): Ruta de la API (ej. "/bookings").
+            schema (dict | str, optional): Esquema para validar cada elemento.
+            **kwargs: Parámetros adicionales para Session.request() (ej. params).
+
+        Yields:
+            dict: Cada elemento del array.
+
+        Raises:
+            requests.exceptions.HTTPError: Si la respuesta no es 2xx.
+            Exception: Si un elemento no cumple el esquema.
+            ValueError: Si el body no es un array JSON válido.
+        """
+        url = f"{self.base_url}{path}"
+        headers = dict(kwargs.pop("headers", None) or {})
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+
+        with self.session.request("GET", url, headers=headers, timeout=TIMEOUT, stream=True, **kwargs) as resp:
+            resp.raise_for_status()
+            chunks = resp.iter_content(chunk_size=STREAM_CHUNK_SIZE)
+            for item in iter_json_array(chunks, encoding=resp.encoding or "utf-8"):
+                if schema is not None:
+                    try:
+                        validate(item, schema)
+                    except schema_registry.ValidationError as e:
+                        raise Exception(f"Validación de esquema falló: {e}")
+                yield item
+
+    # --------------------------------------------------
+    # Paginación con prefetch
+    # --------------------------------------------------
+    def paginate(self, path, page_size=PAGE_SIZE, prefetch=PAGE_PREFETCH, params=None, tuner=None):
+        """
+        Recorre un endpoint paginado con `skip`/`limit` manteniendo varias páginas en vuelo.
+
+        Mientras se entregan los elementos de una página, las `prefetch`
+        siguientes ya se están descargando. El tamaño de página se ajusta
+        según la latencia y el tamaño medidos (ver PageSizeTuner). El
+        recorrido termina en la primera página vacía.
+
+        Args:
+            path (str): Ruta de la API (ej. "/users/").
+            page_size (int): Tamaño inicial de página.
+            prefetch (int): Páginas pedidas por adelantado.
+            params (dict, optional): Filtros adicionales de la query.
+            tuner (PageSizeTuner, optional): Ajuste del tamaño de página.
+
+        Yields:
+            dict: Cada elemento de la colección, en orden.
+
+        Raises:
+            requests.exceptions.HTTPError: Si alguna página responde con error.
+        """
+        tuner = tuner or PageSizeTuner(page_size)
+        base_params = dict(params or {})
+
+        def fetch(skip, limit):
+            start = time.perf_counter()
+            resp = self.api_request("GET", path, params=dict(base_params, skip=skip, limit=limit))
+            resp.raise_for_status()
+            return resp.json(), time.perf_counter() - start, len(resp.content)
+
+        executor = ThreadPoolExecutor(max_workers=max(prefetch, 1))
+        in_flight = deque()
+        next_skip = 0
+        try:
+            while True:
+                while len(in_flight) < max(prefetch, 1):
+                    limit = tuner.page_size
+                    in_flight.append((next_skip, limit, executor.submit(fetch, next_skip, limit)))
+                    next_skip += limit
+
+                skip, limit, future = in_flight.popleft()
+                items, elapsed, size = future.result()
+                if not items:
+                    return
+                tuner.observe(len(items), elapsed, size)
+                yield from items
+
+                if len(items) < limit:
+                    # Página incompleta: puede ser el final o un tope del servidor.
+                    # Se descartan las páginas adelantadas y se sigue desde lo recibido.
+                    for _, _, pending in in_flight:
+                        pending.cancel()
+                    in_flight.clear()
+                    tuner.cap(len(items))
+                    next_skip = skip + len(items)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def authenticate(self, username, password, manager=None):
+        """
+        Obtiene un token vigente usando la caché compartida entre procesos.
+
+        Solo hace login si no hay un token guardado o si está por vencer;
+        en ese caso, un único proceso del host llama a /auth/login. Si la API
+        rechaza el token con un 401, se descarta de la caché.
+
+        Args:
+            username (str): Usuario/correo.
+            password (str): Contraseña.
+            manager (TokenManager, optional): Gestor de tokens. Por defecto el compartido.
+
+        Returns:
+            str: Token de acceso (también queda guardado en el cliente).
+        """
+        manager = manager or token_manager
+        self._token_source = (manager, username)
+        self.token = manager.get_token(
+            self.base_url, username, lambda: self.login(username, password)["access_token"]
+        )
+        return self.token
+
+    # --------------------------------------------------
+    # Requests en lote
+    # --------------------------------------------------
+    def batch(self, requests_list, max_workers=None):
+        """
+        Ejecuta varias requests en paralelo sobre el pool de conexiones del cliente.
+
+        Args:
+            requests_list (list): Tuplas (method, path, kwargs, schema). `kwargs`
+                y `schema` pueden ser None.
+            max_workers (int, optional): Requests simultáneas. Por defecto
+                min(cantidad de requests, POOL_SIZE).
+
+        Returns:
+            list[BatchResult]: Un resultado por request, en el mismo orden de entrada.
+        """
+        items = list(requests_list)
+        if not items:
+            return []
+        workers = max_workers or min(len(items), POOL_SIZE)
+
+        def _run(item):
+            method, path, kwargs, schema = item
+            kwargs = dict(kwargs or {})
+            if "headers" in kwargs:
+                kwargs["headers"] = dict(kwargs["headers"])
+
+            start = time.perf_counter()
+            try:
+                response = self.api_request(method, path, validate_schema=schema, **kwargs)
+                return BatchResult(method, path, response=response, elapsed=time.perf_counter() - start)
+            except Exception as e:
+                return BatchResult(method, path, error=e, elapsed=time.perf_counter() - start)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_run, items))
+
+
+class PageSizeTuner:
+    """
+    Ajusta el tamaño de página de APIClient.paginate() según lo medido.
+
+    Busca que cada página tarde alrededor de `target_seconds` y no supere
+    `max_bytes`; el cambio por página se limita a ×0.5–×2 para no oscilar.
+    """
+
+    def __init__(self, page_size=PAGE_SIZE, min_size=10, max_size=1000,
+                 target_seconds=0.5, max_bytes=1024 * 1024):
+        self.page_size = page_size
+        self.min_size = min_size
+        self.max_size = max_size
+        self.target_seconds = target_seconds
+        self.max_bytes = max_bytes
+
+    def observe(self, items, elapsed, size):
+        """Registra una página de `items` elementos y `size` bytes que tardó `elapsed` segundos."""
+        if items <= 0:
+            return
+        factor = min(2.0, max(0.5, self.target_seconds / max(elapsed, 1e-3)))
+        proposed = int(items * factor)
+        if size:
+            proposed = min(proposed, int(items * self.max_bytes / size))
+        self.page_size = max(self.min_size, min(self.max_size, proposed))
+
+    def cap(self, server_limit):
+        """Limita el tamaño de página al máximo que el servidor parece aceptar."""
+        if server_limit > 0:
+            self.max_size = min(self.max_size, server_limit)
+            self.min_size = min(self.min_size, self.max_size)
+            self.page_size = min(self.page_size, self.max_size)
+
+
+class BatchResult:
+    """
+    Resultado de una request ejecutada con APIClient.batch().
+
+    Attributes:
+        method (str): Método HTTP.
+        path (str): Ruta solicitada.
+        response (requests.Response | None): Respuesta, si la hubo.
+        error (Exception | None): Excepción lanzada (red, esquema, etc.).
+        elapsed (float): Duración de la request en segundos, con reintentos.
+    """
+
+    def __init__(self, method, path, response=None, error=None, elapsed=0.0):
+        self.method = method
+        self.path = path
+        self.response = response
+        self.error = error
+        self.elapsed = elapsed
+
+    @property
+    def ok(self):
+        """True si hubo respuesta y no se produjo ningún error."""
+        return self.error is None and self.response is not None
+
+    def __repr__(self):
+        outcome = self.response.status_code if self.ok else repr(self.error)
+        return f"<BatchResult {self.method} {self.path} {outcome} {self.elapsed * 1000:.1f}ms>"
+
 # ======================================================
 # Función global de conveniencia
 # ======================================================
@@ -201,6 +965,8 @@ def api_request(method, path, validate_schema=None, **kwargs):
     """
     Función global para hacer requests sin necesidad de instanciar APIClient.
 
+    Todas las llamadas comparten el pool de conexiones de get_shared_session().
+
     Args:
         method (str): Método HTTP.
         path (str): Ruta de la API.
@@ -210,5 +976,5 @@ def api_request(method, path, validate_schema=None, **kwargs):
     Returns:
         requests.Response: Objeto de respuesta.
     """
-    client = APIClient()
+    client = APIClient(base_url=BASE, session=get_shared_session())
     return client.api_request(method, path, validate_schema=validate_schema, **kwargs)
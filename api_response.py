@@ -0,0 +1,76 @@
+import requests
+
+import json_codec
+
+# ======================================================
+# Respuesta con JSON decodificado una sola vez
+# ======================================================
+# `requests.Response.json()` vuelve a decodificar el body en
+# cada llamada. APIClient lee el JSON para buscar el token,
+# lo valida contra el esquema y luego el test lo vuelve a
+# pedir: tres decodificaciones del mismo body. APIResponse
+# envuelve la respuesta y guarda el resultado de la primera.
+# ======================================================
+
+_UNSET = object()
+
+
+class APIResponse(requests.Response):
+    """
+    `requests.Response` que memoriza `.json()`.
+
+    Comparte el estado (status_code, headers, encoding, body...) con la
+    respuesta original, disponible en `.raw_response`: leer o asignar un
+    atributo en cualquiera de las dos se ve en la otra. `.json()` devuelve
+    siempre el mismo objeto: si un test lo modifica, la modificación se ve
+    en las llamadas siguientes.
+    """
+
+    # Estado propio del envoltorio; todo lo demás vive en el __dict__ compartido
+    __slots__ = ("raw_response", "_codec", "_json", "_error")
+
+    def __init__(self, response, codec=None):
+        """
+        Args:
+            response (requests.Response): Respuesta a envolver.
+            codec (object, optional): Codec JSON; por defecto json_codec.default_codec.
+        """
+        # No se llama a Response.__init__: el estado es el de `response`
+        self.__dict__ = response.__dict__
+        self.raw_response = response
+        self._codec = codec
+        self._json = _UNSET
+        self._error = None
+
+    def json(self, **kwargs):
+        """
+        Devuelve el body decodificado, decodificándolo solo la primera vez.
+
+        Args:
+            **kwargs: Opciones de `json.loads`. Si se indican, se decodifica
+                de nuevo con la librería estándar, como haría requests.
+
+        Raises:
+            requests.exceptions.JSONDecodeError: Si el body no es JSON válido.
+        """
+        if kwargs:
+            return self.raw_response.json(**kwargs)
+        if self._json is _UNSET and self._error is None:
+            self._decode()
+        if self._error is not None:
+            raise self._error
+        return self._json
+
+    def _decode(self):
+        response = self.raw_response
+        codec = self._codec or json_codec.default_codec
+        encoding = (response.encoding or "utf-8").lower().replace("_", "-")
+        body = response.content if encoding in ("utf-8", "utf8") else response.text
+        try:
+            self._json = codec.loads(body)
+        except ValueError as e:
+            self._error = requests.exceptions.JSONDecodeError(str(e), response.text, 0)
+
+    def __reduce__(self):
+        # copy/pickle: se reconstruye envolviendo la respuesta original (o su copia al deserializar)
+        return type(self), (self.raw_response, self._codec)
@@ -0,0 +1,360 @@
+import asyncio
+import os
+import socket
+import ssl
+from urllib.parse import urlsplit
+
+import h11
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from api_client import (
+    BASE,
+    COALESCE_GETS,
+    TIMEOUT,
+    POOL_SIZE,
+    LOGIN_SCHEMA,
+    ERROR_SCHEMA,
+    validate_json_response,
+)
+from api_response import APIResponse
+from endpoints import path_template
+from metrics import metrics
+from response_cache import request_key
+from retry_policy import default_policy
+from single_flight import AsyncSingleFlight, share_response
+
+# ======================================================
+# Configuración del cliente asíncrono
+# ======================================================
+
+# Máximo de requests en vuelo simultáneamente por cliente
+MAX_CONCURRENCY = int(os.getenv("API_MAX_CONCURRENCY", "100"))
+
+# Tamaño de lectura del socket (bytes)
+READ_CHUNK = 64 * 1024
+
+# ======================================================
+# Conexiones HTTP/1.1 sobre asyncio
+# ======================================================
+# Se usa `h11` (protocolo HTTP/1.1 sin I/O) sobre los streams
+# de asyncio: ninguna request bloquea un hilo y las conexiones
+# se reutilizan (keep-alive) mientras el servidor lo permita.
+# ======================================================
+
+class _AsyncConnection:
+    """Una conexión keep-alive hacia un host concreto."""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.protocol = h11.Connection(our_role=h11.CLIENT)
+
+    @property
+    def reusable(self):
+        """True si el servidor dejó la conexión lista para otra request."""
+        return (
+            self.protocol.our_state is h11.DONE
+            and self.protocol.their_state is h11.DONE
+            and not self.reader.at_eof()
+        )
+
+    async def exchange(self, method, target, headers, body):
+        """Envía una request completa y devuelve (h11.Response, bytes del body)."""
+        data = self.protocol.send(h11.Request(method=method, target=target, headers=headers))
+        if body:
+            data += self.protocol.send(h11.Data(data=body))
+        data += self.protocol.send(h11.EndOfMessage())
+        self.writer.write(data)
+        await self.writer.drain()
+
+        response = None
+        chunks = []
+        while True:
+            event = self.protocol.next_event()
+            if event is h11.NEED_DATA:
+                self.protocol.receive_data(await self.reader.read(READ_CHUNK))
+            elif isinstance(event, h11.Response):
+                response = event
+            elif isinstance(event, h11.Data):
+                chunks.append(bytes(event.data))
+            elif isinstance(event, h11.EndOfMessage):
+                return response, b"".join(chunks)
+            elif isinstance(event, h11.ConnectionClosed):
+                raise ConnectionError("El servidor cerró la conexión")
+
+    def recycle(self):
+        """Prepara la conexión para el siguiente ciclo request/response."""
+        self.protocol.start_next_cycle()
+
+    def close(self):
+        self.writer.close()
+
+
+# ======================================================
+# Cliente asíncrono de la API
+# ======================================================
+
+class AsyncAPIClient:
+    """
+    Versión asyncio de APIClient, con la misma interfaz pero con corrutinas.
+
+    - Reintentos con la misma RetryPolicy que APIClient; las esperas
+      entre intentos no bloquean el event loop.
+    - Un semáforo limita las requests en vuelo (`max_concurrency`).
+    - Cada request tiene su propio timeout (conexión + envío + respuesta).
+    - Devuelve objetos APIResponse, igual que el cliente síncrono.
+    """
+
+    def __init__(self, base_url=None, max_concurrency=MAX_CONCURRENCY, pool_size=POOL_SIZE,
+                 retry_policy=default_policy, coalesce=True):
+        """
+        Inicializa el cliente API asíncrono.
+
+        Args:
+            base_url (str, optional): URL base de la API. Por defecto la variable de
+                entorno BASE_URL (leída al crear el cliente) o BASE.
+            max_concurrency (int): Máximo de requests en vuelo simultáneamente.
+            pool_size (int): Conexiones keep-alive ociosas a conservar por host.
+            retry_policy (RetryPolicy): Política de reintentos, presupuesto y circuit breaker.
+            coalesce (bool): Agrupar los GETs idénticos en vuelo en una sola request.
+        """
+        self.base_url = base_url or os.getenv("BASE_URL", BASE)
+        # Se puede pasar un token existente mediante la variable de entorno API_TOKEN
+        self.token = os.getenv("API_TOKEN")
+        self.max_concurrency = max_concurrency
+        self.pool_size = pool_size
+        self.retry_policy = retry_policy
+        self.single_flight = AsyncSingleFlight() if coalesce and COALESCE_GETS else None
+        self._semaphore = None
+        self._idle = {}
+
+    # --------------------------------------------------
+    # Pool de conexiones
+    # --------------------------------------------------
+    def _limiter(self):
+        # Se crea dentro del event loop (Python 3.9 lo asocia al loop actual)
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def _acquire_connection(self, scheme, host, port):
+        idle = self._idle.get((scheme, host, port), [])
+        while idle:
+            conn = idle.pop()
+            if not conn.reader.at_eof():
+                return conn
+            conn.close()
+
+        ssl_context = ssl.create_default_context() if scheme == "https" else None
+        reader, writer = await asyncio.open_connection(
+            host, port, ssl=ssl_context, server_hostname=host if ssl_context else None
+        )
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return _AsyncConnection(reader, writer)
+
+    def _release_connection(self, key, conn):
+        idle = self._idle.setdefault(key, [])
+        if conn.reusable and len(idle) < self.pool_size:
+            conn.recycle()
+            idle.append(conn)
+        else:
+            conn.close()
+
+    async def _send(self, prepared):
+        """Envía un PreparedRequest por una conexión del pool."""
+        parts = urlsplit(prepared.url)
+        scheme = parts.scheme
+        host = parts.hostname
+        port = parts.port or (443 if scheme == "https" else 80)
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+
+        body = prepared.body or b""
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+
+        headers = [("Host", parts.netloc), ("Accept", "*/*"), ("Connection", "keep-alive")]
+        headers += [(k, v) for k, v in prepared.headers.items() if k.lower() != "host"]
+        if body and "Content-Length" not in prepared.headers:
+            headers.append(("Content-Length", str(len(body))))
+
+        key = (scheme, host, port)
+        conn = await self._acquire_connection(scheme, host, port)
+        try:
+            event, content = await conn.exchange(prepared.method, target, headers, body)
+        except BaseException:
+            conn.close()
+            raise
+        self._release_connection(key, conn)
+
+        resp = requests.Response()
+        resp.status_code = event.status_code
+        resp.reason = event.reason.decode("latin-1")
+        resp.headers = CaseInsensitiveDict(
+            (k.decode("latin-1"), v.decode("latin-1")) for k, v in event.headers
+        )
+        resp.encoding = get_encoding_from_headers(resp.headers)
+        resp._content = content
+        resp.url = prepared.url
+        resp.request = prepared
+        return resp
+
+    async def aclose(self):
+        """Cierra todas las conexiones ociosas del pool."""
+        for conns in self._idle.values():
+            for conn in conns:
+                conn.close()
+        self._idle.clear()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    # --------------------------------------------------
+    # Validación de respuestas
+    # --------------------------------------------------
+    def validate_response(self, response, schema):
+        """
+        Valida que la respuesta JSON cumpla con el esquema esperado.
+
+        Args:
+            response (requests.Response): Respuesta de la API.
+            schema (dict): Esquema JSON Schema contra el cual validar.
+
+        Returns:
+            dict: Respuesta JSON validada.
+
+        Raises:
+            Exception: Si la validación falla o la respuesta no es JSON válido.
+        """
+        return validate_json_response(response, schema)
+
+    # --------------------------------------------------
+    # Método genérico para requests
+    # --------------------------------------------------
+    async def api_request(self, method, path, validate_schema=None, timeout=TIMEOUT, **kwargs):
+        """
+        Realiza una solicitud HTTP a la API con reintentos, manejo de token y validación opcional.
+
+        Args:
+            method (str): Método HTTP (GET, POST, PUT, DELETE).
+            path (str): Ruta de la API (ej. "/flights").
+            validate_schema (dict, optional): Esquema para validar la respuesta si es exitosa.
+            timeout (float): Tiempo máximo por intento (en segundos).
+            **kwargs: Parámetros de requests.Request (params, json, data, headers).
+
+        Returns:
+            APIResponse: Respuesta HTTP con `.json()` memorizado.
+
+        Raises:
+            requests.exceptions.Timeout: Si el último intento excede el timeout.
+            requests.exceptions.ConnectionError: Si el último intento falla a nivel de red.
+            retry_policy.CircuitOpenError: Si el circuito del endpoint está abierto.
+        """
+        url = f"{self.base_url}{path}"
+
+        # Agregar encabezado de autorización si hay token disponible
+        headers = dict(kwargs.pop("headers", None) or {})
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        prepared = requests.Request(method, url, headers=headers, **kwargs).prepare()
+
+        if self.single_flight is not None and method.upper() == "GET":
+            key = request_key(url, kwargs.get("params"), headers, kwargs.get("auth"), kwargs.get("cookies"))
+            resp, shared = await self.single_flight.do(
+                key, lambda: self._send_with_retries(method, url, prepared, timeout)
+            )
+            if shared:
+                resp = share_response(resp)
+                metrics.increment("coalesced", "GET", path_template(path))
+        else:
+            resp = await self._send_with_retries(method, url, prepared, timeout)
+
+        resp = APIResponse(resp)
+
+        # Guardar token si está en la respuesta
+        try:
+            data = resp.json()
+            if "access_token" in data:
+                self.token = data["access_token"]
+                os.environ["API_TOKEN"] = self.token
+        except ValueError:
+            pass  # respuesta no es JSON válido
+
+        # Validar contra esquema si corresponde
+        if validate_schema and 200 <= resp.status_code < 300:
+            self.validate_response(resp, validate_schema)
+
+        return resp
+
+    async def _send_with_retries(self, method, url, prepared, timeout):
+        """Envía la request preparada aplicando la RetryPolicy del cliente."""
+        state = self.retry_policy.start(method, url)
+        while True:
+            try:
+                # Solo se ocupa un lugar del semáforo mientras la request está en vuelo
+                async with self._limiter():
+                    resp = await asyncio.wait_for(self._send(prepared), timeout)
+            except asyncio.TimeoutError as e:
+                error = requests.exceptions.Timeout(f"Timeout tras {timeout}s: {url}")
+                error.__cause__ = e
+            except (OSError, h11.ProtocolError) as e:
+                error = requests.exceptions.ConnectionError(f"Error de conexión: {e}")
+                error.__cause__ = e
+            else:
+                delay = state.on_response(resp)
+                if delay is None:
+                    return resp
+                await asyncio.sleep(delay)
+                continue
+
+            delay = state.on_error(error)
+            if delay is None:
+                raise error
+            # Espera sin bloquear el event loop
+            await asyncio.sleep(delay)
+
+    # --------------------------------------------------
+    # Método de login
+    # --------------------------------------------------
+    async def login(self, username, password):
+        """
+        Realiza login en la API y guarda el token en el cliente.
+
+        Args:
+            username (str): Usuario/correo.
+            password (str): Contraseña.
+
+        Returns:
+            dict: Respuesta JSON con el token de acceso.
+
+        Raises:
+            Exception: Si el login falla o la respuesta no cumple esquema.
+        """
+        response = await self.api_request(
+            "POST",
+            "/auth/login",
+            validate_schema=LOGIN_SCHEMA,
+            data={
+                "username": username,
+                "password": password,
+            },
+            headers={"Content-Type": "application/x-www-form-urlencoded"}
+        )
+
+        if response.status_code == 200:
+            return response.json()
+        else:
+            # Validar como error si corresponde
+            try:
+                error_data = self.validate_response(response, ERROR_SCHEMA)
+                raise Exception(f"Login failed: {response.status_code} - {error_data}")
+            except:
+                raise Exception(f"Login failed: {response.status_code} - {response.text}")
@@ -0,0 +1,350 @@
+import io
+import json
+import os
+import tempfile
+import threading
+import zlib
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+
+from endpoints import path_template
+from inproc_adapter import build_response
+from token_cache import file_lock
+
+# ======================================================
+# Grabación y reproducción de respuestas (cassette)
+# ======================================================
+# En modo "record" cada request que pasa por la sesión se
+# envía a la API y el par request/respuesta queda guardado;
+# en modo "replay" la respuesta sale del cassette sin tocar
+# la red. Así la suite completa corre offline en cada commit
+# y contra la API real solo en la corrida programada.
+#
+# Las requests se normalizan antes de guardarlas:
+#   - Sin Authorization ni Cookie.
+#   - IDs de la ruta como plantilla ("/users/{id}", ver
+#     endpoints.py) y del cuerpo solo los nombres de campo,
+#     porque los tests usan datos aleatorios.
+#
+# Las respuestas JSON se guardan sin sus tokens
+# (`access_token`, `refresh_token`...), porque el cassette
+# se versiona junto con el código.
+#
+# Almacenamiento (carpeta API_CASSETTE_DIR):
+#   responses.bin  registros comprimidos con zlib, uno tras otro
+#   index.json     clave → test → [[offset, largo], ...]
+#
+# Durante la grabación cada proceso escribe en un archivo
+# temporal propio; al guardar, responses.bin se reescribe
+# solo con las respuestas vigentes del índice, así regrabar
+# un test no deja registros huérfanos.
+#
+# El índice se carga una vez y cada respuesta se lee con un
+# seek directo: la búsqueda es O(1) por clave. Una misma
+# clave puede repetirse dentro de un test; las respuestas se
+# reproducen en el orden en que se grabaron.
+# ======================================================
+
+# off | record | replay
+CASSETTE_MODE = os.getenv("API_CASSETTE", "off")
+CASSETTE_DIR = os.getenv(
+    "API_CASSETTE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "cassettes")
+)
+
+MODES = ("off", "record", "replay")
+
+# Headers que no se guardan: credenciales y los que dependen de la transmisión
+REDACTED_HEADERS = {"authorization", "cookie", "proxy-authorization"}
+DROPPED_RESPONSE_HEADERS = {"content-encoding", "transfer-encoding", "content-length", "set-cookie"}
+
+# Campos de los cuerpos JSON de respuesta cuyo valor se reemplaza por REDACTED
+REDACTED_FIELDS = {"access_token", "refresh_token", "id_token"}
+REDACTED = "REDACTED"
+
+
+class CassetteMissError(requests.exceptions.ConnectionError):
+    """La request no está grabada en el cassette (modo replay)."""
+
+
+def _body_shape(request):
+    """Nombres de campo del cuerpo (JSON o formulario), sin sus valores."""
+    body = request.body
+    if not body:
+        return ""
+    if isinstance(body, bytes):
+        body = body.decode("utf-8", "replace")
+    elif not isinstance(body, str):
+        return "<stream>"
+    content_type = request.headers.get("Content-Type", "")
+    try:
+        if "json" in content_type:
+            data = json.loads(body)
+            fields = sorted(data) if isinstance(data, dict) else [f"[{len(data)}]"]
+        else:
+            fields = sorted({name for name, _ in parse_qsl(body, keep_blank_values=True)})
+    except ValueError:
+        return "<raw>"
+    return "{" + ",".join(fields) + "}"
+
+
+def _scrub(data):
+    """Copia de `data` con los campos de REDACTED_FIELDS reemplazados (a cualquier profundidad)."""
+    if isinstance(data, dict):
+        return {
+            name: REDACTED if name in REDACTED_FIELDS else _scrub(value) for name, value in data.items()
+        }
+    if isinstance(data, list):
+        return [_scrub(item) for item in data]
+    return data
+
+
+def _redacted_body(response):
+    """Cuerpo de la respuesta sin tokens si es JSON; si no, tal cual."""
+    body = response.content
+    if "json" not in response.headers.get("Content-Type", "") or not body:
+        return body
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return body
+    scrubbed = _scrub(data)
+    return body if scrubbed == data else json.dumps(scrubbed).encode("utf-8")
+
+
+def cassette_key(request):
+    """
+    Clave normalizada de una request.
+
+    Args:
+        request (PreparedRequest): Request a normalizar.
+
+    Returns:
+        str: Método, plantilla de la ruta, query ordenada y campos del cuerpo
+        (ej. "POST /users/{id}/roles?x=1 {name,role}").
+    """
+    parts = urlsplit(request.url)
+    key = f"{request.method} {path_template(parts.path)}"
+    if parts.query:
+        key += "?" + "&".join(sorted(parts.query.split("&")))
+    shape = _body_shape(request)
+    if shape:
+        key += " " + shape
+    return key
+
+
+class Cassette:
+    """Almacén indexado y comprimido de pares request/respuesta."""
+
+    def __init__(self, directory=CASSETTE_DIR, mode=CASSETTE_MODE):
+        """
+        Args:
+            directory (str): Carpeta del cassette (se crea al grabar).
+            mode (str): "off", "record" o "replay".
+
+        Raises:
+            ValueError: Si el modo no es válido.
+        """
+        if mode not in MODES:
+            raise ValueError(f"Modo de cassette inválido: {mode!r} (usar {', '.join(MODES)})")
+        self.directory = directory
+        self.mode = mode
+        # Test en curso (nodeid); lo fija la fixture autouse de conftest.py
+        self.scope = ""
+        self.data_path = os.path.join(directory, "responses.bin")
+        self.index_path = os.path.join(directory, "index.json")
+        self._lock = threading.Lock()
+        self._index = self._load_index() if mode != "off" else {}
+        self._cursors = {}
+        self._fresh = set()  # (clave, test) regrabados en esta corrida
+        self._saved = set()  # (clave, test) de _fresh que ya están en responses.bin
+        self._pending = {}   # (clave, test) → [[offset, largo], ...] en el archivo temporal
+        self._pending_file = None
+        self._pending_path = None
+        self._reader = None
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, encoding="utf-8") as fh:
+                return json.load(fh)["entries"]
+        except (OSError, ValueError, KeyError):
+            return {}
+
+    def __len__(self):
+        saved = sum(len(spans) for scopes in self._index.values() for spans in scopes.values())
+        return saved + sum(len(spans) for spans in self._pending.values())
+
+    # --------------------------------------------------
+    # Grabación
+    # --------------------------------------------------
+    def record(self, request, response):
+        """Guarda la respuesta (ya leída) de `request` bajo su clave y el test en curso."""
+        key = cassette_key(request)
+        url = urlsplit(request.url)
+        meta = {
+            "request": {
+                "key": key,
+                "method": request.method,
+                "path": path_template(url.path),
+                "headers": {
+                    name: value for name, value in request.headers.items()
+                    if name.lower() not in REDACTED_HEADERS
+                },
+            },
+            "status": response.status_code,
+            "headers": {
+                name: value for name, value in response.headers.items()
+                if name.lower() not in DROPPED_RESPONSE_HEADERS
+            },
+        }
+        blob = zlib.compress(json.dumps(meta).encode("utf-8") + b"\n" + _redacted_body(response))
+
+        with self._lock:
+            if self._pending_file is None:
+                os.makedirs(self.directory, exist_ok=True)
+                fd, self._pending_path = tempfile.mkstemp(dir=self.directory, prefix=".responses-", suffix=".tmp")
+                self._pending_file = os.fdopen(fd, "w+b")
+            offset = self._pending_file.seek(0, os.SEEK_END)
+            self._pending_file.write(blob)
+            if (key, self.scope) not in self._fresh:
+                # Primera vez en esta corrida: reemplaza lo grabado antes
+                self._fresh.add((key, self.scope))
+                self._index.setdefault(key, {})[self.scope] = []
+            self._pending.setdefault((key, self.scope), []).append([offset, len(blob)])
+
+    def save(self):
+        """
+        Escribe el índice, combinándolo con lo grabado por otros procesos.
+
+        responses.bin se reescribe con las respuestas vigentes del índice
+        combinado más las pendientes de este proceso; las reemplazadas se
+        descartan.
+        """
+        if self.mode != "record" or not self._pending:
+            return
+        with self._lock, file_lock(self.index_path):
+            merged = self._load_index()
+            # Cada span se marca con su origen: responses.bin (False) o el temporal (True)
+            sources = {
+                key: {scope: [(False, span) for span in spans] for scope, spans in scopes.items()}
+                for key, scopes in merged.items()
+            }
+            for key, scope in self._fresh:
+                previous = sources.get(key, {}).get(scope, []) if (key, scope) in self._saved else []
+                pending = [(True, span) for span in self._pending.get((key, scope), [])]
+                sources.setdefault(key, {})[scope] = previous + pending
+
+            self._pending_file.flush()
+            entries = {}
+            data_tmp = f"{self.data_path}.tmp"
+            with open(data_tmp, "wb") as out, self._open_data() as current:
+                for key, scopes in sources.items():
+                    for scope, spans in scopes.items():
+                        rewritten = entries.setdefault(key, {})[scope] = []
+                        for pending, (offset, length) in spans:
+                            source = self._pending_file if pending else current
+                            source.seek(offset)
+                            rewritten.append([out.tell(), length])
+                            out.write(source.read(length))
+            os.replace(data_tmp, self.data_path)
+
+            tmp_path = f"{self.index_path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as fh:
+                json.dump({"version": 1, "entries": entries}, fh, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.index_path)
+            self._index = entries
+
+            self._saved |= set(self._pending)
+            self._pending = {}
+            self._discard_pending_file()
+
+    def _open_data(self):
+        try:
+            return open(self.data_path, "rb")
+        except FileNotFoundError:
+            return io.BytesIO()
+
+    def _discard_pending_file(self):
+        if self._pending_file is not None:
+            self._pending_file.close()
+            self._pending_file = None
+            os.unlink(self._pending_path)
+
+    # --------------------------------------------------
+    # Reproducción
+    # --------------------------------------------------
+    def play(self, request):
+        """
+        Devuelve la respuesta grabada para `request`.
+
+        Se busca primero en el test en curso y, si no está (ej. el login de
+        una fixture de sesión), en cualquier otro test.
+
+        Returns:
+            tuple: (status, headers, body).
+
+        Raises:
+            CassetteMissError: Si la request no fue grabada.
+        """
+        key = cassette_key(request)
+        scopes = self._index.get(key)
+        if not scopes:
+            raise CassetteMissError(f"Request no grabada en el cassette: {key}", request=request)
+        scope = self.scope if self.scope in scopes else next(iter(scopes))
+        spans = scopes[scope]
+
+        with self._lock:
+            position = self._cursors.get((key, scope), 0)
+            self._cursors[(key, scope)] = position + 1
+            offset, length = spans[min(position, len(spans) - 1)]  # la última se repite
+            if self._reader is None:
+                self._reader = open(self.data_path, "rb")
+            self._reader.seek(offset)
+            blob = self._reader.read(length)
+
+        meta, _, body = zlib.decompress(blob).partition(b"\n")
+        meta = json.loads(meta)
+        return meta["status"], meta["headers"], body
+
+    def set_scope(self, scope):
+        """Cambia el test en curso y reinicia el orden de reproducción."""
+        self.scope = scope
+        self._cursors.clear()
+
+    def close(self):
+        self.save()
+        with self._lock:
+            self._discard_pending_file()
+            if self._reader is not None:
+                self._reader.close()
+                self._reader = None
+
+
+class CassetteAdapter(BaseAdapter):
+    """Adaptador que graba o reproduce las respuestas del adaptador interno."""
+
+    def __init__(self, inner, cassette):
+        """
+        Args:
+            inner (BaseAdapter): Adaptador real (ej. PooledHTTPAdapter).
+            cassette (Cassette): Cassette donde grabar o de donde reproducir.
+        """
+        super().__init__()
+        self.inner = inner
+        self.cassette = cassette
+
+    def send(self, request, **kwargs):
+        if self.cassette.mode == "replay":
+            status, headers, body = self.cassette.play(request)
+            return build_response(self, request, status, headers, body)
+
+        response = self.inner.send(request, **kwargs)
+        if self.cassette.mode == "record":
+            # Lee el cuerpo completo; iter_content() sigue funcionando después
+            response.content
+            self.cassette.record(request, response)
+        return response
+
+    def close(self):
+        self.inner.close()
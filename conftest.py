@@ -1,13 +1,7 @@
 import os
-import random
-import string
 import requests
 import pytest
-import faker
 import sys
-from dotenv import load_dotenv
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 
 # ======================================================
 # Configuración de imports y path
@@ -18,10 +12,22 @@ from urllib3.util.retry import Retry
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 # Importar cliente API y esquemas de validación
-from api_client import APIClient, LOGIN_SCHEMA, ERROR_SCHEMA, SUCCESS_SCHEMA
+from api_client import APIClient, LOGIN_SCHEMA, ERROR_SCHEMA, SUCCESS_SCHEMA, build_session
+from retry_policy import RetryPolicy, default_policy
+from rate_limiter import default_limiter
+from token_cache import token_manager
+from metrics import metrics
+from cassette import CASSETTE_MODE, Cassette
+from entity_factory import EntityCreationError, EntityFactory
+from resource_ledger import LEDGER_CHECKPOINT, ledger
+from allocator import allocator
+from warmup import WARMUP_ENABLED, api_warmup
+from health_gate import api_gate
+from deadline import current_deadline
+from utils.settings import load_env
 
 # Cargar variables de entorno desde archivo .env
-load_dotenv()
+load_env()
 
 # ======================================================
 # Configuración base de la API
@@ -30,36 +36,112 @@ load_dotenv()
 BASE_URL = os.getenv("BASE_URL", "https://cf-automation-airline-api.onrender.com")
 AUTH_LOGIN = "/auth/login/"
 AIRPORT = "/airports/"
-fake = faker.Faker()
 
 # Configuración de timeouts y reintentos
 REQUEST_TIMEOUT = 15       # Tiempo máximo por request
-MAX_RETRIES = 3            # Número máximo de reintentos
-BACKOFF_FACTOR = 0.5       # Espera exponencial entre intentos
+MAX_RETRIES = 3            # Número máximo de intentos por request
+BACKOFF_FACTOR = 0.5       # Espera base entre intentos (con jitter)
+
+# ======================================================
+# Datos falsos (Faker)
+# ======================================================
+# Faker tarda en importarse y en cargar sus proveedores, así
+# que se crea recién cuando una fixture lo pide por primera
+# vez. `pytest --collect-only` no llega a cargarlo.
+# ======================================================
+
+_fake = None
+
+
+def get_fake():
+    """Devuelve la instancia compartida de Faker, creándola la primera vez."""
+    global _fake
+    if _fake is None:
+        import faker
+        _fake = faker.Faker()
+    return _fake
+
+
+@pytest.fixture(scope="session")
+def fake():
+    """Generador de datos falsos (Faker) compartido por la sesión."""
+    return get_fake()
 
 # ======================================================
 # FIXTURES DE SESIÓN Y CONFIGURACIÓN
 # ======================================================
 
 @pytest.fixture(scope="session")
-def session_with_retries():
+def cassette():
+    """
+    Cassette de la sesión según API_CASSETTE (off | record | replay).
+
+    - record: la suite corre contra la API y guarda cada respuesta.
+    - replay: las respuestas salen de API_CASSETTE_DIR, sin red.
+    """
+    cassette = Cassette()
+    yield cassette
+    cassette.close()
+
+
+@pytest.fixture(autouse=True)
+def _cassette_scope(request, cassette):
+    """Asocia las requests grabadas/reproducidas al test en curso."""
+    cassette.set_scope(request.node.nodeid)
+    yield
+    cassette.set_scope("")
+
+
+@pytest.fixture(scope="session")
+def session_with_retries(cassette):
     """
     Crea una sesión HTTP persistente con soporte para reintentos automáticos.
 
-    - Reintenta en errores como 429, 500, 502, 503, 504.
-    - Usa un backoff exponencial para evitar saturar el servidor.
+    - Reintenta en errores como 429, 500, 502, 503, 504 y fallos de red.
+    - Usa backoff exponencial con jitter y respeta `Retry-After`.
+    - Comparte el presupuesto de reintentos con APIClient, para que los
+      reintentos no se multipliquen cuando el servidor está saturado.
+    - Un circuit breaker por endpoint falla rápido si la API está caída.
+    - Comparte con APIClient el limitador de tasa adaptativo, que espacia
+      las requests para no provocar 429 (ver rate_limiter.py).
+    - Con API_CASSETTE=record|replay graba o reproduce las respuestas.
+    - Cada entidad creada con un POST queda en el registro de recursos y se
+      borra al final de la sesión (ver resource_ledger.py).
+    - Si la API acumula fallos seguidos, la compuerta de salud corta las
+      requests siguientes sin esperar timeouts (ver health_gate.py).
+    - Cuando la API despierta, abre conexiones del pool y hace el login del
+      administrador en segundo plano (ver warmup.py).
+    - Un 401 con el token de administrador guardado lo descarta de la caché
+      compartida, y el próximo `auth_headers` hace login de nuevo.
     """
-    session = requests.Session()
-    retry_strategy = Retry(
-        total=MAX_RETRIES,
-        backoff_factor=BACKOFF_FACTOR,
-        status_forcelist=[429, 500, 502, 503, 504],
-        allowed_methods=["HEAD", "GET", "OPTIONS", "POST", "PUT", "DELETE", "PATCH"]
+    retry_policy = RetryPolicy(
+        max_attempts=MAX_RETRIES,
+        base_delay=BACKOFF_FACTOR,
+        budget=default_policy.budget
     )
-    adapter = HTTPAdapter(max_retries=retry_strategy)
-    session.mount("http://", adapter)
-    session.mount("https://", adapter)
-    return session
+    session = build_session(
+        retry_policy=retry_policy, rate_limiter=default_limiter, cassette=cassette, health_gate=_gate(cassette)
+    )
+    session.hooks["response"].append(_invalidate_rejected_token)
+    api_warmup.attach(session)
+    api_warmup.on_ready(lambda: _fetch_admin_token(session))
+    return ledger.track(session)
+
+
+def _gate(cassette):
+    """Compuerta de salud para las sesiones de la suite (no aplica al reproducir un cassette)."""
+    return None if cassette.mode == "replay" else api_gate
+
+
+# Fixtures que implican requests a la API; sin ellas un test no depende de su salud
+NETWORK_FIXTURES = frozenset(["session_with_retries", "api_client", "admin_token", "entities"])
+
+
+@pytest.fixture(autouse=True)
+def _health_gate(request):
+    """Con la API caída (compuerta abierta), marca xfail de inmediato los tests que la usan."""
+    if api_gate.is_open and NETWORK_FIXTURES.intersection(request.fixturenames):
+        pytest.xfail(f"API no disponible: {api_gate.cause}")
 
 
 @pytest.fixture(scope="session")
@@ -67,143 +149,304 @@ def base_url():
     """Devuelve la URL base de la API."""
     return BASE_URL
 
+# ======================================================
+# API LOCAL EN MEMORIA (standin_api.py)
+# ======================================================
+# Con API_STANDIN=1 la suite corre contra una implementación
+# en memoria de la API, levantada en un puerto libre, en vez
+# de la API remota. API_STANDIN_LATENCY (segundos) y
+# API_STANDIN_ERROR_RATE (0-1) inyectan demoras y errores 503.
+# Con API_STANDIN=inproc la app se invoca dentro del proceso,
+# sin sockets, vía `http+inproc://airline` (inproc_adapter.py).
+# ======================================================
+
+def _standin_app():
+    from standin_api import AirlineAPI
+
+    return AirlineAPI(
+        latency=float(os.getenv("API_STANDIN_LATENCY", "0")),
+        error_rate=float(os.getenv("API_STANDIN_ERROR_RATE", "0")),
+    )
+
 
 @pytest.fixture(scope="session")
-def admin_token(session_with_retries) -> str:
-    """
-    Realiza login como administrador y devuelve un token válido.
+def standin_server():
+    """Levanta la API en memoria en un puerto libre durante la sesión."""
+    from standin_api import StandInServer
 
-    - Usa credenciales desde variables de entorno ADMIN_USER y ADMIN_PASS.
-    - Si falla, corta la ejecución de pytest.
-    """
-    user = os.getenv("ADMIN_USER", "admin@demo.com")
-    pwd = os.getenv("ADMIN_PASS", "admin123")
+    with StandInServer(_standin_app()) as server:
+        yield server
 
+
+@pytest.fixture(scope="session")
+def standin_inproc():
+    """Registra la API en memoria como app en proceso y devuelve su URL base."""
+    from inproc_adapter import register_app, unregister_app
+
+    yield register_app("airline", _standin_app())
+    unregister_app("airline")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _standin_base_url(request):
+    """Si API_STANDIN=1|inproc, apunta BASE_URL (y los APIClient nuevos) a la API en memoria."""
+    global BASE_URL
+    mode = os.getenv("API_STANDIN", "0")
+    if mode == "inproc":
+        url = request.getfixturevalue("standin_inproc")
+    elif mode == "1":
+        url = request.getfixturevalue("standin_server").url
+    else:
+        yield
+        return
+
+    previous_url, previous_env = BASE_URL, os.environ.get("BASE_URL")
+    BASE_URL = os.environ["BASE_URL"] = url
+    yield
+    BASE_URL = previous_url
+    if previous_env is None:
+        os.environ.pop("BASE_URL", None)
+    else:
+        os.environ["BASE_URL"] = previous_env
+
+
+def _login_admin(session, user, pwd):
+    """Hace login como administrador y devuelve el access_token."""
     url = BASE_URL + AUTH_LOGIN
     print(f"[conftest] Intentando login en: {url}")
 
+    r = session.post(
+        url,
+        data={
+            "grant_type": "",
+            "username": user,
+            "password": pwd,
+            "scope": "",
+            "client_id": "",
+            "client_secret": ""
+        },
+        headers={
+            "accept": "application/json",
+            "Content-Type": "application/x-www-form-urlencoded"
+        },
+        timeout=REQUEST_TIMEOUT
+    )
+    r.raise_for_status()
     try:
-        r = session_with_retries.post(
-            url,
-            data={
-                "grant_type": "",
-                "username": user,
-                "password": pwd,
-                "scope": "",
-                "client_id": "",
-                "client_secret": ""
-            },
-            headers={
-                "accept": "application/json",
-                "Content-Type": "application/x-www-form-urlencoded"
-            },
-            timeout=REQUEST_TIMEOUT
-        )
-        r.raise_for_status()
-        return r.json().get("access_token")
+        return r.json()["access_token"]
+    except (KeyError, ValueError):
+        raise KeyError(r.text)
+
+
+def _wait_for_api():
+    """Espera a que la API despierte (ver warmup.py); si no responde, corta pytest."""
+    if not api_warmup.wait():
+        pytest.exit(f"❌ {api_warmup.error}")
+
+
+def _fetch_admin_token(session):
+    """Token de administrador desde la caché compartida (hace login si hace falta)."""
+    user = os.getenv("ADMIN_USER", "admin@demo.com")
+    pwd = os.getenv("ADMIN_PASS", "admin123")
+    return token_manager.get_token(BASE_URL, user, lambda: _login_admin(session, user, pwd))
+
+
+def _invalidate_rejected_token(response, *args, **kwargs):
+    """Hook de respuesta: un 401 con el token de la caché lo descarta para todos los procesos."""
+    authorization = response.request.headers.get("Authorization", "")
+    if response.status_code == 401 and authorization.startswith("Bearer "):
+        user = os.getenv("ADMIN_USER", "admin@demo.com")
+        token_manager.invalidate(BASE_URL, user, authorization[len("Bearer "):])
+
+
+def _get_admin_token(session):
+    """
+    Devuelve un token de administrador vigente desde la caché compartida.
+
+    Todos los workers/procesos del host comparten un único login; el token
+    se renueva automáticamente poco antes de su vencimiento.
+    """
+    _wait_for_api()
+    try:
+        return _fetch_admin_token(session)
     except requests.exceptions.RequestException as e:
         pytest.exit(f"❌ Error conectando a la API: {str(e)}")
-    except KeyError:
-        pytest.exit(f"❌ Error: respuesta de login inválida → {r.text}")
+    except KeyError as e:
+        pytest.exit(f"❌ Error: respuesta de login inválida → {e}")
+
+
+@pytest.fixture(scope="session")
+def admin_token(session_with_retries) -> str:
+    """
+    Realiza login como administrador y devuelve un token válido.
+
+    - Usa credenciales desde variables de entorno ADMIN_USER y ADMIN_PASS.
+    - Reutiliza el token de la caché compartida entre procesos (token_cache.py).
+    - Si falla, corta la ejecución de pytest.
+    """
+    return _get_admin_token(session_with_retries)
 
 
 @pytest.fixture
-def auth_headers(admin_token):
-    """Devuelve headers de autenticación con Bearer token."""
-    return {"Authorization": f"Bearer {admin_token}"}
+def auth_headers(admin_token, session_with_retries):
+    """Devuelve headers de autenticación con Bearer token (renovado si está por vencer)."""
+    return {"Authorization": f"Bearer {_get_admin_token(session_with_retries)}"}
 
 # ======================================================
 # FIXTURES DE RECURSOS TEMPORALES
 # ======================================================
+# Las entidades de prueba salen de una fábrica de sesión
+# (entity_factory.py): las cadenas aerolínea → vuelo →
+# reserva se crean una vez y se comparten entre los tests
+# que solo las leen; los que las modifican reciben una
+# entidad mutable propia, de un pool creado en paralelo.
+# ======================================================
 
-@pytest.fixture
-def airport(auth_headers, session_with_retries):
+def _existing_iata_codes(session):
+    """Códigos IATA que ya existen en el servidor (siembra del asignador)."""
+    client = APIClient(base_url=BASE_URL, session=session, single_flight=None)
+    client.token = _get_admin_token(session)
+    try:
+        return [airport["iata_code"] for airport in client.paginate("/airports/", page_size=100)]
+    except (requests.exceptions.RequestException, KeyError, TypeError):
+        return []  # sin siembra, las colisiones se reintentan al crear
+
+
+def _existing_ids_and_emails(session):
+    """IDs de aerolíneas y emails de usuarios que ya existen (siembra de la etiqueta de corrida)."""
+    client = APIClient(base_url=BASE_URL, session=session, single_flight=None)
+    client.token = _get_admin_token(session)
+    values = []
+    for path, field in (("/airlines/", "id"), ("/users/", "email")):
+        try:
+            values.extend(str(item[field]) for item in client.paginate(path, page_size=100))
+        except (requests.exceptions.RequestException, KeyError, TypeError):
+            pass  # sin siembra, las colisiones se reintentan al crear
+    return values
+
+
+@pytest.fixture(scope="session")
+def entities(session_with_retries, admin_token):
     """
-    Crea un aeropuerto temporal para pruebas y lo elimina al finalizar.
+    Fábrica de entidades de prueba compartida por la sesión.
 
-    - Usa un código IATA aleatorio.
-    - Si no se puede crear, el test se salta.
+    Los códigos IATA, IDs y emails salen del asignador del worker
+    (allocator.py), sembrado con los aeropuertos, aerolíneas y usuarios
+    que ya existen.
     """
-    airport_data = {
-        "iata_code": "".join(random.choices(string.ascii_uppercase, k=3)),
-        "city": "La Paz",
-        "country": fake.country()  # País aleatorio
-    }
+    allocator.set_seed(lambda: _existing_iata_codes(session_with_retries))
+    allocator.set_tag_seed(lambda: _existing_ids_and_emails(session_with_retries))
+    factory = EntityFactory(
+        session_with_retries,
+        BASE_URL,
+        headers=lambda: {"Authorization": f"Bearer {_get_admin_token(session_with_retries)}"},
+        timeout=REQUEST_TIMEOUT,
+        ledger=ledger,
+    )
+    yield factory
+    factory.close()
 
+
+def _entity(get, kind, **overrides):
+    """Pide una entidad a la fábrica; si la API no la crea, el test se salta."""
     try:
-        r = session_with_retries.post(
-            BASE_URL + AIRPORT,
-            json=airport_data,
-            headers=auth_headers,
-            timeout=REQUEST_TIMEOUT
-        )
-        if r.status_code == 400:
-            pytest.skip(f"No se pudo crear aeropuerto de prueba: {r.text}")
-        r.raise_for_status()
-        airport_response = r.json()
+        return get(kind, **overrides)
+    except EntityCreationError as e:
+        pytest.skip(f"No se pudo crear {kind} de prueba: {e.response.text}")
+    except requests.exceptions.RequestException as e:
+        pytest.skip(f"Error al crear {kind} de prueba: {e}")
 
-        yield airport_response  # Se entrega al test
 
-    finally:
-        # Cleanup: eliminar aeropuerto al finalizar test
-        try:
-            session_with_retries.delete(
-                BASE_URL + AIRPORT + f'{airport_data["iata_code"]}',
-                headers=auth_headers,
-                timeout=REQUEST_TIMEOUT
-            )
-        except requests.exceptions.RequestException:
-            pass
+@pytest.fixture
+def shared_airline(entities):
+    """Aerolínea compartida (solo lectura)."""
+    return _entity(entities.shared, "airline")
 
 
 @pytest.fixture
-def test_user(base_url, auth_headers, session_with_retries):
+def shared_flight(entities):
+    """Vuelo JFK → LAX compartido, con su aerolínea (solo lectura)."""
+    return _entity(entities.shared, "flight")
+
+
+@pytest.fixture
+def shared_booking(entities):
+    """Reserva confirmada compartida (solo lectura)."""
+    return _entity(entities.shared, "booking")
+
+
+@pytest.fixture
+def shared_airport(entities):
+    """Aeropuerto compartido (solo lectura)."""
+    return _entity(entities.shared, "airport")
+
+
+@pytest.fixture
+def booking(entities):
+    """Reserva confirmada propia del test (se puede cancelar)."""
+    return _entity(entities.lease, "booking")
+
+
+@pytest.fixture
+def airport(entities):
+    """
+    Entrega un aeropuerto propio del test (se puede modificar o borrar).
+
+    - Sale del pool de la fábrica (código IATA aleatorio).
+    - Se elimina junto con el resto de los recursos al final de la sesión.
+    - Si no se puede crear, el test se salta.
     """
-    Crea un usuario de prueba temporal y lo elimina al finalizar.
+    return _entity(entities.lease, "airport")
+
+
+@pytest.fixture
+def test_user(entities):
+    """
+    Entrega un usuario de prueba propio del test.
 
     - Genera un email aleatorio.
+    - Se elimina junto con el resto de los recursos al final de la sesión.
     - Si no se puede crear, se salta el test.
     """
-    user_data = {
-        "email": f"test.{random.randint(1000,9999)}@demo.com",
-        "password": "Test12345",
-        "full_name": "Test User",
-        "role": "passenger"
-    }
-
-    r = session_with_retries.post(
-        f"{base_url}/users/",
-        json=user_data,
-        headers=auth_headers,
-        timeout=REQUEST_TIMEOUT
-    )
+    return _entity(entities.lease, "user")
 
-    if r.status_code == 400:
-        pytest.skip(f"No se pudo crear usuario de prueba: {r.text}")
 
-    r.raise_for_status()
-    user_response = r.json()
+def _flush_ledger(session, checkpoint=False):
+    """Borra los recursos registrados; el token solo se pide si hay algo que borrar."""
+    if not len(ledger):
+        return
+    headers = lambda: {"Authorization": f"Bearer {_get_admin_token(session)}"}
+    if checkpoint:
+        ledger.checkpoint(session, headers, timeout=REQUEST_TIMEOUT)
+    else:
+        ledger.flush(session, headers, timeout=REQUEST_TIMEOUT)
 
-    yield user_response  # Se entrega al test
 
-    # Cleanup: eliminar usuario
-    try:
-        session_with_retries.delete(
-            f"{base_url}/users/{user_response['id']}",
-            headers=auth_headers,
-            timeout=REQUEST_TIMEOUT
-        )
-    except requests.exceptions.RequestException:
-        pass
+@pytest.fixture(scope="session", autouse=True)
+def _resource_cleanup(_standin_base_url, session_with_retries):
+    """Al terminar la sesión borra en paralelo todo lo que creó la suite (con la misma BASE_URL)."""
+    yield
+    _flush_ledger(session_with_retries)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _resource_checkpoint(_resource_cleanup, session_with_retries):
+    """Con API_LEDGER_CHECKPOINT=module, limpia también al terminar cada módulo."""
+    yield
+    if LEDGER_CHECKPOINT == "module":
+        _flush_ledger(session_with_retries, checkpoint=True)
 
 # ======================================================
 # FIXTURES DE CLIENTE API
 # ======================================================
 
 @pytest.fixture
-def api_client():
+def api_client(cassette):
     """Devuelve una instancia del cliente API sin autenticación."""
-    return APIClient(base_url=BASE_URL)
+    _wait_for_api()
+    client = APIClient(base_url=BASE_URL, cassette=cassette, health_gate=_gate(cassette))
+    ledger.track(client.session)
+    return client
 
 
 @pytest.fixture
@@ -237,13 +480,114 @@ def success_schema():
 # CONFIGURACIÓN GLOBAL DE PYTEST
 # ======================================================
 
+def pytest_addoption(parser):
+    """Registra las opciones de pytest.ini propias de la suite."""
+    parser.addini(
+        "api_test_budget",
+        "Presupuesto de tiempo por test en segundos (0 = sin límite); ver deadline.py",
+        default="60",
+    )
+
+
 def pytest_configure(config):
     """
     Configuración inicial de pytest.
 
     - Define valores por defecto de variables de entorno
       si no están definidas.
+    - Empieza a despertar la API en segundo plano mientras se recolectan
+      los tests (salvo con API_WARMUP=0, la API en memoria o un cassette
+      en modo replay).
     """
     os.environ.setdefault("BASE_URL", "https://cf-automation-airline-api.onrender.com")
     os.environ.setdefault("API_RETRIES", "3")
     os.environ.setdefault("API_TIMEOUT", "5")
+    config.addinivalue_line("markers", "budget(seconds): presupuesto de tiempo del test (ver deadline.py)")
+
+    offline = os.getenv("API_STANDIN", "0") != "0" or CASSETTE_MODE == "replay"
+    if WARMUP_ENABLED and not offline:
+        api_warmup.start(BASE_URL)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """
+    Exporta las métricas de tiempos de las requests al terminar la sesión.
+
+    Si API_METRICS_DIR está definida se escriben `api_metrics.prom`
+    (formato Prometheus) y `api_metrics.json` en esa carpeta.
+    """
+    metrics_dir = os.getenv("API_METRICS_DIR")
+    if metrics_dir:
+        metrics.write_prometheus(os.path.join(metrics_dir, "api_metrics.prom"))
+        metrics.write_json(os.path.join(metrics_dir, "api_metrics.json"))
+
+
+# ======================================================
+# PRESUPUESTO DE TIEMPO POR TEST (deadline.py)
+# ======================================================
+# El presupuesto cubre el setup y la llamada del test; las
+# fixtures de sesión/módulo (login, warmup) no descuentan.
+# Los tests que lo superan se listan al final de la corrida.
+# ======================================================
+
+_budget_overruns = []
+
+
+def _test_budget(item):
+    """Presupuesto del test: @pytest.mark.budget, API_TEST_BUDGET o el ini api_test_budget."""
+    marker = item.get_closest_marker("budget")
+    if marker is not None:
+        return float(marker.args[0])
+    return float(os.getenv("API_TEST_BUDGET") or item.config.getini("api_test_budget") or 0)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_setup(item):
+    current_deadline.start(_test_budget(item))
+    yield
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    if fixturedef.scope == "function":
+        yield
+        return
+    with current_deadline.suspended():
+        yield
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    budget = current_deadline.budget
+    if call.when != "call" or budget is None:
+        return
+    elapsed = current_deadline.elapsed
+    if elapsed >= budget:
+        _budget_overruns.append((item.nodeid, elapsed, budget))
+        outcome.get_result().sections.append(
+            ("presupuesto", f"El test tardó {elapsed:.1f}s con un presupuesto de {budget:g}s")
+        )
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_teardown(item):
+    current_deadline.clear()
+    yield
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Informa las caídas de la API, los tests fuera de presupuesto y los recursos sin borrar."""
+    if _budget_overruns:
+        terminalreporter.section("tests fuera de presupuesto")
+        for nodeid, elapsed, budget in _budget_overruns:
+            terminalreporter.write_line(f"{nodeid}: {elapsed:.1f}s (presupuesto {budget:g}s)")
+    if api_gate.trips:
+        terminalreporter.section("API no disponible")
+        terminalreporter.write_line(f"Aperturas de la compuerta de salud: {api_gate.trips}. Última causa:")
+        terminalreporter.write_line(api_gate.cause)
+    if not ledger.failures:
+        return
+    terminalreporter.section("recursos sin borrar")
+    for kind, url, reason in ledger.failures:
+        terminalreporter.write_line(f"{kind}: {url} → {reason}")
@@ -0,0 +1,114 @@
+import time
+from contextlib import contextmanager
+
+import requests
+
+# ======================================================
+# Presupuesto de tiempo por test (deadline)
+# ======================================================
+# Los timeouts fijos de los tests (5, 10, 15 s) se sumaban a
+# los reintentos y su backoff: un solo test podía colgarse
+# más de un minuto. Ahora cada test tiene un presupuesto
+# (ini `api_test_budget`, API_TEST_BUDGET o el marcador
+# @pytest.mark.budget(segundos)) y conftest.py marca su
+# vencimiento en `current_deadline` al empezar el setup.
+#
+# El adaptador HTTP de las sesiones (PooledHTTPAdapter):
+#
+#   - recorta el timeout de cada intento a lo que queda;
+#   - no reintenta si la espera no entra en lo que queda;
+#   - con el presupuesto agotado lanza DeadlineExceeded sin
+#     tocar la red.
+#
+# Es un único vencimiento por proceso (cada worker de xdist
+# corre un test a la vez), así que también lo respetan los
+# hilos que el test lanza (fábrica de entidades, paginación).
+# ======================================================
+
+
+class DeadlineExceeded(requests.exceptions.Timeout):
+    """Se lanza cuando el test agotó su presupuesto de tiempo."""
+
+
+class Deadline:
+    """Vencimiento del test en curso (None = sin límite)."""
+
+    def __init__(self):
+        self.budget = None
+        self.started = None
+        self._expires = None
+
+    def start(self, budget):
+        """
+        Empieza a contar el presupuesto del test.
+
+        Args:
+            budget (float): Segundos disponibles; 0 o None desactiva el límite.
+        """
+        self.started = time.monotonic()
+        self.budget = budget or None
+        self._expires = self.started + budget if budget else None
+
+    def clear(self):
+        self.budget = self.started = self._expires = None
+
+    @property
+    def elapsed(self):
+        """float: Segundos desde start() (0 si no hay test en curso)."""
+        return time.monotonic() - self.started if self.started is not None else 0.0
+
+    def remaining(self):
+        """Segundos que quedan, o None si no hay límite."""
+        if self._expires is None:
+            return None
+        return self._expires - time.monotonic()
+
+    @property
+    def expired(self):
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+    def allows(self, delay):
+        """True si todavía entra una espera de `delay` segundos (y algo de trabajo después)."""
+        remaining = self.remaining()
+        return remaining is None or delay < remaining
+
+    def cap_timeout(self, timeout):
+        """
+        Recorta un timeout de requests (número o tupla connect/read) a lo que queda.
+
+        Raises:
+            DeadlineExceeded: Si el presupuesto ya se agotó.
+        """
+        remaining = self.remaining()
+        if remaining is None:
+            return timeout
+        if remaining <= 0:
+            raise self.error()
+        if timeout is None:
+            return remaining
+        if isinstance(timeout, tuple):
+            return tuple(remaining if part is None else min(part, remaining) for part in timeout)
+        return min(timeout, remaining)
+
+    def error(self, detail=""):
+        message = f"Presupuesto del test agotado ({self.budget:g}s)"
+        return DeadlineExceeded(f"{message}: {detail}" if detail else message)
+
+    @contextmanager
+    def suspended(self):
+        """No descuenta del presupuesto el tiempo dentro del bloque (ej. fixtures de sesión)."""
+        expires, paused = self._expires, time.monotonic()
+        self._expires = None
+        try:
+            yield
+        finally:
+            pause = time.monotonic() - paused
+            if self.started is not None:
+                self.started += pause
+            if expires is not None:
+                self._expires = expires + pause
+
+
+# Vencimiento compartido por el proceso (ver conftest.py)
+current_deadline = Deadline()
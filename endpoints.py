@@ -0,0 +1,34 @@
+from urllib.parse import urlsplit
+
+# ======================================================
+# Plantillas de endpoints
+# ======================================================
+# Agrupa las rutas concretas de la API por endpoint, por
+# ejemplo "/bookings/Ab12Cd34" → "/bookings/{id}". Se usa
+# para llevar estado por endpoint (circuit breaker, métricas)
+# sin crear una entrada por cada ID.
+# ======================================================
+
+# Segmentos fijos de las rutas de la API; cualquier otro se considera un ID
+STATIC_SEGMENTS = {
+    "auth", "login", "signup", "health",
+    "users", "airports", "airlines", "flights", "bookings",
+}
+
+
+def path_template(path):
+    """
+    Devuelve la plantilla de una ruta o URL, sin query string.
+
+    Args:
+        path (str): Ruta ("/flights/FL1?x=1") o URL completa.
+
+    Returns:
+        str: Plantilla de la ruta (ej. "/flights/{id}").
+    """
+    path = urlsplit(path).path or "/"
+    segments = [
+        segment if not segment or segment in STATIC_SEGMENTS else "{id}"
+        for segment in path.split("/")
+    ]
+    return "/".join(segments) or "/"
@@ -0,0 +1,266 @@
+import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from allocator import allocator
+from single_flight import SingleFlight
+
+# ======================================================
+# Fábrica de entidades de prueba
+# ======================================================
+# Casi todos los tests de vuelos, reservas y búsqueda crean
+# primero una aerolínea y un vuelo antes de hacer su trabajo.
+# La fábrica arma esas cadenas (aerolínea → vuelo → reserva)
+# una sola vez por sesión y las reparte:
+#
+#   shared(kind)   entidad compartida, memoizada; para tests
+#                  que solo la leen (no modificarla).
+#   lease(kind)    entidad mutable, exclusiva del test; sale
+#                  de un pool creado en lote con prefill().
+#   mutable(kind)  entidad mutable nueva, creada en el momento.
+#
+# Los padres de cualquier entidad son siempre compartidos, y
+# warm()/prefill() crean en paralelo las entidades que no
+# dependen entre sí. IDs, códigos IATA y emails salen del
+# asignador del worker (allocator.py).
+# ======================================================
+
+# Hilos para crear entidades en paralelo
+ENTITY_WORKERS = int(os.getenv("API_ENTITY_WORKERS", "8"))
+
+
+class EntitySpec:
+    """Cómo crear un tipo de entidad: ruta, cuerpo, padres y campo identificador."""
+
+    def __init__(self, path, payload, parents=None, id_field="id", retry_on=None):
+        """
+        Args:
+            path (str): Colección donde se hace el POST (ej. "/flights").
+            payload (callable): `payload()` → dict con el cuerpo por defecto.
+            parents (dict, optional): Campo del cuerpo → tipo de la entidad padre
+                cuyo ID se usa (ej. {"airline_id": "airline"}).
+            id_field (str): Campo que identifica a la entidad creada.
+            retry_on (str, optional): Texto de un 400 que indica colisión del
+                identificador generado; se reintenta con otro cuerpo.
+        """
+        self.path = path
+        self.payload = payload
+        self.parents = parents or {}
+        self.id_field = id_field
+        self.retry_on = retry_on
+
+
+SPECS = {
+    "airline": EntitySpec(
+        "/airlines",
+        lambda: {"id": allocator.id(), "name": "Test Airline", "country": "USA"},
+        retry_on="exists",
+    ),
+    "flight": EntitySpec(
+        "/flights",
+        lambda: {
+            "name": "SKY123", "from": "JFK", "to": "LAX", "departure": "08:00", "arrival": "11:30",
+            "duration": 3.5, "stops": 0, "price": 299.99,
+        },
+        parents={"airline_id": "airline"},
+    ),
+    "booking": EntitySpec(
+        "/bookings",
+        lambda: {
+            "passenger_name": "John", "passenger_email": "john@email.com", "seat": "15A", "class": "economy",
+        },
+        parents={"flight_id": "flight"},
+    ),
+    "airport": EntitySpec(
+        "/airports",
+        lambda: {"iata_code": allocator.iata(), "city": "Test City", "country": "Test Country"},
+        id_field="iata_code",
+        retry_on="exists",
+    ),
+    "user": EntitySpec(
+        "/users/",
+        lambda: {
+            "email": allocator.email(), "password": "Test12345",
+            "full_name": "Test User", "role": "passenger",
+        },
+        retry_on="exists",
+    ),
+}
+
+
+class EntityCreationError(Exception):
+    """La API no creó la entidad pedida."""
+
+    def __init__(self, kind, response):
+        super().__init__(f"No se pudo crear {kind}: {response.status_code} {response.text}")
+        self.kind = kind
+        self.response = response
+
+
+class Entity(dict):
+    """Entidad creada por la fábrica: el JSON de la API más su tipo y si es compartida."""
+
+    def __init__(self, kind, data, shared):
+        super().__init__(data)
+        self.kind = kind
+        self.shared = shared
+
+    @property
+    def mutable(self):
+        return not self.shared
+
+
+class EntityFactory:
+    """Crea y reparte entidades de prueba sobre una sesión HTTP."""
+
+    def __init__(self, session, base_url, headers=None, specs=SPECS, timeout=10, max_workers=ENTITY_WORKERS,
+                 max_attempts=3, ledger=None):
+        """
+        Args:
+            session (requests.Session): Sesión con la que se crean las entidades.
+            base_url (str): URL base de la API.
+            headers (callable, optional): Devuelve los headers (ej. Authorization)
+                para cada request; se llama cada vez para usar el token vigente.
+            specs (dict): Tipo → EntitySpec.
+            timeout (float): Timeout de cada request.
+            max_workers (int): Hilos para crear entidades en paralelo.
+            max_attempts (int): Intentos ante colisiones de identificador.
+            ledger (ResourceLedger, optional): Registro de recursos donde fijar
+                las entidades compartidas hasta el final de la sesión.
+        """
+        self.session = session
+        self.base_url = base_url.rstrip("/")
+        self.headers = headers or dict
+        self.specs = specs
+        self.timeout = timeout
+        self.max_attempts = max_attempts
+        self.ledger = ledger
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="entities")
+        self._flight = SingleFlight()
+        self._lock = threading.Lock()
+        self._shared = {}
+        self._pools = {}
+        self.created = 0
+        self.reused = 0
+
+    # --------------------------------------------------
+    # Entrega
+    # --------------------------------------------------
+    def shared(self, kind, **overrides):
+        """
+        Devuelve la entidad compartida de `kind` (con esos `overrides`), creándola
+        la primera vez. Las llamadas concurrentes con la misma clave hacen un solo POST.
+
+        Returns:
+            Entity: Entidad marcada como compartida; los tests no deben modificarla.
+
+        Raises:
+            EntityCreationError: Si la API rechaza la creación.
+        """
+        key = (kind, tuple(sorted(overrides.items())))
+        with self._lock:
+            entity = self._shared.get(key)
+            if entity is not None:
+                self.reused += 1
+                return entity
+
+        def create():
+            with self._lock:
+                if key in self._shared:
+                    return self._shared[key]
+            entity = self._create(kind, overrides, shared=True)
+            if self.ledger is not None:
+                self.ledger.pin(self.url(kind, entity))
+            with self._lock:
+                self._shared[key] = entity
+            return entity
+
+        entity, _ = self._flight.do(key, create)
+        return entity
+
+    def mutable(self, kind, **overrides):
+        """Crea una entidad nueva, exclusiva del llamador (sus padres son compartidos)."""
+        return self._create(kind, overrides, shared=False)
+
+    def lease(self, kind, **overrides):
+        """
+        Entrega una entidad mutable del pool de `kind`, o la crea si el pool está vacío.
+        La entidad no vuelve al pool: el test puede modificarla o borrarla.
+        """
+        pool = self._pool(kind, overrides)
+        with self._lock:
+            if pool:
+                self.reused += 1
+                return pool.popleft()
+        return self.mutable(kind, **overrides)
+
+    # --------------------------------------------------
+    # Creación anticipada (en paralelo)
+    # --------------------------------------------------
+    def warm(self, *kinds):
+        """Crea en paralelo las entidades compartidas de `kinds` (y sus padres)."""
+        return list(self._executor.map(self.shared, kinds))
+
+    def prefill(self, kind, count, **overrides):
+        """Crea en paralelo `count` entidades mutables para lease()."""
+        if count <= 0:
+            return
+        # Los padres primero, para que los hilos no compitan por crearlos
+        for parent in self.specs[kind].parents.values():
+            self.shared(parent)
+        futures = [self._executor.submit(self.mutable, kind, **overrides) for _ in range(count)]
+        entities = [future.result() for future in futures]
+        pool = self._pool(kind, overrides)
+        with self._lock:
+            pool.extend(entities)
+
+    def _pool(self, kind, overrides):
+        key = (kind, tuple(sorted(overrides.items())))
+        with self._lock:
+            return self._pools.setdefault(key, deque())
+
+    def pooled(self):
+        """list: Entidades creadas por prefill() que nunca se entregaron."""
+        with self._lock:
+            return [entity for pool in self._pools.values() for entity in pool]
+
+    def stats(self):
+        with self._lock:
+            return {"created": self.created, "reused": self.reused, "shared": len(self._shared)}
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+    # --------------------------------------------------
+    # POST
+    # --------------------------------------------------
+    def url(self, kind, entity=None):
+        """URL de la colección de `kind` o, si se pasa `entity`, de esa entidad."""
+        spec = self.specs[kind]
+        url = self.base_url + spec.path
+        if entity is not None:
+            url = url.rstrip("/") + f"/{entity[spec.id_field]}"
+        return url
+
+    def _create(self, kind, overrides, shared):
+        spec = self.specs[kind]
+        parents = {
+            field: self.shared(parent)[self.specs[parent].id_field]
+            for field, parent in spec.parents.items() if field not in overrides
+        }
+        for attempt in range(1, self.max_attempts + 1):
+            data = dict(spec.payload(), **parents, **overrides)
+            response = self.session.post(
+                self.url(kind), json=data, headers=self.headers(), timeout=self.timeout
+            )
+            if response.status_code in (200, 201):
+                break
+            retryable = spec.retry_on and response.status_code == 400 and spec.retry_on in response.text
+            if not retryable or attempt == self.max_attempts:
+                raise EntityCreationError(kind, response)
+
+        body = response.json()
+        with self._lock:
+            self.created += 1
+        return Entity(kind, body if isinstance(body, dict) else data, shared)
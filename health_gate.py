@@ -0,0 +1,172 @@
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+
+from deadline import DeadlineExceeded
+from retry_policy import CircuitOpenError
+
+# ======================================================
+# Compuerta de salud de la API (fail-fast de la sesión)
+# ======================================================
+# Si la API se cae, cada test pasaba por sus propios
+# reintentos y timeouts antes de marcarse xfail: una corrida
+# rota tardaba minutos en informar algo. La compuerta cuenta
+# los resultados finales (después de los reintentos) de las
+# requests de las sesiones que la usan:
+#
+#   - GATE_THRESHOLD fallos seguidos (error de red/timeout o
+#     respuesta 502/503/504) la abren. Un 500 es un error de
+#     un endpoint, no de la API entera, y no se cuenta; tampoco
+#     los CircuitOpenError, que ni siquiera tocan la red. Desde ese momento las requests
+#     fallan sin tocar la red con APIUnavailableError y los
+#     tests que usan la API se marcan xfail con la causa.
+#   - Un hilo en segundo plano consulta /health cada
+#     GATE_PROBE_INTERVAL segundos y la cierra cuando la API
+#     vuelve a responder (también la cierra cualquier
+#     respuesta < 500 que llegue mientras tanto).
+#
+# A diferencia del circuit breaker de retry_policy.py (por
+# endpoint y por unos segundos), la compuerta es una sola
+# para toda la API y la sesión de pytest.
+# ======================================================
+
+# Resultados fallidos seguidos que abren la compuerta
+GATE_THRESHOLD = int(os.getenv("API_GATE_THRESHOLD", "5"))
+
+# Segundos entre consultas de salud mientras está abierta
+GATE_PROBE_INTERVAL = float(os.getenv("API_GATE_PROBE_INTERVAL", "5"))
+
+# Ruta consultada para saber si la API responde
+HEALTH_PATH = os.getenv("API_HEALTH_PATH", "/health")
+
+# Respuestas que indican que la API entera (o su proxy) no está disponible
+GATE_STATUSES = frozenset([502, 503, 504])
+
+
+class APIUnavailableError(requests.exceptions.ConnectionError):
+    """Se lanza sin tocar la red mientras la compuerta de salud está abierta."""
+
+
+class HealthGate:
+    """Compuerta compartida: se abre tras varios fallos seguidos y se cierra al recuperarse la API."""
+
+    def __init__(self, threshold=GATE_THRESHOLD, probe_interval=GATE_PROBE_INTERVAL, health_path=HEALTH_PATH):
+        """
+        Args:
+            threshold (int): Fallos seguidos que abren la compuerta.
+            probe_interval (float): Segundos entre consultas de salud con la
+                compuerta abierta.
+            health_path (str): Ruta consultada para saber si la API se recuperó.
+        """
+        self.threshold = threshold
+        self.probe_interval = probe_interval
+        self.health_path = health_path
+        self.failures = 0
+        self.cause = None
+        self.trips = 0
+        self._open = False
+        self._lock = threading.Lock()
+        self._probe = None
+
+    @property
+    def is_open(self):
+        """bool: True si la API se considera caída."""
+        return self._open
+
+    def check(self):
+        """
+        Raises:
+            APIUnavailableError: Si la compuerta está abierta (con la causa).
+        """
+        if self._open:
+            raise APIUnavailableError(f"API no disponible: {self.cause}")
+
+    # --------------------------------------------------
+    # Resultados de las requests
+    # --------------------------------------------------
+    def record_response(self, request, response):
+        if response.status_code in GATE_STATUSES:
+            reason = f"HTTP {response.status_code} en {request.method} {request.path_url}: {response.text[:200]}"
+            self.record_failure(request.url, reason)
+        elif response.status_code < 500:
+            self.record_success()
+
+    def record_error(self, request, error):
+        reason = f"{type(error).__name__} en {request.method} {request.path_url}: {error}"
+        self.record_failure(request.url, reason)
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self._open = False
+
+    def record_failure(self, url, reason):
+        """Anota un fallo; al llegar al umbral abre la compuerta y lanza la consulta de salud."""
+        with self._lock:
+            self.failures += 1
+            if self._open or self.failures < self.threshold:
+                return
+            self._open = True
+            self.trips += 1
+            self.cause = f"{reason} ({self.failures} fallos seguidos)"
+            parts = urlsplit(url)
+            health_url = f"{parts.scheme}://{parts.netloc}{self.health_path}"
+            if self._probe is None or not self._probe.is_alive():
+                self._probe = threading.Thread(
+                    target=self._run_probe, args=(health_url,), name="api-health-gate", daemon=True
+                )
+                self._probe.start()
+
+    # --------------------------------------------------
+    # Consulta de salud en segundo plano
+    # --------------------------------------------------
+    def _run_probe(self, health_url):
+        session = requests.Session()
+        try:
+            while self._open:
+                time.sleep(self.probe_interval)
+                try:
+                    response = session.get(health_url, timeout=max(self.probe_interval, 1.0))
+                except requests.exceptions.RequestException:
+                    continue
+                if response.status_code < 500:
+                    self.record_success()
+        finally:
+            session.close()
+
+
+class GateAdapter(BaseAdapter):
+    """Adaptador que falla rápido con la compuerta abierta y le informa cada resultado."""
+
+    def __init__(self, inner, gate):
+        """
+        Args:
+            inner (BaseAdapter): Adaptador real (ej. PooledHTTPAdapter).
+            gate (HealthGate): Compuerta que decide y registra.
+        """
+        super().__init__()
+        self.inner = inner
+        self.gate = gate
+
+    def send(self, request, **kwargs):
+        self.gate.check()
+        try:
+            response = self.inner.send(request, **kwargs)
+        except (DeadlineExceeded, CircuitOpenError):
+            raise  # presupuesto agotado o circuito abierto: no dicen nada de la salud de la API
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            self.gate.record_error(request, e)
+            raise
+        self.gate.record_response(request, response)
+        return response
+
+    def close(self):
+        self.inner.close()
+
+
+# Compuerta compartida por la sesión de pytest (ver conftest.py)
+api_gate = HealthGate()
@@ -0,0 +1,112 @@
+"""
+Benchmark del tiempo de import (arranque de pytest y de los scripts).
+
+Ejecuta `python -X importtime -c "import <módulo>"` varias veces en
+procesos nuevos, toma la mediana del tiempo acumulado de cada módulo y
+falla si supera el presupuesto o si se cargó alguna dependencia que debe
+importarse de forma diferida (faker, jsonschema).
+
+Uso:
+    python import_benchmark.py                      # conftest y api_client
+    python import_benchmark.py master --budget-ms 300 --top 15
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+# ======================================================
+# Configuración
+# ======================================================
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Presupuesto por módulo (mediana, en milisegundos)
+IMPORT_BUDGET_MS = float(os.getenv("API_IMPORT_BUDGET_MS", "400"))
+
+# Módulos medidos por defecto: lo que importa pytest al arrancar y el cliente
+DEFAULT_MODULES = ("conftest", "api_client")
+
+# Dependencias pesadas que solo deben cargarse cuando se usan
+LAZY_MODULES = ("faker", "jsonschema")
+
+
+def _run(code, importtime=False):
+    command = [sys.executable]
+    if importtime:
+        command += ["-X", "importtime"]
+    command += ["-c", code]
+    result = subprocess.run(command, cwd=ROOT, capture_output=True, text=True, check=True)
+    return result
+
+
+def parse_importtime(output):
+    """
+    Interpreta la salida de `-X importtime`.
+
+    Returns:
+        dict: módulo → (self_us, cumulative_us). Para módulos importados
+        más de una vez en la salida se conserva la primera aparición.
+    """
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times.setdefault(name.strip(), (int(self_us), int(cumulative_us)))
+    return times
+
+
+def measure(module, runs=5):
+    """
+    Mide el tiempo acumulado de importar `module` en un proceso nuevo.
+
+    Args:
+        module (str): Módulo a importar (relativo a la raíz del proyecto).
+        runs (int): Repeticiones; se informa la mediana.
+
+    Returns:
+        tuple: (mediana_ms, tabla de la última corrida según parse_importtime()).
+    """
+    samples = []
+    table = {}
+    for _ in range(runs):
+        table = parse_importtime(_run(f"import {module}", importtime=True).stderr)
+        samples.append(table[module][1] / 1000)
+    return statistics.median(samples), table
+
+
+def eager_modules(module, lazy=LAZY_MODULES):
+    """list: Módulos de `lazy` que quedan cargados tras importar `module`."""
+    code = f"import sys, {module}; print(' '.join(sorted(sys.modules)))"
+    loaded = set(_run(code).stdout.split())
+    return [name for name in lazy if name in loaded]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("modules", nargs="*", default=list(DEFAULT_MODULES))
+    parser.add_argument("--budget-ms", type=float, default=IMPORT_BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="imports más costosos a listar")
+    args = parser.parse_args(argv)
+
+    failed = False
+    for module in args.modules:
+        median_ms, table = measure(module, args.runs)
+        eager = eager_modules(module)
+        ok = median_ms <= args.budget_ms and not eager
+        failed |= not ok
+        print(f"{module}: {median_ms:.1f} ms (presupuesto {args.budget_ms:.0f} ms) {'OK' if ok else 'FALLA'}")
+        if eager:
+            print(f"  importados antes de tiempo: {', '.join(eager)}")
+        slowest = sorted(table.items(), key=lambda item: item[1][0], reverse=True)[:args.top]
+        for name, (self_us, _) in slowest:
+            print(f"  {self_us / 1000:8.1f} ms  {name}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
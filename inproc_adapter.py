@@ -0,0 +1,247 @@
+import asyncio
+import concurrent.futures
+import inspect
+import threading
+from http import HTTPStatus
+from io import BytesIO
+from urllib.parse import unquote, urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+# ======================================================
+# Transporte en proceso (sin sockets)
+# ======================================================
+# Adaptador de `requests` que entrega cada request
+# directamente a una aplicación WSGI o ASGI registrada, sin
+# abrir sockets ni serializar HTTP. Sirve para medir el
+# costo propio del cliente y para tests unitarios rápidos:
+#
+#   base_url = register_app("airline", AirlineAPI())
+#   APIClient(base_url=base_url)   # "http+inproc://airline"
+#
+# Se usa el esquema `http+inproc://` (y no `inproc://`)
+# porque `requests` solo codifica `params` en la URL de los
+# esquemas que empiezan con "http". build_session() monta
+# este adaptador en todas las sesiones del cliente.
+#
+# Los reintentos, el rate limit y las métricas de red viven
+# en PooledHTTPAdapter y no aplican aquí. El timeout solo se
+# respeta con apps ASGI (las WSGI corren en el hilo que llama).
+# ======================================================
+
+INPROC_SCHEME = "http+inproc://"
+
+# Aplicaciones registradas por nombre de host
+_apps = {}
+_apps_lock = threading.Lock()
+
+# Loop de eventos para las apps ASGI, en un hilo daemon propio.
+# Es uno por proceso: Session.close() cierra los adaptadores
+# montados y este loop puede estar atendiendo a otra sesión.
+_loop = None
+_loop_lock = threading.Lock()
+
+
+def register_app(name, app):
+    """
+    Registra una aplicación WSGI o ASGI bajo un nombre de host.
+
+    Args:
+        name (str): Host con que se la invoca (ej. "airline").
+        app (callable): Aplicación WSGI `app(environ, start_response)` o
+            ASGI `async app(scope, receive, send)`.
+
+    Returns:
+        str: URL base para APIClient (ej. "http+inproc://airline").
+    """
+    with _apps_lock:
+        _apps[name.lower()] = app
+    return f"{INPROC_SCHEME}{name.lower()}"
+
+
+def unregister_app(name):
+    with _apps_lock:
+        _apps.pop(name.lower(), None)
+
+
+def is_asgi(app):
+    """bool: True si `app` es una aplicación ASGI (corrutina de 3 argumentos)."""
+    call = app if inspect.isfunction(app) or inspect.ismethod(app) else getattr(app, "__call__", None)
+    return inspect.iscoroutinefunction(call)
+
+
+class InProcessAdapter(BaseAdapter):
+    """Adaptador que resuelve las requests `http+inproc://<host>` con la app registrada."""
+
+    def __init__(self, apps=None):
+        """
+        Args:
+            apps (dict, optional): host → app. Por defecto el registro global
+                de register_app().
+        """
+        super().__init__()
+        self.apps = _apps if apps is None else apps
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        parts = urlsplit(request.url)
+        app = self.apps.get((parts.hostname or "").lower())
+        if app is None:
+            raise requests.exceptions.ConnectionError(
+                f"No hay aplicación en proceso registrada para '{parts.hostname}'", request=request
+            )
+
+        body = request.body or b""
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        elif not isinstance(body, bytes):
+            body = b"".join(body)  # body iterable (generador)
+
+        if is_asgi(app):
+            status, headers, payload = self._call_asgi(app, request, parts, body, timeout)
+        else:
+            status, headers, payload = self._call_wsgi(app, request, parts, body)
+        return build_response(self, request, status, headers, payload)
+
+    def close(self):
+        # Sin conexiones que liberar; el loop ASGI es del proceso
+        pass
+
+    # --------------------------------------------------
+    # WSGI
+    # --------------------------------------------------
+    @staticmethod
+    def _call_wsgi(app, request, parts, body):
+        environ = {
+            "REQUEST_METHOD": request.method,
+            "PATH_INFO": unquote(parts.path or "/"),
+            "QUERY_STRING": parts.query,
+            "CONTENT_TYPE": request.headers.get("Content-Type", ""),
+            "CONTENT_LENGTH": str(len(body)),
+            "SERVER_NAME": parts.hostname,
+            "SERVER_PORT": "80",
+            "SERVER_PROTOCOL": "HTTP/1.1",
+            "wsgi.version": (1, 0),
+            "wsgi.url_scheme": "http",
+            "wsgi.input": BytesIO(body),
+            "wsgi.errors": BytesIO(),
+            "wsgi.multithread": True,
+            "wsgi.multiprocess": False,
+            "wsgi.run_once": False,
+        }
+        for name, value in request.headers.items():
+            key = "HTTP_" + name.upper().replace("-", "_")
+            if key not in ("HTTP_CONTENT_TYPE", "HTTP_CONTENT_LENGTH"):
+                environ[key] = value
+
+        started = {}
+
+        def start_response(status, headers, exc_info=None):
+            started["status"] = int(status.split()[0])
+            started["headers"] = headers
+
+        result = app(environ, start_response)
+        try:
+            payload = b"".join(result)
+        finally:
+            if hasattr(result, "close"):
+                result.close()
+        return started["status"], started["headers"], payload
+
+    # --------------------------------------------------
+    # ASGI
+    # --------------------------------------------------
+    @staticmethod
+    def _call_asgi(app, request, parts, body, timeout=None):
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": request.method,
+            "scheme": "http",
+            "path": unquote(parts.path or "/"),
+            "raw_path": (parts.path or "/").encode("latin-1"),
+            "query_string": parts.query.encode("latin-1"),
+            "root_path": "",
+            "headers": [
+                (name.lower().encode("latin-1"), value.encode("latin-1"))
+                for name, value in request.headers.items()
+            ],
+            "server": (parts.hostname, None),
+            "client": ("127.0.0.1", 0),
+        }
+        if isinstance(timeout, tuple):
+            timeout = timeout[1]
+        future = asyncio.run_coroutine_threadsafe(_run_asgi(app, scope, body), _event_loop())
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise requests.exceptions.ReadTimeout(
+                f"La app en proceso no respondió en {timeout}s", request=request
+            )
+
+
+def build_response(adapter, request, status, headers, body):
+    """
+    Arma un requests.Response a partir de una respuesta ya en memoria.
+
+    Args:
+        adapter (BaseAdapter): Adaptador que atendió la request.
+        request (PreparedRequest): Request original.
+        status (int): Código HTTP.
+        headers (list | dict): Headers de la respuesta.
+        body (bytes): Cuerpo completo.
+
+    Returns:
+        requests.Response: Respuesta lista para `.json()`, `.text` o streaming.
+    """
+    response = requests.Response()
+    response.status_code = status
+    response.headers = CaseInsensitiveDict(headers)
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.raw = BytesIO(body)
+    try:
+        response.reason = HTTPStatus(status).phrase
+    except ValueError:
+        response.reason = ""
+    response.url = request.url
+    response.request = request
+    response.connection = adapter
+    return response
+
+
+def _event_loop():
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="inproc-asgi", daemon=True).start()
+        return _loop
+
+
+async def _run_asgi(app, scope, body):
+    """Ejecuta una request ASGI y devuelve (status, headers, body)."""
+    pending = [{"type": "http.request", "body": body, "more_body": False}]
+    started = {}
+    chunks = []
+
+    async def receive():
+        if pending:
+            return pending.pop()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            started["status"] = message["status"]
+            started["headers"] = [
+                (name.decode("latin-1"), value.decode("latin-1"))
+                for name, value in message.get("headers", [])
+            ]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return started["status"], started["headers"], b"".join(chunks)
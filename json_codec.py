@@ -0,0 +1,91 @@
+import json
+import os
+
+# ======================================================
+# Codec JSON intercambiable
+# ======================================================
+# Decodificar JSON es el mayor costo de CPU del cliente con
+# payloads grandes (ej. /bookings). Si `orjson` está
+# instalado se usa por defecto; si no, se usa el módulo
+# `json` de la librería estándar. Con API_JSON_CODEC se
+# fuerza uno u otro ("json", "orjson" o "auto").
+# ======================================================
+
+JSON_CODEC = os.getenv("API_JSON_CODEC", "auto")
+
+
+class StdlibCodec:
+    """Codec basado en el módulo `json` de la librería estándar."""
+
+    name = "json"
+
+    @staticmethod
+    def loads(data):
+        if isinstance(data, (bytes, bytearray)):
+            data = data.decode("utf-8")
+        return json.loads(data)
+
+    @staticmethod
+    def dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+class OrjsonCodec:
+    """Codec basado en `orjson` (acepta bytes directamente, sin pasar por str)."""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+        self.loads = orjson.loads
+
+    def dumps(self, obj):
+        return self._orjson.dumps(obj)
+
+
+_CODECS = {"json": StdlibCodec, "orjson": OrjsonCodec}
+
+
+def get_codec(name):
+    """
+    Crea el codec indicado.
+
+    Args:
+        name (str): "json", "orjson" o "auto" (orjson si está instalado).
+
+    Returns:
+        object: Codec con métodos `loads(bytes | str)` y `dumps(obj) -> bytes`.
+
+    Raises:
+        ValueError: Si el nombre no corresponde a ningún codec.
+        ImportError: Si se pide "orjson" y no está instalado.
+    """
+    if name == "auto":
+        try:
+            return OrjsonCodec()
+        except ImportError:
+            return StdlibCodec()
+    if name not in _CODECS:
+        raise ValueError(f"Codec JSON desconocido: {name!r} (opciones: auto, {', '.join(_CODECS)})")
+    return _CODECS[name]()
+
+
+def set_codec(codec):
+    """
+    Cambia el codec usado por defecto en el proceso.
+
+    Args:
+        codec (str | object): Nombre del codec o un objeto con `loads` y `dumps`.
+
+    Returns:
+        object: El codec anterior (útil para restaurarlo).
+    """
+    global default_codec
+    previous = default_codec
+    default_codec = get_codec(codec) if isinstance(codec, str) else codec
+    return previous
+
+
+# Codec compartido por APIResponse y AsyncAPIClient
+default_codec = get_codec(JSON_CODEC)
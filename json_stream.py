@@ -0,0 +1,100 @@
+import codecs
+import json
+
+# ======================================================
+# Parser incremental de arrays JSON
+# ======================================================
+# Recorre un array JSON que llega en trozos (por ejemplo
+# `Response.iter_content()`) y entrega un elemento a la vez.
+# En memoria solo queda el elemento en curso y el trozo
+# recién leído, sin importar el tamaño total del array.
+# ======================================================
+
+_WHITESPACE = " \t\n\r"
+_decoder = json.JSONDecoder()
+
+
+def _skip_whitespace(buffer, pos):
+    while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+        pos += 1
+    return pos
+
+
+def iter_json_array(chunks, encoding="utf-8"):
+    """
+    Genera los elementos de un array JSON a partir de trozos de bytes.
+
+    Args:
+        chunks (iterable): Trozos de bytes (o str) con el documento JSON.
+        encoding (str): Codificación de los bytes.
+
+    Yields:
+        object: Cada elemento del array, ya decodificado.
+
+    Raises:
+        ValueError: Si el documento no es un array JSON válido.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    chunks = iter(chunks)
+    buffer = ""
+    pos = 0
+    eof = False
+    started = False
+    # None: primer elemento o "]"; True: se espera un valor; False: "," o "]"
+    expect_value = None
+
+    def read_more():
+        nonlocal buffer, pos, eof
+        for chunk in chunks:
+            text = decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+            if text:
+                # Se descarta lo ya consumido para que el buffer no crezca
+                buffer = buffer[pos:] + text
+                pos = 0
+                return
+        buffer = buffer[pos:] + decoder.decode(b"", final=True)
+        pos = 0
+        eof = True
+
+    while True:
+        pos = _skip_whitespace(buffer, pos)
+        if pos >= len(buffer):
+            if eof:
+                raise ValueError("JSON incompleto: falta el cierre del array")
+            read_more()
+            continue
+
+        if not started:
+            if buffer[pos] != "[":
+                raise ValueError("Se esperaba un array JSON")
+            started = True
+            pos += 1
+            continue
+
+        char = buffer[pos]
+        if char == "]" and expect_value is not True:
+            return
+        if char == "," and expect_value is False:
+            pos += 1
+            expect_value = True
+            continue
+        if expect_value is False:
+            raise ValueError(f"Carácter inesperado en la posición {pos}: {char!r}")
+
+        try:
+            item, end = _decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            read_more()
+            continue
+
+        # Un número al final del buffer puede estar cortado: se exige ver el delimitador
+        after = _skip_whitespace(buffer, end)
+        if after >= len(buffer) and not eof:
+            read_more()
+            continue
+
+        pos = end
+        expect_value = False
+        yield item
@@ -0,0 +1,574 @@
+"""
+Generador de carga sobre APIClient (lazo cerrado o modelo abierto).
+
+Lazo cerrado (por defecto): cada usuario virtual repite elegir una
+acción del escenario según su peso, ejecutarla con su propio APIClient y
+"pensar" un rato antes de la siguiente. Los usuarios arrancan escalonados
+durante el ramp-up y todos se detienen al cumplirse la duración. Al final
+se informan throughput, tasa de errores y latencias p50/p95/p99/p99.9 por
+endpoint, guardadas en histogramas al estilo HdrHistogram.
+
+Modelo abierto (--rate o --stages): las requests salen a una tasa de
+llegada objetivo, respondan rápido o no, y la latencia se cuenta desde el
+instante en que correspondía enviarlas (sin "coordinated omission"). Es
+el que da colas de latencia confiables para planificar capacidad.
+
+Los payloads son los de la suite (entity_factory.SPECS, los mismos de
+tests/flights y tests/bookings) y las búsquedas las de tests/search, así
+que la carga se parece a lo que se prueba funcionalmente. Lo que se crea
+durante la corrida se borra al terminar (salvo --keep).
+
+Uso:
+    python -m load_generator --users 20 --ramp-up 10 --duration 60
+    python -m load_generator --base-url http://127.0.0.1:8000 --think-time 0.2 --json carga.json
+    python -m load_generator --rate 50 --duration 60 --only "POST /bookings"
+    python -m load_generator --stages 30:20,60:100,30:100
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from api_client import BASE, APIClient, build_session
+from entity_factory import SPECS, EntityFactory
+from resource_ledger import ResourceLedger
+from token_cache import token_manager
+from utils.settings import load_env
+
+# ======================================================
+# Configuración
+# ======================================================
+
+# Usuarios virtuales, segundos de ramp-up y de carga sostenida
+LOAD_USERS = int(os.getenv("API_LOAD_USERS", "10"))
+LOAD_RAMP_UP = float(os.getenv("API_LOAD_RAMP_UP", "10"))
+LOAD_DURATION = float(os.getenv("API_LOAD_DURATION", "60"))
+
+# Tiempo medio de "pensar" entre acciones de un usuario (segundos, ±50 %)
+LOAD_THINK_TIME = float(os.getenv("API_LOAD_THINK_TIME", "1.0"))
+
+# Requests simultáneas como máximo en el modelo abierto (--rate / --stages)
+LOAD_MAX_IN_FLIGHT = int(os.getenv("API_LOAD_MAX_IN_FLIGHT", "100"))
+
+# Percentiles informados por endpoint
+PERCENTILES = (50, 95, 99, 99.9)
+
+
+# ======================================================
+# Escenario
+# ======================================================
+
+class Action:
+    """Una request del escenario, elegida con probabilidad proporcional a `weight`."""
+
+    def __init__(self, name, method, path, weight=1, params=None, payload=None):
+        """
+        Args:
+            name (str): Nombre con el que se informa (ej. "GET /flights?date").
+            method (str): Método HTTP.
+            path (str): Ruta; admite campos del contexto (ej. "/flights/{flight_id}").
+            weight (float): Peso relativo dentro del escenario.
+            params (dict, optional): Query string.
+            payload (callable, optional): Recibe el contexto y devuelve el body JSON.
+        """
+        self.name = name
+        self.method = method
+        self.path = path
+        self.weight = weight
+        self.params = params
+        self.payload = payload
+
+    def run(self, client, context):
+        kwargs = {}
+        if self.params:
+            kwargs["params"] = self.params
+        if self.payload is not None:
+            kwargs["json"] = self.payload(context)
+        return client.api_request(self.method, self.path.format(**context), **kwargs)
+
+
+def _payload(kind, **parents):
+    """Payload de `kind` según la fábrica de entidades, con los IDs padre tomados del contexto."""
+    return lambda context: dict(SPECS[kind].payload(), **{field: context[key] for field, key in parents.items()})
+
+
+# Mezcla de lecturas (listado, búsquedas, detalle) y escrituras (reservas, vuelos)
+DEFAULT_SCENARIO = (
+    Action("GET /flights", "GET", "/flights", weight=4),
+    Action("GET /flights?date", "GET", "/flights", weight=2, params={"date": "2024-03-15"}),
+    Action("GET /flights?minPrice&maxPrice", "GET", "/flights", weight=2,
+           params={"minPrice": 200, "maxPrice": 500}),
+    Action("GET /flights/{id}", "GET", "/flights/{flight_id}", weight=3),
+    Action("POST /bookings", "POST", "/bookings", weight=2, payload=_payload("booking", flight_id="flight_id")),
+    Action("POST /flights", "POST", "/flights", weight=1, payload=_payload("flight", airline_id="airline_id")),
+)
+
+
+# ======================================================
+# Resultados
+# ======================================================
+
+class LatencyHistogram:
+    """
+    Histograma de latencias al estilo HdrHistogram (log-lineal, en microsegundos).
+
+    Los valores menores que `2 ** sub_bucket_bits` µs se guardan exactos; los
+    mayores, en `2 ** (sub_bucket_bits - 1)` sub-buckets por potencia de dos,
+    con error relativo menor a 1/128 para el valor por defecto (8). El
+    tamaño es fijo (unos pocos miles de contadores hasta una hora) y dos
+    histogramas se combinan sumando contadores.
+    """
+
+    def __init__(self, sub_bucket_bits=8, highest=3600.0):
+        """
+        Args:
+            sub_bucket_bits (int): Bits de precisión de cada potencia de dos.
+            highest (float): Mayor latencia registrable en segundos; las
+                mayores se guardan en el último bucket.
+        """
+        self.sub_bucket_bits = sub_bucket_bits
+        self.sub_bucket_count = 1 << sub_bucket_bits
+        self.sub_bucket_half = self.sub_bucket_count >> 1
+        self.counts = [0] * (self._index(int(highest * 1_000_000)) + 1)
+        self.total = 0
+        self.max = 0
+
+    def _index(self, value):
+        if value < self.sub_bucket_count:
+            return value
+        shift = value.bit_length() - self.sub_bucket_bits
+        return self.sub_bucket_count + (shift - 1) * self.sub_bucket_half + (value >> shift) - self.sub_bucket_half
+
+    def _highest_equivalent(self, index):
+        """Mayor valor (µs) que cae en el bucket `index`."""
+        if index < self.sub_bucket_count:
+            return index
+        shift, sub = divmod(index - self.sub_bucket_count, self.sub_bucket_half)
+        shift += 1
+        return ((sub + self.sub_bucket_half + 1) << shift) - 1
+
+    def record(self, seconds, count=1):
+        value = max(int(seconds * 1_000_000), 0)
+        self.counts[min(self._index(value), len(self.counts) - 1)] += count
+        self.total += count
+        self.max = max(self.max, value)
+
+    def merge(self, other):
+        for index, count in enumerate(other.counts):
+            if count:
+                self.counts[index] += count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def percentile(self, q):
+        """Latencia en segundos del percentil `q` (0-100); 0 si está vacío."""
+        if not self.total:
+            return 0.0
+        # round() evita que 99.9 % de 1000 (999.0000000000001) suba un rango
+        rank = max(math.ceil(round(q / 100 * self.total, 9)), 1)
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(self._highest_equivalent(index), self.max) / 1_000_000
+        return self.max / 1_000_000
+
+
+class LoadReport:
+    """Histogramas de latencia y errores por endpoint de una corrida."""
+
+    def __init__(self, users, elapsed, title=None):
+        """
+        Args:
+            users (int): Usuarios virtuales (0 en el modelo abierto).
+            elapsed (float): Duración de la corrida en segundos.
+            title (str, optional): Primera línea del informe. Por defecto
+                "<users> usuarios".
+        """
+        self.users = users
+        self.elapsed = elapsed
+        self.title = title or f"{users} usuarios"
+        self.latencies = {}
+        self.errors = {}
+        # Demora entre el instante previsto y el envío real (modelo abierto)
+        self.send_lag = LatencyHistogram()
+
+    def record(self, name, seconds, error):
+        histogram = self.latencies.get(name)
+        if histogram is None:
+            histogram = self.latencies[name] = LatencyHistogram()
+            self.errors[name] = 0
+        histogram.record(seconds)
+        self.errors[name] += bool(error)
+
+    def merge(self, other):
+        for name, histogram in other.latencies.items():
+            if name not in self.latencies:
+                self.latencies[name] = LatencyHistogram()
+                self.errors[name] = 0
+            self.latencies[name].merge(histogram)
+            self.errors[name] += other.errors[name]
+        self.send_lag.merge(other.send_lag)
+
+    def summary(self):
+        """
+        Returns:
+            dict: nombre → {requests, errors, error_rate, throughput, p50..p99.9, max}
+            (latencias en milisegundos), más la fila "TOTAL".
+        """
+        rows = dict(self.latencies)
+        rows["TOTAL"] = total = LatencyHistogram()
+        for histogram in self.latencies.values():
+            total.merge(histogram)
+        elapsed = max(self.elapsed, 1e-9)
+        summary = {}
+        for name, histogram in rows.items():
+            errors = sum(self.errors.values()) if name == "TOTAL" else self.errors[name]
+            row = {
+                "requests": histogram.total,
+                "errors": errors,
+                "error_rate": errors / histogram.total if histogram.total else 0.0,
+                "throughput": histogram.total / elapsed,
+            }
+            for q in PERCENTILES:
+                row[f"p{q:g}"] = histogram.percentile(q) * 1000
+            row["max"] = histogram.max / 1000
+            summary[name] = row
+        return summary
+
+    def format_table(self):
+        columns = ["requests", "req/s", "errores"] + [f"p{q:g}" for q in PERCENTILES] + ["max"]
+        lines = [
+            f"{self.title}, {self.elapsed:.1f}s (latencias en ms)",
+            f"{'endpoint':<32}" + "".join(f"{column:>10}" for column in columns),
+        ]
+        for name, row in self.summary().items():
+            values = [f"{row['requests']:d}", f"{row['throughput']:.1f}", f"{row['error_rate']:.1%}"]
+            values += [f"{row[f'p{q:g}']:.1f}" for q in PERCENTILES] + [f"{row['max']:.1f}"]
+            lines.append(f"{name:<32}" + "".join(f"{value:>10}" for value in values))
+        if self.send_lag.total:
+            lines.append(
+                f"demora de envío p99 {self.send_lag.percentile(99) * 1000:.1f} ms, "
+                f"máx {self.send_lag.max / 1000:.1f} ms (incluida en las latencias)"
+            )
+        return "\n".join(lines)
+
+
+# ======================================================
+# Generador
+# ======================================================
+
+class LoadGenerator:
+    """Usuarios virtuales en hilos, cada uno con su APIClient, en lazo cerrado."""
+
+    def __init__(self, base_url, scenario=DEFAULT_SCENARIO, users=LOAD_USERS, ramp_up=LOAD_RAMP_UP,
+                 duration=LOAD_DURATION, think_time=LOAD_THINK_TIME, token=None, context=None, seed=None,
+                 ledger=None):
+        """
+        Args:
+            base_url (str): URL base de la API.
+            scenario (iterable): Acciones (Action) a ejecutar.
+            users (int): Usuarios virtuales.
+            ramp_up (float): Segundos en los que arrancan todos los usuarios.
+            duration (float): Segundos de carga después del ramp-up.
+            think_time (float): Espera media entre acciones de un usuario.
+            token (str, optional): Token de acceso para las requests.
+            context (dict, optional): Valores para las rutas y payloads del
+                escenario (ej. flight_id, airline_id).
+            seed (int, optional): Semilla para repetir la secuencia de acciones.
+            ledger (ResourceLedger, optional): Registro donde anotar lo que creen
+                los usuarios virtuales, para borrarlo después.
+        """
+        self.base_url = base_url.rstrip("/")
+        self.scenario = list(scenario)
+        self.users = users
+        self.ramp_up = ramp_up
+        self.duration = duration
+        self.think_time = think_time
+        self.token = token
+        self.context = context or {}
+        self.seed = seed if seed is not None else random.randrange(1 << 30)
+        self.ledger = ledger
+
+    def run(self):
+        """
+        Ejecuta la carga y espera a que terminen todos los usuarios.
+
+        Returns:
+            LoadReport: Resultados combinados de todos los usuarios.
+        """
+        start = time.monotonic()
+        stop_at = start + self.ramp_up + self.duration
+        reports = [LoadReport(self.users, 0.0) for _ in range(self.users)]
+        threads = [
+            threading.Thread(
+                target=self._virtual_user, args=(i, start, stop_at, reports[i]), name=f"vu-{i}", daemon=True
+            )
+            for i in range(self.users)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        report = LoadReport(self.users, time.monotonic() - start)
+        for partial in reports:
+            report.merge(partial)
+        return report
+
+    def _virtual_user(self, index, start, stop_at, report):
+        rng = random.Random(self.seed + index)
+        weights = [action.weight for action in self.scenario]
+        time.sleep(max(start + index * self.ramp_up / max(self.users, 1) - time.monotonic(), 0))
+
+        # Sin reintentos, limitador ni coalescencia: se mide lo que responde la API
+        with APIClient(base_url=self.base_url, prewarm=0, retry_policy=None, rate_limiter=None,
+                       single_flight=None) as client:
+            client.token = self.token
+            if self.ledger is not None:
+                self.ledger.track(client.session)
+            while time.monotonic() < stop_at:
+                action = rng.choices(self.scenario, weights)[0]
+                sent = time.perf_counter()
+                try:
+                    error = action.run(client, self.context).status_code >= 400
+                except requests.exceptions.RequestException:
+                    error = True
+                report.record(action.name, time.perf_counter() - sent, error)
+
+                if self.think_time:
+                    pause = rng.uniform(0.5, 1.5) * self.think_time
+                    time.sleep(max(min(pause, stop_at - time.monotonic()), 0))
+
+
+# ======================================================
+# Modelo abierto (tasa de llegada constante)
+# ======================================================
+# En el lazo cerrado, si la API se pone lenta los usuarios
+# envían menos requests y las demoras que habrían sufrido no
+# se miden ("coordinated omission"): la cola de latencias
+# sale optimista. En el modelo abierto las requests se
+# envían a la tasa objetivo sin importar cuánto tarden las
+# respuestas, y la latencia se mide desde el instante en que
+# correspondía enviar cada una: si no había hilo libre, esa
+# espera también cuenta.
+# ======================================================
+
+class RateCurve:
+    """Tasa de llegada objetivo (req/s) en el tiempo, por tramos lineales."""
+
+    def __init__(self, stages, start_rate=0.0):
+        """
+        Args:
+            stages (list): Tramos (duración en segundos, tasa al final del tramo);
+                la tasa va en línea recta desde la del tramo anterior.
+            start_rate (float): Tasa al comenzar el primer tramo.
+        """
+        self.stages = [(float(duration), float(rate)) for duration, rate in stages]
+        self.start_rate = float(start_rate)
+        self.duration = sum(duration for duration, _ in self.stages)
+
+    @classmethod
+    def constant(cls, rate, duration):
+        return cls([(duration, rate)], start_rate=rate)
+
+    @classmethod
+    def parse(cls, text):
+        """Interpreta "duración:tasa,..." (ej. "10:50,60:50,10:0": subir, sostener, bajar)."""
+        return cls([stage.split(":") for stage in text.split(",") if stage.strip()])
+
+    def rate(self, t):
+        """Tasa objetivo a los `t` segundos del inicio."""
+        previous = self.start_rate
+        for duration, target in self.stages:
+            if t < duration:
+                return previous + (target - previous) * t / duration
+            t -= duration
+            previous = target
+        return previous
+
+    def arrivals(self, step=0.001):
+        """Instantes (segundos desde el inicio) en que corresponde enviar cada request."""
+        t, pending = 0.0, 1.0  # la primera sale al empezar
+        while t < self.duration:
+            pending += self.rate(t) * step
+            while pending >= 1.0:
+                pending -= 1.0
+                yield t
+            t += step
+
+    def describe(self):
+        if len(self.stages) == 1 and self.start_rate == self.stages[0][1]:
+            return f"{self.stages[0][1]:g} req/s"
+        return " → ".join(f"{rate:g} req/s en {duration:g}s" for duration, rate in self.stages)
+
+
+class OpenLoadGenerator:
+    """Envía las acciones del escenario a una tasa de llegada objetivo (modelo abierto)."""
+
+    def __init__(self, base_url, curve, scenario=DEFAULT_SCENARIO, max_in_flight=LOAD_MAX_IN_FLIGHT,
+                 token=None, context=None, seed=None, ledger=None):
+        """
+        Args:
+            base_url (str): URL base de la API.
+            curve (RateCurve): Tasa de llegada objetivo.
+            scenario (iterable): Acciones (Action) a ejecutar.
+            max_in_flight (int): Hilos (y por lo tanto requests simultáneas) como
+                máximo; las llegadas que no encuentran hilo libre esperan y esa
+                espera cuenta en su latencia.
+            token (str, optional): Token de acceso para las requests.
+            context (dict, optional): Valores para las rutas y payloads del escenario.
+            seed (int, optional): Semilla para repetir la secuencia de acciones.
+            ledger (ResourceLedger, optional): Registro donde anotar lo que se crea.
+        """
+        self.base_url = base_url.rstrip("/")
+        self.curve = curve
+        self.scenario = list(scenario)
+        self.max_in_flight = max_in_flight
+        self.token = token
+        self.context = context or {}
+        self.seed = seed if seed is not None else random.randrange(1 << 30)
+        self.ledger = ledger
+        self._local = threading.local()
+        self._clients = []
+        self._lock = threading.Lock()
+
+    def run(self):
+        """
+        Programa todas las llegadas de la curva y espera las respuestas.
+
+        Returns:
+            LoadReport: Latencias medidas desde el instante previsto de cada envío.
+        """
+        rng = random.Random(self.seed)
+        weights = [action.weight for action in self.scenario]
+        report = LoadReport(0, 0.0, title=f"modelo abierto, {self.curve.describe()}")
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.max_in_flight, thread_name_prefix="arrival") as pool:
+            for offset in self.curve.arrivals():
+                intended = start + offset
+                delay = intended - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                pool.submit(self._send, rng.choices(self.scenario, weights)[0], intended, report)
+        report.elapsed = time.perf_counter() - start
+        for client in self._clients:
+            client.close()
+        return report
+
+    def _client(self):
+        client = getattr(self._local, "client", None)
+        if client is None:
+            # Sin reintentos, limitador ni coalescencia: se mide lo que responde la API
+            client = APIClient(base_url=self.base_url, prewarm=0, retry_policy=None, rate_limiter=None,
+                               single_flight=None)
+            client.token = self.token
+            if self.ledger is not None:
+                self.ledger.track(client.session)
+            self._local.client = client
+            with self._lock:
+                self._clients.append(client)
+        return client
+
+    def _send(self, action, intended, report):
+        lag = time.perf_counter() - intended
+        try:
+            error = action.run(self._client(), self.context).status_code >= 400
+        except requests.exceptions.RequestException:
+            error = True
+        latency = time.perf_counter() - intended
+        with self._lock:
+            report.record(action.name, latency, error)
+            report.send_lag.record(max(lag, 0.0))
+
+
+# ======================================================
+# Ejecución desde la línea de comandos
+# ======================================================
+
+def admin_token(base_url):
+    """Token de administrador desde la caché compartida (token_cache.py)."""
+    user = os.getenv("ADMIN_USER", "admin@demo.com")
+    pwd = os.getenv("ADMIN_PASS", "admin123")
+
+    def login():
+        with APIClient(base_url=base_url, prewarm=0) as client:
+            return client.login(user, pwd)["access_token"]
+
+    return token_manager.get_token(base_url, user, login)
+
+
+def main(argv=None):
+    load_env()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--base-url", default=os.getenv("BASE_URL", BASE))
+    parser.add_argument("--users", type=int, default=LOAD_USERS)
+    parser.add_argument("--ramp-up", type=float, default=LOAD_RAMP_UP)
+    parser.add_argument("--duration", type=float, default=LOAD_DURATION)
+    parser.add_argument("--think-time", type=float, default=LOAD_THINK_TIME)
+    parser.add_argument("--rate", type=float, help="modelo abierto: req/s constantes durante --duration")
+    parser.add_argument("--stages", help='modelo abierto: curva "duración:tasa,..." (ej. "10:50,60:50")')
+    parser.add_argument("--max-in-flight", type=int, default=LOAD_MAX_IN_FLIGHT)
+    parser.add_argument("--only", action="append", help="acciones del escenario a usar (ej. 'POST /bookings')")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--json", help="archivo donde guardar el resumen en JSON")
+    parser.add_argument("--max-error-rate", type=float, help="termina con código 1 si se supera")
+    parser.add_argument("--keep", action="store_true", help="no borrar lo creado durante la carga")
+    args = parser.parse_args(argv)
+
+    token = admin_token(args.base_url)
+
+    def headers():
+        return {"Authorization": f"Bearer {token}"}
+
+    ledger = ResourceLedger()
+    session = ledger.track(build_session())
+
+    # Vuelo (y aerolínea) de referencia para las lecturas y las reservas
+    factory = EntityFactory(session, args.base_url, headers=headers)
+    flight = factory.shared("flight", date="2024-03-15")
+    factory.close()
+
+    context = {"flight_id": flight["id"], "airline_id": flight["airline_id"]}
+    scenario = [action for action in DEFAULT_SCENARIO if not args.only or action.name in args.only]
+    if not scenario:
+        parser.error(f"--only no coincide con ninguna acción: {', '.join(a.name for a in DEFAULT_SCENARIO)}")
+
+    if args.rate or args.stages:
+        curve = RateCurve.parse(args.stages) if args.stages else RateCurve.constant(args.rate, args.duration)
+        generator = OpenLoadGenerator(
+            args.base_url, curve, scenario=scenario, max_in_flight=args.max_in_flight,
+            token=token, context=context, seed=args.seed, ledger=ledger,
+        )
+    else:
+        generator = LoadGenerator(
+            args.base_url, scenario=scenario, users=args.users, ramp_up=args.ramp_up, duration=args.duration,
+            think_time=args.think_time, token=token, context=context, seed=args.seed, ledger=ledger,
+        )
+    report = generator.run()
+    print(report.format_table())
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report.summary(), f, indent=2)
+    if not args.keep:
+        failures = ledger.flush(session, headers)
+        for kind, url, reason in failures:
+            print(f"sin borrar: {kind} {url} → {reason}")
+
+    total = report.summary()["TOTAL"]
+    if args.max_error_rate is not None and total["error_rate"] > args.max_error_rate:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -16,10 +16,11 @@ Requisitos previos:
 
 import requests
 import os
-from dotenv import load_dotenv
+from token_cache import token_manager
+from utils.settings import load_env
 
 # Carga las variables de entorno desde un archivo .env
-load_dotenv()
+load_env()
 
 # Configuración de endpoints principales
 URL = os.getenv("BASE_URL", "https://cf-automation-airline-api.onrender.com")
@@ -28,7 +29,10 @@ AUTH_SIGNUP = "/users/"
 
 def get_admin_token():
     """
-    Realiza login con credenciales de administrador y retorna un token JWT.
+    Devuelve un token JWT de administrador.
+
+    Reutiliza el token de la caché compartida (token_cache.py) y solo hace
+    login si no hay uno vigente.
 
     Returns:
         str: token de acceso válido para autenticación en la API.
@@ -41,11 +45,14 @@ def get_admin_token():
         "password": os.getenv("ADMIN_PASS", "admin123")
     }
 
-    r = requests.post(URL + AUTH_LOGIN, data=admin_data)
-    if r.status_code == 200:
-        return r.json()["access_token"]
-    else:
-        raise Exception(f"Error al obtener token: {r.status_code} - {r.text}")
+    def login():
+        r = requests.post(URL + AUTH_LOGIN, data=admin_data)
+        if r.status_code == 200:
+            return r.json()["access_token"]
+        else:
+            raise Exception(f"Error al obtener token: {r.status_code} - {r.text}")
+
+    return token_manager.get_token(URL, admin_data["username"], login)
 
 
 def create_support_user():
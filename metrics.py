@@ -0,0 +1,224 @@
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+
+# ======================================================
+# Métricas de tiempos por request
+# ======================================================
+# Cada intento HTTP registra cuánto tardó en cada fase:
+#
+#   dns → connect → tls → ttfb → download → json_decode → validation
+#
+# Los tiempos se acumulan en histogramas por endpoint
+# (plantillas como "/bookings/{id}", ver endpoints.py) y se
+# exportan en formato Prometheus (texto) o JSON. Registrar
+# una observación cuesta un bisect y dos sumas bajo un lock,
+# así que se puede dejar activado siempre.
+# ======================================================
+
+# Se desactiva con API_METRICS=0
+ENABLED = os.getenv("API_METRICS", "1") != "0"
+
+# Límites superiores de los buckets (en segundos), como en Prometheus
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+PHASES = ("dns", "connect", "tls", "ttfb", "download", "json_decode", "validation")
+
+# Fases registradas aparte de RequestTiming con MetricsRegistry.observe()
+#   throttle: espera en el limitador de tasa antes del intento (rate_limiter.py)
+
+_current = threading.local()
+
+
+class RequestTiming:
+    """Fases de un intento HTTP (segundos). Las no aplicables quedan en 0."""
+
+    __slots__ = ("start", "attempt", "dns", "connect", "tls", "ttfb", "download",
+                 "json_decode", "validation")
+
+    def __init__(self, attempt=1):
+        self.start = time.perf_counter()
+        self.attempt = attempt
+        self.dns = self.connect = self.tls = self.ttfb = self.download = 0.0
+        self.json_decode = self.validation = 0.0
+
+    def as_dict(self):
+        data = {phase: getattr(self, phase) for phase in PHASES}
+        data["attempt"] = self.attempt
+        return data
+
+
+def current_timing():
+    """Devuelve el RequestTiming del intento en curso en este hilo (o None)."""
+    return getattr(_current, "timing", None)
+
+
+class Histogram:
+    """Histograma acumulativo de buckets fijos."""
+
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)  # el último es +Inf
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(BUCKETS, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def cumulative(self):
+        running = 0
+        result = []
+        for count in self.counts:
+            running += count
+            result.append(running)
+        return result
+
+
+class MetricsRegistry:
+    """Histogramas por (método, endpoint, fase) y contador de intentos por status."""
+
+    def __init__(self, enabled=ENABLED):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self._requests = {}
+        self._counters = {}
+        self._listeners = []
+
+    # --------------------------------------------------
+    # Registro
+    # --------------------------------------------------
+    def begin(self, attempt=1):
+        """Inicia la medición de un intento en el hilo actual."""
+        if not self.enabled:
+            return None
+        timing = RequestTiming(attempt)
+        _current.timing = timing
+        return timing
+
+    def finish(self, timing, method, endpoint, status):
+        """Cierra la medición de un intento y acumula sus fases de red."""
+        _current.timing = None
+        if timing is None:
+            return
+        with self._lock:
+            for phase in ("dns", "connect", "tls", "ttfb", "download"):
+                value = getattr(timing, phase)
+                if value or phase == "ttfb":
+                    self._histogram(method, endpoint, phase).observe(value)
+            key = (method, endpoint, str(status), timing.attempt)
+            self._requests[key] = self._requests.get(key, 0) + 1
+        for listener in self._listeners:
+            listener(method, endpoint, status, timing)
+
+    def observe(self, method, endpoint, phase, seconds):
+        """Acumula una fase medida fuera del adaptador (ej. json_decode, validation)."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._histogram(method, endpoint, phase).observe(seconds)
+
+    def increment(self, name, method, endpoint, amount=1):
+        """Suma `amount` al contador `name` (exportado como api_client_<name>_total)."""
+        if not self.enabled:
+            return
+        key = (name, method, endpoint)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def subscribe(self, listener):
+        """Registra `listener(method, endpoint, status, timing)` para cada intento."""
+        self._listeners.append(listener)
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self._requests.clear()
+            self._counters.clear()
+
+    def _histogram(self, method, endpoint, phase):
+        key = (method, endpoint, phase)
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = Histogram()
+        return histogram
+
+    # --------------------------------------------------
+    # Exportación
+    # --------------------------------------------------
+    def to_json(self):
+        """dict: Histogramas y contadores serializables a JSON."""
+        with self._lock:
+            histograms = [
+                {
+                    "method": method, "endpoint": endpoint, "phase": phase,
+                    "count": h.count, "sum": h.total,
+                    "buckets": dict(zip([str(b) for b in BUCKETS] + ["+Inf"], h.cumulative())),
+                }
+                for (method, endpoint, phase), h in sorted(self._histograms.items())
+            ]
+            requests_total = [
+                {"method": method, "endpoint": endpoint, "status": status, "attempt": attempt, "count": count}
+                for (method, endpoint, status, attempt), count in sorted(self._requests.items())
+            ]
+            counters = [
+                {"name": name, "method": method, "endpoint": endpoint, "count": count}
+                for (name, method, endpoint), count in sorted(self._counters.items())
+            ]
+        return {"phases": histograms, "requests": requests_total, "counters": counters}
+
+    def to_prometheus(self):
+        """str: Métricas en formato de exposición de texto de Prometheus."""
+        lines = [
+            "# HELP api_client_phase_seconds Duración de cada fase de la request.",
+            "# TYPE api_client_phase_seconds histogram",
+        ]
+        with self._lock:
+            for (method, endpoint, phase), h in sorted(self._histograms.items()):
+                labels = f'method="{method}",endpoint="{endpoint}",phase="{phase}"'
+                for bound, count in zip(list(BUCKETS) + ["+Inf"], h.cumulative()):
+                    lines.append(f'api_client_phase_seconds_bucket{{{labels},le="{bound}"}} {count}')
+                lines.append(f"api_client_phase_seconds_sum{{{labels}}} {h.total}")
+                lines.append(f"api_client_phase_seconds_count{{{labels}}} {h.count}")
+
+            lines.append("# HELP api_client_attempts_total Intentos HTTP por status y número de intento.")
+            lines.append("# TYPE api_client_attempts_total counter")
+            for (method, endpoint, status, attempt), count in sorted(self._requests.items()):
+                lines.append(
+                    f'api_client_attempts_total{{method="{method}",endpoint="{endpoint}",'
+                    f'status="{status}",attempt="{attempt}"}} {count}'
+                )
+
+            for name in sorted({key[0] for key in self._counters}):
+                lines.append(f"# TYPE api_client_{name}_total counter")
+                for (counter, method, endpoint), count in sorted(self._counters.items()):
+                    if counter == name:
+                        lines.append(
+                            f'api_client_{name}_total{{method="{method}",endpoint="{endpoint}"}} {count}'
+                        )
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path):
+        """Escribe las métricas en un archivo de texto para el textfile collector."""
+        _atomic_write(path, self.to_prometheus())
+
+    def write_json(self, path):
+        _atomic_write(path, json.dumps(self.to_json(), indent=2))
+
+
+def _atomic_write(path, content):
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as fh:
+        fh.write(content)
+    os.replace(tmp_path, path)
+
+
+# Registro compartido por todos los clientes del proceso
+metrics = MetricsRegistry()
@@ -0,0 +1,196 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+from response_cache import collection_prefix
+from retry_policy import MAX_DELAY
+from token_cache import file_lock
+
+# ======================================================
+# Limitador de tasa (token bucket) por grupo de endpoints
+# ======================================================
+# La API responde a las ráfagas con 429. En lugar de chocar
+# contra el límite y reintentar, cada grupo de endpoints
+# (host + colección, ej. "api:8000/flights") tiene un token
+# bucket que espacia las requests. La tasa se adapta sola
+# (AIMD): sube un poco con cada respuesta aceptada y se
+# reduce a la mitad con cada 429 o cualquier respuesta con
+# `Retry-After` (ej. 503), que además deja el grupo en pausa
+# ese tiempo (como mucho `max_pause`, la misma espera máxima
+# que la política de reintentos).
+#
+# Con API_RATE_LIMIT_FILE el estado de los buckets se guarda
+# en un archivo con lock, y todos los procesos del host
+# (workers de pytest-xdist, generadores de carga) comparten
+# la misma tasa.
+# ======================================================
+
+# Tasa inicial por grupo (requests por segundo). 0 desactiva el limitador.
+RATE_LIMIT = float(os.getenv("API_RATE_LIMIT", "50"))
+
+# Tasa máxima a la que puede subir la adaptación
+RATE_LIMIT_MAX = float(os.getenv("API_RATE_LIMIT_MAX", "500"))
+
+# Requests que se pueden enviar de golpe con el bucket lleno
+RATE_LIMIT_BURST = float(os.getenv("API_RATE_LIMIT_BURST", "10"))
+
+# Archivo de estado compartido entre procesos (vacío = solo este proceso)
+RATE_LIMIT_FILE = os.getenv("API_RATE_LIMIT_FILE", "")
+
+# Ajustes de la adaptación: +INCREASE req/s por respuesta aceptada, ×DECREASE por 429
+RATE_INCREASE = 0.5
+RATE_DECREASE = 0.5
+MIN_RATE = 0.5
+
+
+def endpoint_group(url):
+    """
+    Grupo de rate limit de una URL: host + colección.
+
+    Ejemplo: "http://api:8000/flights/FL1?x=1" → "api:8000/flights".
+    """
+    parts = urlsplit(url)
+    return parts.netloc + collection_prefix(parts.path)
+
+
+class RateLimiter:
+    """
+    Token buckets adaptativos por grupo de endpoints, thread-safe y
+    opcionalmente compartidos entre procesos a través de un archivo.
+    """
+
+    def __init__(self, rate=RATE_LIMIT, burst=RATE_LIMIT_BURST, max_rate=RATE_LIMIT_MAX,
+                 min_rate=MIN_RATE, max_pause=MAX_DELAY, path=None):
+        """
+        Args:
+            rate (float): Tasa inicial por grupo (requests por segundo).
+            burst (float): Capacidad del bucket (requests seguidas sin esperar).
+            max_rate (float): Tope de la tasa adaptada.
+            min_rate (float): Piso de la tasa adaptada.
+            max_pause (float): Pausa máxima tras un 429 aunque `Retry-After` pida más.
+            path (str, optional): Archivo de estado compartido entre procesos.
+        """
+        self.initial_rate = rate
+        self.burst = max(1.0, burst)
+        self.max_rate = max(rate, max_rate)
+        self.min_rate = min(rate, min_rate)
+        self.max_pause = max_pause
+        self.path = path
+        self._states = {}
+        self._lock = threading.Lock()
+
+    # --------------------------------------------------
+    # Estado de los buckets
+    # --------------------------------------------------
+    def _new_state(self, now):
+        return {"rate": self.initial_rate, "tokens": self.burst, "updated": now, "paused_until": 0.0}
+
+    @contextmanager
+    def _buckets(self):
+        """Da acceso exclusivo a los buckets (del proceso o del archivo compartido)."""
+        with self._lock:
+            if not self.path:
+                yield self._states
+                return
+            with file_lock(self.path):
+                try:
+                    with open(self.path, encoding="utf-8") as fh:
+                        states = json.load(fh)
+                except (OSError, ValueError):
+                    states = {}
+                yield states
+                self._write(states)
+
+    def _write(self, states):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".ratelimit-")
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(states, fh)
+        os.replace(tmp_path, self.path)
+
+    def _refill(self, state, now):
+        elapsed = max(0.0, now - state["updated"])
+        state["tokens"] = min(self.burst, state["tokens"] + elapsed * state["rate"])
+        state["updated"] = now
+
+    # --------------------------------------------------
+    # API pública
+    # --------------------------------------------------
+    def acquire(self, group, deadline=None):
+        """
+        Espera hasta que el grupo tenga un token disponible y lo consume.
+
+        Args:
+            group (str): Grupo de endpoints (ver endpoint_group()).
+            deadline (Deadline, optional): Presupuesto del test en curso
+                (ver deadline.py); no se espera más allá de su vencimiento.
+
+        Returns:
+            float: Segundos que se esperó.
+
+        Raises:
+            DeadlineExceeded: Si la espera no entra en el presupuesto.
+        """
+        if self.initial_rate <= 0:
+            return 0.0
+        waited = 0.0
+        while True:
+            # Se usa time.time() porque el estado puede compartirse entre procesos
+            now = time.time()
+            with self._buckets() as states:
+                state = states.setdefault(group, self._new_state(now))
+                self._refill(state, now)
+                if now < state["paused_until"]:
+                    wait = state["paused_until"] - now
+                elif state["tokens"] >= 1:
+                    state["tokens"] -= 1
+                    return waited
+                else:
+                    wait = (1 - state["tokens"]) / state["rate"]
+            if deadline is not None and not deadline.allows(wait):
+                raise deadline.error(f"el limitador de {group} pide esperar {wait:.1f}s")
+            time.sleep(wait)
+            waited += wait
+
+    def on_response(self, group, status, retry_after=None):
+        """
+        Adapta la tasa del grupo según la respuesta recibida.
+
+        Args:
+            group (str): Grupo de endpoints.
+            status (int): Código HTTP de la respuesta.
+            retry_after (float, optional): Segundos indicados por `Retry-After`.
+        """
+        if self.initial_rate <= 0:
+            return
+        now = time.time()
+        with self._buckets() as states:
+            state = states.setdefault(group, self._new_state(now))
+            self._refill(state, now)
+            if status == 429 or retry_after is not None:
+                # 429 o cualquier respuesta con Retry-After (ej. 503): el servidor pide frenar
+                state["rate"] = max(self.min_rate, state["rate"] * RATE_DECREASE)
+                state["tokens"] = 0.0
+                if retry_after:
+                    pause = min(retry_after, self.max_pause)
+                    state["paused_until"] = max(state["paused_until"], now + pause)
+            elif status < 500:
+                state["rate"] = min(self.max_rate, state["rate"] + RATE_INCREASE)
+
+    def rate(self, group):
+        """float: Tasa actual del grupo (requests por segundo)."""
+        with self._buckets() as states:
+            state = states.get(group)
+            return state["rate"] if state else self.initial_rate
+
+    def reset(self):
+        with self._buckets() as states:
+            states.clear()
+
+
+# Limitador compartido por APIClient y la sesión de pytest
+default_limiter = RateLimiter(path=RATE_LIMIT_FILE or None)
@@ -0,0 +1,191 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit, urlunsplit
+
+import requests
+
+# ======================================================
+# Registro de recursos creados por la suite (ledger)
+# ======================================================
+# Un hook de respuesta en la sesión anota cada entidad que
+# un POST crea con éxito (aerolíneas, vuelos, reservas,
+# aeropuertos, usuarios), venga de la fábrica de entidades
+# o de un test. Al terminar la sesión, o en los puntos de
+# control configurados, se borran en paralelo por niveles:
+# primero los hijos (reservas), después sus padres (vuelos)
+# y al final aerolíneas, aeropuertos y usuarios.
+#
+# Lo que un test ya borró (DELETE 200/204) sale del registro
+# y un 404 al limpiar cuenta como borrado. Las entidades
+# compartidas de la fábrica quedan fijadas (pin) hasta el
+# final de la sesión. Lo que no se pudo borrar se informa
+# en el resumen de pytest.
+# ======================================================
+
+# session | module: además del final de la sesión, limpiar al terminar cada módulo
+LEDGER_CHECKPOINT = os.getenv("API_LEDGER_CHECKPOINT", "session")
+
+# Hilos para los DELETE de un mismo nivel
+LEDGER_WORKERS = int(os.getenv("API_LEDGER_WORKERS", "8"))
+
+
+class Collection:
+    """Colección de la API cuyas entidades se registran."""
+
+    def __init__(self, kind, id_field="id", level=0, ok_statuses=(200, 204, 404)):
+        """
+        Args:
+            kind (str): Tipo de entidad (ej. "flight").
+            id_field (str): Campo del JSON creado con su identificador.
+            level (int): Profundidad en la cadena de dependencias; los niveles
+                más altos (hijos) se borran primero.
+            ok_statuses (tuple): Status del DELETE que cuentan como limpieza exitosa.
+        """
+        self.kind = kind
+        self.id_field = id_field
+        self.level = level
+        self.ok_statuses = ok_statuses
+
+
+# Ruta de la colección → cómo se registran y limpian sus entidades.
+# Las reservas no se borran: el DELETE las cancela (400 = ya cancelada).
+COLLECTIONS = {
+    "/bookings": Collection("booking", level=2, ok_statuses=(200, 204, 400, 404)),
+    "/flights": Collection("flight", level=1),
+    "/airlines": Collection("airline"),
+    "/airports": Collection("airport", id_field="iata_code"),
+    "/users": Collection("user"),
+}
+
+
+def resource_url(url):
+    """URL de un recurso sin query string ni barra final (clave del registro)."""
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme, parts.netloc, parts.path.rstrip("/"), "", ""))
+
+
+class _Entry:
+    __slots__ = ("kind", "url", "collection", "pinned")
+
+    def __init__(self, url, collection, pinned=False):
+        self.kind = collection.kind
+        self.url = url
+        self.collection = collection
+        self.pinned = pinned
+
+
+class ResourceLedger:
+    """Registro de entidades creadas y su limpieza concurrente por niveles."""
+
+    def __init__(self, collections=COLLECTIONS, max_workers=LEDGER_WORKERS):
+        self.collections = collections
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._pinned = set()
+        self.failures = []
+        self.deleted = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    # --------------------------------------------------
+    # Registro
+    # --------------------------------------------------
+    def track(self, session):
+        """Registra las entidades que se creen o borren a través de `session`."""
+        if self._on_response not in session.hooks["response"]:
+            session.hooks["response"].append(self._on_response)
+        return session
+
+    def _on_response(self, response, **kwargs):
+        request = response.request
+        if request.method == "POST" and response.status_code in (200, 201):
+            collection_url = resource_url(request.url)
+            collection = self.collections.get(urlsplit(collection_url).path)
+            if collection is None:
+                return
+            try:
+                entity_id = response.json()[collection.id_field]
+            except (ValueError, KeyError, TypeError):
+                return
+            self.add(f"{collection_url}/{entity_id}", collection)
+        elif request.method == "DELETE" and response.status_code in (200, 204):
+            self.discard(request.url)
+
+    def add(self, url, collection):
+        url = resource_url(url)
+        with self._lock:
+            self._entries[url] = _Entry(url, collection, pinned=url in self._pinned)
+
+    def discard(self, url):
+        with self._lock:
+            self._entries.pop(resource_url(url), None)
+
+    def pin(self, url):
+        """Conserva la entidad hasta el final de la sesión (no se borra en checkpoint())."""
+        url = resource_url(url)
+        with self._lock:
+            self._pinned.add(url)
+            if url in self._entries:
+                self._entries[url].pinned = True
+
+    # --------------------------------------------------
+    # Limpieza
+    # --------------------------------------------------
+    def checkpoint(self, session, headers=None, timeout=10):
+        """Borra lo registrado hasta ahora, salvo las entidades fijadas."""
+        return self._flush(session, headers, timeout, include_pinned=False)
+
+    def flush(self, session, headers=None, timeout=10):
+        """
+        Borra todas las entidades registradas, hijos antes que padres.
+
+        Args:
+            session (requests.Session): Sesión con la que se hacen los DELETE.
+            headers (callable, optional): Devuelve los headers de autenticación.
+            timeout (float): Timeout de cada DELETE.
+
+        Returns:
+            list: Tuplas (tipo, url, motivo) de lo que no se pudo borrar en esta llamada.
+        """
+        return self._flush(session, headers, timeout, include_pinned=True)
+
+    def _flush(self, session, headers, timeout, include_pinned):
+        with self._lock:
+            entries = [entry for entry in self._entries.values() if include_pinned or not entry.pinned]
+            for entry in entries:
+                del self._entries[entry.url]
+        if not entries:
+            return []
+
+        auth = headers() if headers else {}
+        failures = []
+
+        def delete(entry):
+            try:
+                response = session.delete(entry.url, headers=auth, timeout=timeout)
+            except requests.exceptions.RequestException as e:
+                return entry, str(e)
+            if response.status_code in entry.collection.ok_statuses:
+                return entry, None
+            return entry, f"{response.status_code} {response.text[:200]}"
+
+        levels = sorted({entry.collection.level for entry in entries}, reverse=True)
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="ledger") as pool:
+            for level in levels:
+                batch = [entry for entry in entries if entry.collection.level == level]
+                for entry, error in pool.map(delete, batch):
+                    if error is None:
+                        self.deleted += 1
+                    else:
+                        failures.append((entry.kind, entry.url, error))
+
+        with self._lock:
+            self.failures.extend(failures)
+        return failures
+
+
+# Registro compartido por la sesión de pytest (ver conftest.py)
+ledger = ResourceLedger()
@@ -0,0 +1,191 @@
+import copy
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from cachetools import LRUCache
+
+# ======================================================
+# Caché de respuestas GET
+# ======================================================
+# Caché LRU con TTL para las lecturas idempotentes de
+# APIClient. Cuando una entrada vence y el servidor envió
+# un ETag, se revalida con If-None-Match en lugar de volver
+# a descargarla. Cualquier escritura (POST/PUT/PATCH/DELETE)
+# del mismo cliente invalida la colección afectada.
+# ======================================================
+
+# Métodos que modifican datos e invalidan la caché
+WRITE_METHODS = frozenset(["POST", "PUT", "PATCH", "DELETE"])
+
+
+class _CountingLRUCache(LRUCache):
+    """LRUCache que cuenta cuántas entradas se expulsaron por falta de espacio."""
+
+    def __init__(self, maxsize):
+        super().__init__(maxsize)
+        self.evictions = 0
+
+    def popitem(self):
+        self.evictions += 1
+        return super().popitem()
+
+    def clear(self):
+        # MutableMapping.clear() usa popitem(); vaciar la caché no es una expulsión
+        evictions = self.evictions
+        super().clear()
+        self.evictions = evictions
+
+
+class _CacheEntry:
+    __slots__ = ("response", "stored_at", "etag", "path")
+
+    def __init__(self, response, path):
+        self.response = response
+        self.stored_at = time.monotonic()
+        self.etag = response.headers.get("ETag")
+        self.path = path
+
+
+def collection_prefix(path):
+    """
+    Devuelve la colección a la que pertenece una ruta.
+
+    Ejemplo: "/bookings/BK1?x=1" → "/bookings".
+    """
+    segments = [s for s in urlsplit(path).path.split("/") if s]
+    return "/" + segments[0] if segments else "/"
+
+
+def _auth_identity(auth):
+    """Parte de la clave que corresponde al argumento `auth` de requests."""
+    if auth is None or isinstance(auth, tuple):
+        return auth
+    if hasattr(auth, "username") and hasattr(auth, "password"):
+        # HTTPBasicAuth, HTTPDigestAuth...
+        return (type(auth).__name__, auth.username, auth.password)
+    return (type(auth).__name__, id(auth))
+
+
+def request_key(url, params=None, headers=None, auth=None, cookies=None):
+    """
+    Identidad de un GET: host, ruta, query ordenada, todos los headers de la
+    request (Authorization, Accept...), credenciales `auth` y cookies.
+
+    La usan ResponseCache y single_flight.py. Los headers y cookies propios
+    de la sesión no forman parte de la clave: quien la comparte entre
+    sesiones debe agregar la identidad de la sesión.
+    """
+    prepared = requests.Request("GET", url, params=params).prepare()
+    parts = urlsplit(prepared.url)
+    query = "&".join(sorted(parts.query.split("&"))) if parts.query else ""
+    header_items = tuple(sorted((name.lower(), str(value)) for name, value in (headers or {}).items()))
+    cookie_items = tuple(sorted(dict(cookies or {}).items()))
+    return (parts.netloc, parts.path, query, header_items, _auth_identity(auth), cookie_items)
+
+
+class ResponseCache:
+    """
+    Caché de respuestas GET con expulsión LRU, TTL y revalidación por ETag.
+
+    Las claves combinan la URL completa (con query string ordenada), los
+    headers y las credenciales de la request (ver request_key()), para no
+    mezclar datos de distintos tokens o representaciones.
+    """
+
+    def __init__(self, maxsize=256, ttl=30.0):
+        """
+        Args:
+            maxsize (int): Número máximo de respuestas guardadas.
+            ttl (float): Segundos durante los que una respuesta se sirve sin consultar al servidor.
+        """
+        self.ttl = ttl
+        self._entries = _CountingLRUCache(maxsize)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def key(url, params=None, headers=None, auth=None, cookies=None):
+        """Construye la clave de caché de un GET."""
+        return request_key(url, params, headers, auth, cookies)
+
+    def lookup(self, key):
+        """
+        Busca una respuesta en caché.
+
+        Returns:
+            tuple: (respuesta, etag). Si la entrada está fresca devuelve la
+            respuesta y etag None; si está vencida pero tiene ETag devuelve
+            (None, etag) para revalidar; en otro caso (None, None).
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry.stored_at < self.ttl:
+                self.hits += 1
+                return copy.copy(entry.response), None
+            self.misses += 1
+            if entry is not None and entry.etag:
+                return None, entry.etag
+            return None, None
+
+    def store(self, key, response, path):
+        """
+        Guarda la respuesta si es un 200 cacheable.
+
+        Args:
+            key (tuple): Clave devuelta por ResponseCache.key().
+            response (requests.Response): Respuesta a guardar.
+            path (str): Ruta de la API (ej. "/flights"), usada para invalidar.
+        """
+        if response.status_code != 200 or "no-store" in response.headers.get("Cache-Control", ""):
+            return
+        response.content  # el body se lee ya para poder servirlo varias veces
+        with self._lock:
+            self._entries[key] = _CacheEntry(response, path)
+
+    def revalidated(self, key):
+        """
+        Marca como fresca una entrada tras un 304 Not Modified.
+
+        Returns:
+            requests.Response | None: Copia de la respuesta guardada.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            entry.stored_at = time.monotonic()
+            self.revalidations += 1
+            return copy.copy(entry.response)
+
+    def invalidate(self, path):
+        """Elimina todas las entradas de la colección a la que pertenece `path`."""
+        prefix = collection_prefix(path)
+        with self._lock:
+            stale = [
+                key for key, entry in self._entries.items()
+                if collection_prefix(entry.path) == prefix
+            ]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """dict: Contadores de aciertos, fallos, expulsiones, revalidaciones e invalidaciones."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self._entries.evictions,
+                "revalidations": self.revalidations,
+                "invalidations": self.invalidations,
+                "size": len(self._entries),
+            }
@@ -0,0 +1,293 @@
+import os
+import random
+import threading
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+
+import requests
+
+from endpoints import path_template
+
+# ======================================================
+# Política unificada de reintentos
+# ======================================================
+# Un único objeto decide si una request se reintenta y
+# cuánto esperar. Lo usan el adaptador HTTP de APIClient
+# (y por lo tanto `session_with_retries`) y AsyncAPIClient:
+#
+#   - Backoff exponencial con "decorrelated jitter".
+#   - Respeta `Retry-After` en respuestas 429/503.
+#   - Presupuesto global: los reintentos no pueden superar
+#     una fracción de las requests recientes.
+#   - Circuit breaker por endpoint: si el servidor está
+#     caído se falla de inmediato en lugar de insistir.
+# ======================================================
+
+# Intentos totales por request (el primero + reintentos)
+MAX_ATTEMPTS = int(os.getenv("API_RETRIES", "3"))
+
+# Espera base y máxima entre intentos (en segundos)
+BASE_DELAY = float(os.getenv("API_RETRY_BASE_DELAY", "0.5"))
+MAX_DELAY = float(os.getenv("API_RETRY_MAX_DELAY", "10"))
+
+# Fracción máxima de reintentos respecto a las requests de la ventana
+RETRY_BUDGET_RATIO = float(os.getenv("API_RETRY_BUDGET_RATIO", "0.2"))
+
+# Fallos consecutivos que abren el circuito y segundos que permanece abierto
+BREAKER_THRESHOLD = int(os.getenv("API_BREAKER_THRESHOLD", "5"))
+BREAKER_RESET = float(os.getenv("API_BREAKER_RESET", "30"))
+
+# Códigos HTTP que se consideran transitorios
+RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Se lanza sin tocar la red cuando el circuito del endpoint está abierto."""
+
+
+def parse_retry_after(value):
+    """
+    Interpreta el header Retry-After (segundos o fecha HTTP).
+
+    Returns:
+        float | None: Segundos a esperar, o None si el valor no es válido.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+# ======================================================
+# Presupuesto de reintentos
+# ======================================================
+
+class RetryBudget:
+    """
+    Limita los reintentos a `ratio` × requests de los últimos `window` segundos.
+
+    `min_retries` permite algunos reintentos aunque haya poco tráfico.
+    """
+
+    def __init__(self, ratio=RETRY_BUDGET_RATIO, min_retries=3, window=10.0):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self._lock = threading.Lock()
+        self._requests = deque()
+        self._retries = deque()
+
+    def _prune(self, now):
+        for events in (self._requests, self._retries):
+            while events and now - events[0] > self.window:
+                events.popleft()
+
+    def record_request(self):
+        now = time.monotonic()
+        with self._lock:
+            self._prune(now)
+            self._requests.append(now)
+
+    def try_acquire(self):
+        """Consume un reintento del presupuesto. Devuelve False si está agotado."""
+        now = time.monotonic()
+        with self._lock:
+            self._prune(now)
+            allowed = max(self.min_retries, self.ratio * len(self._requests))
+            if len(self._retries) >= allowed:
+                return False
+            self._retries.append(now)
+            return True
+
+
+# ======================================================
+# Circuit breaker
+# ======================================================
+
+class CircuitBreaker:
+    """
+    Circuit breaker de un endpoint: cerrado → abierto → semiabierto.
+
+    - Cerrado: las requests pasan; `threshold` fallos seguidos lo abren.
+    - Abierto: se rechaza todo durante `reset_timeout` segundos.
+    - Semiabierto: pasa una sola request de prueba; si funciona se cierra.
+      Si la prueba no informa su resultado (deadline, cancelación...), tras
+      otros `reset_timeout` segundos se deja pasar una nueva prueba.
+    """
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, threshold=BREAKER_THRESHOLD, reset_timeout=BREAKER_RESET):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """True si la request puede enviarse."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            now = time.monotonic()
+            if now - self.opened_at >= self.reset_timeout:
+                # OPEN → HALF_OPEN, o una prueba anterior que nunca informó su resultado
+                self.state = self.HALF_OPEN
+                self.opened_at = now
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+
+# ======================================================
+# Política y estado de una request
+# ======================================================
+
+class RetryPolicy:
+    """
+    Configuración y estado compartido (presupuesto y circuit breakers) de los reintentos.
+
+    Uso:
+        state = policy.start("GET", url)
+        while True:
+            try:
+                resp = enviar()
+            except requests.exceptions.RequestException as e:
+                delay = state.on_error(e)
+                if delay is None:
+                    raise
+            else:
+                delay = state.on_response(resp)
+                if delay is None:
+                    return resp
+            time.sleep(delay)
+    """
+
+    def __init__(self, max_attempts=MAX_ATTEMPTS, base_delay=BASE_DELAY, max_delay=MAX_DELAY,
+                 retry_statuses=RETRY_STATUSES, budget=None,
+                 breaker_threshold=BREAKER_THRESHOLD, breaker_reset=BREAKER_RESET):
+        """
+        Args:
+            max_attempts (int): Intentos totales por request.
+            base_delay (float): Espera mínima entre intentos (segundos).
+            max_delay (float): Espera máxima entre intentos; un Retry-After
+                mayor que este valor no se reintenta.
+            retry_statuses (iterable): Códigos HTTP que se reintentan.
+            budget (RetryBudget, optional): Presupuesto de reintentos.
+            breaker_threshold (int): Fallos seguidos que abren el circuito.
+            breaker_reset (float): Segundos que el circuito permanece abierto.
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = frozenset(retry_statuses)
+        self.budget = budget if budget is not None else RetryBudget()
+        self.breaker_threshold = breaker_threshold
+        self.breaker_reset = breaker_reset
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, endpoint):
+        """Devuelve (o crea) el circuit breaker de un endpoint."""
+        with self._lock:
+            breaker = self._breakers.get(endpoint)
+            if breaker is None:
+                breaker = CircuitBreaker(self.breaker_threshold, self.breaker_reset)
+                self._breakers[endpoint] = breaker
+            return breaker
+
+    def start(self, method, url):
+        """
+        Inicia el seguimiento de una request.
+
+        Raises:
+            CircuitOpenError: Si el circuito del endpoint está abierto.
+        """
+        parts = requests.utils.urlparse(url)
+        endpoint = f"{parts.netloc}{path_template(parts.path)}"
+        breaker = self.breaker(endpoint)
+        if not breaker.allow():
+            raise CircuitOpenError(f"Circuito abierto para {endpoint}: el servidor no responde")
+        self.budget.record_request()
+        return RetryState(self, breaker)
+
+    def next_delay(self, previous):
+        """Decorrelated jitter: aleatorio entre base y 3 × la espera anterior."""
+        return min(self.max_delay, random.uniform(self.base_delay, max(self.base_delay, previous * 3)))
+
+
+class RetryState:
+    """Estado de los reintentos de una única request."""
+
+    def __init__(self, policy, breaker):
+        self.policy = policy
+        self.breaker = breaker
+        self.attempt = 1
+        self._delay = policy.base_delay
+
+    def _retry_after(self, delay):
+        if self.attempt >= self.policy.max_attempts or not self.policy.budget.try_acquire():
+            return None
+        if not self.breaker.allow():
+            return None
+        self.attempt += 1
+        return delay
+
+    def on_response(self, response):
+        """
+        Registra una respuesta.
+
+        Returns:
+            float | None: Segundos a esperar antes de reintentar, o None si no se reintenta.
+        """
+        if response.status_code >= 500:
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+
+        if response.status_code not in self.policy.retry_statuses:
+            return None
+
+        self._delay = self.policy.next_delay(self._delay)
+        delay = self._delay
+        if response.status_code in (429, 503):
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                if retry_after > self.policy.max_delay:
+                    return None
+                delay = max(delay, retry_after)
+        return self._retry_after(delay)
+
+    def on_error(self, error):
+        """
+        Registra un error de red (conexión o timeout).
+
+        Returns:
+            float | None: Segundos a esperar antes de reintentar, o None si no se reintenta.
+        """
+        self.breaker.record_failure()
+        self._delay = self.policy.next_delay(self._delay)
+        return self._retry_after(self._delay)
+
+
+# Política compartida: un solo presupuesto y un breaker por endpoint para todo el proceso
+default_policy = RetryPolicy()
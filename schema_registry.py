@@ -0,0 +1,108 @@
+import os
+import threading
+
+# ======================================================
+# Registro de validadores JSON Schema precompilados
+# ======================================================
+# `jsonschema.validate()` revisa el esquema y construye un
+# validador nuevo en cada llamada. Aquí cada esquema se
+# compila una sola vez y el validador queda en caché, ya sea
+# por identidad del dict del esquema o por nombre.
+#
+# `jsonschema` se importa recién al compilar el primer
+# esquema: registrar esquemas al importar los módulos de
+# tests no tiene costo (ver import_benchmark.py).
+# ======================================================
+
+# Verificación de `format` (email, date, time...). Desactivada por defecto,
+# igual que `jsonschema.validate()`; se activa con API_SCHEMA_FORMATS=1.
+CHECK_FORMATS = os.getenv("API_SCHEMA_FORMATS", "0") == "1"
+
+
+class SchemaRegistry:
+    """Caché thread-safe de validadores compilados, por identidad o por nombre."""
+
+    def __init__(self, check_formats=CHECK_FORMATS):
+        """
+        Args:
+            check_formats (bool): Si es True, los validadores verifican `format`
+                con el FormatChecker de la versión del esquema.
+        """
+        self.check_formats = check_formats
+        self._lock = threading.Lock()
+        # id(schema) -> (schema, validador); se guarda el schema para que su id no se reutilice
+        self._by_identity = {}
+        self._by_name = {}
+
+    def _compile(self, schema):
+        from jsonschema import validators
+
+        cls = validators.validator_for(schema)
+        cls.check_schema(schema)
+        format_checker = cls.FORMAT_CHECKER if self.check_formats else None
+        return cls(schema, format_checker=format_checker)
+
+    def register(self, name, schema):
+        """
+        Registra un esquema bajo un nombre. Se compila la primera vez que se usa.
+
+        Returns:
+            dict: El mismo esquema.
+        """
+        with self._lock:
+            self._by_name[name] = schema
+        return schema
+
+    def validator_for(self, schema):
+        """
+        Devuelve el validador compilado de un esquema (dict) o de un nombre registrado.
+
+        Raises:
+            KeyError: Si se pasa un nombre que no fue registrado.
+        """
+        if isinstance(schema, str):
+            schema = self._by_name[schema]
+
+        entry = self._by_identity.get(id(schema))
+        if entry is not None and entry[0] is schema:
+            return entry[1]
+
+        validator = self._compile(schema)
+        with self._lock:
+            self._by_identity[id(schema)] = (schema, validator)
+        return validator
+
+    def validate(self, instance, schema):
+        """
+        Valida `instance` con el validador en caché.
+
+        Raises:
+            jsonschema.ValidationError: El error más relevante, igual que jsonschema.validate().
+        """
+        from jsonschema.exceptions import best_match
+
+        error = best_match(self.validator_for(schema).iter_errors(instance))
+        if error is not None:
+            raise error
+
+
+def __getattr__(name):
+    # `schema_registry.ValidationError` sin importar jsonschema hasta que se usa
+    if name == "ValidationError":
+        from jsonschema import ValidationError
+        return ValidationError
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Registro compartido por api_client y los módulos tests/*/test_schema_*.py
+registry = SchemaRegistry()
+
+
+def register_schema(name, schema):
+    """Registra un esquema en el registro compartido y devuelve el esquema."""
+    return registry.register(name, schema)
+
+
+def validate(instance, schema):
+    """Reemplazo de `jsonschema.validate` que usa validadores en caché."""
+    registry.validate(instance, schema)
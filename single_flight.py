@@ -0,0 +1,136 @@
+import asyncio
+import copy
+import threading
+
+# ======================================================
+# Coalescencia de GETs idénticos en vuelo (single-flight)
+# ======================================================
+# Si varios hilos (o tareas asyncio) piden el mismo GET a la
+# vez, solo el primero ("líder") llega al servidor; el resto
+# espera y recibe una copia de su respuesta, o la misma
+# excepción si falló. Las claves son las de ResponseCache
+# (host, ruta, query ordenada, headers y credenciales) más
+# la identidad de la sesión, porque el grupo por defecto lo
+# comparten todos los APIClient del proceso.
+# ======================================================
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+def share_response(response):
+    """Copia superficial de una respuesta con el body ya leído, para entregarla a otro llamador."""
+    return copy.copy(response)
+
+
+class SingleFlight:
+    """Agrupa llamadas concurrentes con la misma clave en una sola ejecución (hilos)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    def do(self, key, fn, deadline=None):
+        """
+        Ejecuta `fn()` salvo que ya haya una llamada en vuelo con la misma clave.
+
+        Args:
+            key (hashable): Identidad de la llamada.
+            fn (callable): Función sin argumentos que hace el trabajo real.
+            deadline (Deadline, optional): Presupuesto del test en curso (ver
+                deadline.py); quien espera no lo hace más allá de su vencimiento.
+
+        Returns:
+            tuple: (resultado, compartido). `compartido` es True si el resultado
+            lo obtuvo otra llamada en vuelo.
+
+        Raises:
+            Exception: La excepción de `fn`, también para quienes esperaban.
+            DeadlineExceeded: Si el presupuesto vence mientras se espera.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            remaining = deadline.remaining() if deadline is not None else None
+            if not call.done.wait(None if remaining is None else max(0.0, remaining)):
+                raise deadline.error("esperando un GET idéntico en vuelo")
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def stats(self):
+        """dict: Llamadas ejecutadas, coalescidas y en vuelo."""
+        with self._lock:
+            return {"executed": self.executed, "coalesced": self.coalesced, "in_flight": len(self._calls)}
+
+
+class AsyncSingleFlight:
+    """Versión asyncio de SingleFlight; debe usarse desde un único event loop."""
+
+    def __init__(self):
+        self._calls = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    async def do(self, key, fn):
+        """
+        Igual que SingleFlight.do, pero `fn` es una función que devuelve una corrutina.
+
+        Si la tarea líder se cancela, quienes esperaban reciben CancelledError.
+        """
+        future = self._calls.get(key)
+        if future is not None:
+            self.coalesced += 1
+            # shield: cancelar a quien espera no cancela la llamada compartida
+            return await asyncio.shield(future), True
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        self.executed += 1
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # evita el aviso "exception was never retrieved" si nadie esperaba
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            del self._calls[key]
+        return result, False
+
+    def stats(self):
+        return {"executed": self.executed, "coalesced": self.coalesced, "in_flight": len(self._calls)}
+
+
+# Grupo compartido por todos los APIClient del proceso
+default_group = SingleFlight()
@@ -0,0 +1,688 @@
+"""
+API de aerolíneas en memoria para correr la suite en local.
+
+Implementa los endpoints que usan los tests (/auth, /users, /airports,
+/airlines, /flights, /bookings y /health) siguiendo los escenarios de
+`casos_de_prueba/automatizacion_Aerolíneas.feature` y los esquemas de
+`tests/*/test_schema_*.py`. Es una aplicación WSGI: StandInServer la
+sirve por HTTP en un puerto libre, y también puede montarse sin sockets.
+
+Uso:
+    python standin_api.py --port 8000 --latency 0.05 --error-rate 0.1
+"""
+
+import argparse
+import base64
+import hashlib
+import hmac
+import json
+import os
+import random
+import re
+import threading
+import time
+import uuid
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from urllib.parse import parse_qs, unquote
+
+# ======================================================
+# Configuración
+# ======================================================
+
+# Credenciales del administrador sembrado (las mismas que usa conftest.py)
+ADMIN_USER = os.getenv("ADMIN_USER", "admin@demo.com")
+ADMIN_PASS = os.getenv("ADMIN_PASS", "admin123")
+
+# Vigencia de los tokens emitidos (en segundos)
+TOKEN_TTL = 3600
+
+# Clave fija de firma: los tokens siguen siendo válidos si el servidor se
+# reinicia (la caché de tokens de token_cache.py puede reutilizarlos)
+_SECRET = b"standin-airline-api"
+
+# Tope de `limit` en los listados paginados
+MAX_LIMIT = 100
+
+_IATA = re.compile(r"^[A-Z]{3}$")
+
+HTTP_STATUS = {
+    200: "200 OK", 201: "201 Created", 204: "204 No Content",
+    400: "400 Bad Request", 401: "401 Unauthorized", 404: "404 Not Found",
+    405: "405 Method Not Allowed", 422: "422 Unprocessable Entity",
+    429: "429 Too Many Requests", 500: "500 Internal Server Error",
+    502: "502 Bad Gateway", 503: "503 Service Unavailable", 504: "504 Gateway Timeout",
+}
+
+
+class HTTPError(Exception):
+    """Error que el handler convierte en una respuesta {"detail": ...}."""
+
+    def __init__(self, status, detail):
+        super().__init__(detail)
+        self.status = status
+        self.detail = detail
+
+
+# ======================================================
+# Tokens
+# ======================================================
+
+def _b64(data):
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def issue_token(email, ttl=TOKEN_TTL):
+    """Emite un JWT HS256 con `sub` y `exp` (token_cache.py lee `exp`)."""
+    header = _b64(json.dumps({"alg": "HS256", "typ": "JWT"}).encode())
+    payload = _b64(json.dumps({"sub": email, "exp": int(time.time() + ttl)}).encode())
+    signature = hmac.new(_SECRET, f"{header}.{payload}".encode(), hashlib.sha256).digest()
+    return f"{header}.{payload}.{_b64(signature)}"
+
+
+def verify_token(token):
+    """
+    Verifica firma y vencimiento de un token.
+
+    Returns:
+        str | None: Email del usuario, o None si el token no es válido.
+    """
+    try:
+        header, payload, signature = token.split(".")
+        expected = hmac.new(_SECRET, f"{header}.{payload}".encode(), hashlib.sha256).digest()
+        if not hmac.compare_digest(_b64(expected), signature):
+            return None
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    except (ValueError, TypeError):
+        return None
+    if claims.get("exp", 0) < time.time():
+        return None
+    return claims.get("sub")
+
+
+# ======================================================
+# Aplicación WSGI
+# ======================================================
+
+class _Request:
+    __slots__ = ("method", "path", "params", "body", "user")
+
+    def __init__(self, method, path, params, body):
+        self.method = method
+        self.path = path
+        self.params = params
+        self.body = body
+        self.user = None
+
+
+def _new_id(prefix=""):
+    return prefix + uuid.uuid4().hex[:8]
+
+
+def _page(items, params):
+    """Aplica `skip`/`limit` de la query a un listado."""
+    try:
+        skip = max(0, int(params.get("skip", 0)))
+        limit = params.get("limit")
+        limit = None if limit is None else max(0, min(int(limit), MAX_LIMIT))
+    except ValueError:
+        raise HTTPError(422, "skip y limit deben ser enteros")
+    return items[skip:] if limit is None else items[skip:skip + limit]
+
+
+class AirlineAPI:
+    """
+    Aplicación WSGI con los datos en memoria y fallas inyectables.
+
+    - `latency`: segundos de demora por request, o (mínimo, máximo).
+    - `error_rate`: probabilidad de responder `error_status` en lugar de atender.
+    - `fail_next(n)`: las próximas n requests fallan (útil en tests).
+    """
+
+    def __init__(self, admin_user=ADMIN_USER, admin_pass=ADMIN_PASS, latency=0.0, error_rate=0.0,
+                 error_status=503, seed=None):
+        """
+        Args:
+            admin_user (str): Email del administrador sembrado.
+            admin_pass (str): Contraseña del administrador.
+            latency (float | tuple): Demora fija o rango (mínimo, máximo) en segundos.
+            error_rate (float): Probabilidad (0-1) de inyectar un error.
+            error_status (int): Código de los errores inyectados.
+            seed (int, optional): Semilla para que la inyección sea reproducible.
+        """
+        self.admin_user = admin_user
+        self.admin_pass = admin_pass
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self._random = random.Random(seed)
+        self._forced_failures = 0
+        self._lock = threading.RLock()
+        self.requests = 0
+        routes = [
+            ("GET", r"/", self.health),
+            ("GET", r"/health", self.health),
+            ("POST", r"/auth/login", self.login),
+            ("POST", r"/auth/signup", self.signup),
+            ("GET", r"/users", self.list_users),
+            ("POST", r"/users", self.create_user),
+            ("GET", r"/users/(?P<id>[^/]+)", self.get_user),
+            ("DELETE", r"/users/(?P<id>[^/]+)", self.delete_user),
+            ("GET", r"/airports", self.list_airports),
+            ("POST", r"/airports", self.create_airport),
+            ("GET", r"/airports/(?P<id>[^/]+)", self.get_airport),
+            ("PUT", r"/airports/(?P<id>[^/]+)", self.update_airport),
+            ("DELETE", r"/airports/(?P<id>[^/]+)", self.delete_airport),
+            ("GET", r"/airlines", self.list_airlines),
+            ("POST", r"/airlines", self.create_airline),
+            ("GET", r"/airlines/(?P<id>[^/]+)", self.get_airline),
+            ("PUT", r"/airlines/(?P<id>[^/]+)", self.update_airline),
+            ("DELETE", r"/airlines/(?P<id>[^/]+)", self.delete_airline),
+            ("GET", r"/flights", self.list_flights),
+            ("POST", r"/flights", self.create_flight),
+            ("GET", r"/flights/(?P<id>[^/]+)", self.get_flight),
+            ("PUT", r"/flights/(?P<id>[^/]+)", self.update_flight),
+            ("DELETE", r"/flights/(?P<id>[^/]+)", self.delete_flight),
+            ("GET", r"/bookings", self.list_bookings),
+            ("POST", r"/bookings", self.create_booking),
+            ("GET", r"/bookings/(?P<id>[^/]+)", self.get_booking),
+            ("DELETE", r"/bookings/(?P<id>[^/]+)", self.cancel_booking),
+        ]
+        self._routes = [(method, re.compile(pattern + "$"), handler) for method, pattern, handler in routes]
+        self.reset()
+
+    # --------------------------------------------------
+    # Datos y fallas
+    # --------------------------------------------------
+    def reset(self):
+        """Vuelve a los datos sembrados."""
+        with self._lock:
+            self.passwords = {self.admin_user: self.admin_pass}
+            self.users = {
+                "1": {"id": "1", "email": self.admin_user, "full_name": "Admin", "role": "admin"},
+            }
+            for i in range(2, 26):
+                self.users[str(i)] = {
+                    "id": str(i), "email": f"passenger{i}@demo.com",
+                    "full_name": f"Passenger {i}", "role": "passenger",
+                }
+            self.airports = {
+                code: {"iata_code": code, "city": city, "country": country}
+                for code, city, country in [
+                    ("JFK", "New York", "USA"), ("LAX", "Los Angeles", "USA"), ("MEX", "Ciudad de México", "México"),
+                ]
+            }
+            self.airlines = {
+                "123": {"id": "123", "name": "Sky Airlines", "country": "USA", "logo": "sky-logo.png",
+                        "slogan": "Fly with us", "head_quaters": "New York", "website": "sky.com",
+                        "established": "1990-01-01"},
+            }
+            self.flights = {
+                "FL456": {"id": "FL456", "name": "SKY456", "from": "JFK", "to": "LAX", "departure": "08:00",
+                          "arrival": "11:30", "duration": 3.5, "stops": 0, "price": 299.99,
+                          "airline_id": "123", "date": "2024-03-15"},
+                "FL457": {"id": "FL457", "name": "SKY457", "from": "LAX", "to": "MEX", "departure": "13:00",
+                          "arrival": "18:15", "duration": 3.25, "stops": 1, "price": 650.0,
+                          "airline_id": "123"},
+            }
+            self.bookings = {
+                "BK789": {"id": "BK789", "flight_id": "FL456", "passenger_name": "John",
+                          "passenger_email": "john@email.com", "seat": "15A", "class": "economy",
+                          "status": "confirmed"},
+                "BK790": {"id": "BK790", "flight_id": "FL456", "passenger_name": "Jane",
+                          "passenger_email": "jane@email.com", "seat": "15B", "class": "business",
+                          "status": "cancelled"},
+            }
+
+    def configure(self, latency=None, error_rate=None, error_status=None):
+        """Cambia la inyección de latencia/errores en caliente."""
+        if latency is not None:
+            self.latency = latency
+        if error_rate is not None:
+            self.error_rate = error_rate
+        if error_status is not None:
+            self.error_status = error_status
+
+    def fail_next(self, count=1, status=None):
+        """Hace fallar las próximas `count` requests (con `status` o error_status)."""
+        with self._lock:
+            self._forced_failures = count
+            if status is not None:
+                self.error_status = status
+
+    def _injected_failure(self):
+        with self._lock:
+            self.requests += 1
+            if self._forced_failures > 0:
+                self._forced_failures -= 1
+                return True
+            return self.error_rate > 0 and self._random.random() < self.error_rate
+
+    def _delay(self):
+        latency = self.latency
+        if isinstance(latency, (tuple, list)):
+            latency = self._random.uniform(*latency)
+        if latency:
+            time.sleep(latency)
+
+    # --------------------------------------------------
+    # Punto de entrada WSGI
+    # --------------------------------------------------
+    def __call__(self, environ, start_response):
+        self._delay()
+        headers = [("Content-Type", "application/json")]
+        try:
+            if self._injected_failure():
+                if self.error_status in (429, 503):
+                    headers.append(("Retry-After", "0"))
+                raise HTTPError(self.error_status, "Error inyectado por el servidor local")
+            status, payload = self._dispatch(environ)
+        except HTTPError as e:
+            status, payload = e.status, {"detail": e.detail}
+
+        body = b"" if status == 204 else json.dumps(payload).encode()
+        headers.append(("Content-Length", str(len(body))))
+        start_response(HTTP_STATUS.get(status, f"{status} Error"), headers)
+        return [body]
+
+    def _dispatch(self, environ):
+        method = environ["REQUEST_METHOD"].upper()
+        path = unquote(environ.get("PATH_INFO") or "/")
+        if len(path) > 1:
+            path = path.rstrip("/")
+        params = {k: v[0] for k, v in parse_qs(environ.get("QUERY_STRING", "")).items()}
+        request = _Request(method, path, params, self._read_body(environ))
+
+        allowed = False
+        for route_method, pattern, handler in self._routes:
+            match = pattern.match(path)
+            if match is None:
+                continue
+            allowed = True
+            if route_method != method:
+                continue
+            if not path.startswith("/auth") and path not in ("/", "/health"):
+                self._authenticate(request, environ)
+            with self._lock:
+                return handler(request, **match.groupdict())
+        if allowed:
+            raise HTTPError(405, "Method Not Allowed")
+        raise HTTPError(404, "Not Found")
+
+    @staticmethod
+    def _read_body(environ):
+        try:
+            length = int(environ.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            length = 0
+        raw = environ["wsgi.input"].read(length) if length else b""
+        if not raw:
+            return {}
+        if "application/x-www-form-urlencoded" in environ.get("CONTENT_TYPE", ""):
+            return {k: v[0] for k, v in parse_qs(raw.decode("utf-8"), keep_blank_values=True).items()}
+        try:
+            body = json.loads(raw)
+        except ValueError:
+            raise HTTPError(422, "JSON inválido")
+        if not isinstance(body, dict):
+            raise HTTPError(422, "Se esperaba un objeto JSON")
+        return body
+
+    def _authenticate(self, request, environ):
+        auth = environ.get("HTTP_AUTHORIZATION", "")
+        email = verify_token(auth[7:]) if auth.startswith("Bearer ") else None
+        if email is None:
+            raise HTTPError(401, "Not authenticated")
+        request.user = email
+
+    # --------------------------------------------------
+    # Health y autenticación
+    # --------------------------------------------------
+    def health(self, request):
+        return 200, {"status": "ok"}
+
+    def login(self, request):
+        email = request.body.get("username", "")
+        if not email or self.passwords.get(email) != request.body.get("password"):
+            raise HTTPError(401, "Incorrect username or password")
+        return 200, {"access_token": issue_token(email), "token_type": "bearer"}
+
+    def signup(self, request):
+        user = self._new_user(request.body, default_role="passenger")
+        return 200, user
+
+    # --------------------------------------------------
+    # Usuarios
+    # --------------------------------------------------
+    def _new_user(self, data, default_role):
+        email = data.get("email")
+        if not email or "@" not in email or not data.get("password"):
+            raise HTTPError(400, "email and password are required fields")
+        if email in self.passwords:
+            raise HTTPError(400, "Email already registered")
+        role = data.get("role", default_role)
+        if role not in ("passenger", "admin"):
+            raise HTTPError(400, f"Invalid role: {role}")
+        user = {"id": _new_id(), "email": email, "full_name": data.get("full_name", ""), "role": role}
+        self.users[user["id"]] = user
+        self.passwords[email] = data["password"]
+        return dict(user)
+
+    def list_users(self, request):
+        return 200, _page(list(self.users.values()), request.params)
+
+    def create_user(self, request):
+        return 201, self._new_user(request.body, default_role="passenger")
+
+    def get_user(self, request, id):
+        return 200, self._get(self.users, id, "User")
+
+    def delete_user(self, request, id):
+        user = self._get(self.users, id, "User")
+        del self.users[id]
+        self.passwords.pop(user["email"], None)
+        return 204, None
+
+    # --------------------------------------------------
+    # Aeropuertos
+    # --------------------------------------------------
+    @staticmethod
+    def _airport_fields(data):
+        code = data.get("iata_code", "")
+        if not _IATA.match(code):
+            raise HTTPError(400, "iata_code must be 3 uppercase letters")
+        missing = [field for field in ("city", "country") if not data.get(field)]
+        if missing:
+            raise HTTPError(400, f"Missing required fields: {', '.join(missing)}")
+        return {"iata_code": code, "city": data["city"], "country": data["country"]}
+
+    def list_airports(self, request):
+        return 200, _page(list(self.airports.values()), request.params)
+
+    def create_airport(self, request):
+        airport = self._airport_fields(request.body)
+        if airport["iata_code"] in self.airports:
+            raise HTTPError(400, f"Airport {airport['iata_code']} already exists")
+        self.airports[airport["iata_code"]] = airport
+        return 201, dict(airport)
+
+    def get_airport(self, request, id):
+        return 200, self._get(self.airports, id, "Airport")
+
+    def update_airport(self, request, id):
+        self._get(self.airports, id, "Airport")
+        airport = self._airport_fields(dict(request.body, iata_code=id))
+        self.airports[id] = airport
+        return 200, dict(airport)
+
+    def delete_airport(self, request, id):
+        self._get(self.airports, id, "Airport")
+        del self.airports[id]
+        return 204, None
+
+    # --------------------------------------------------
+    # Aerolíneas
+    # --------------------------------------------------
+    @staticmethod
+    def _check_airline(airline):
+        missing = [field for field in ("name", "country") if not airline.get(field)]
+        if missing:
+            raise HTTPError(400, f"Missing required fields: {', '.join(missing)}")
+        established = airline.get("established")
+        if established is not None:
+            try:
+                date.fromisoformat(established)
+            except (TypeError, ValueError):
+                raise HTTPError(400, f"Invalid date format for 'established': {established!r} (expected YYYY-MM-DD)")
+
+    def list_airlines(self, request):
+        return 200, _page(list(self.airlines.values()), request.params)
+
+    def create_airline(self, request):
+        airline = dict(request.body)
+        airline["id"] = str(airline.get("id") or _new_id())
+        self._check_airline(airline)
+        if airline["id"] in self.airlines:
+            raise HTTPError(400, f"Airline {airline['id']} already exists")
+        self.airlines[airline["id"]] = airline
+        return 201, dict(airline)
+
+    def get_airline(self, request, id):
+        return 200, self._get(self.airlines, id, "Airline")
+
+    def update_airline(self, request, id):
+        airline = dict(self._get(self.airlines, id, "Airline"), **request.body, id=id)
+        self._check_airline(airline)
+        self.airlines[id] = airline
+        return 200, dict(airline)
+
+    def delete_airline(self, request, id):
+        self._get(self.airlines, id, "Airline")
+        del self.airlines[id]
+        return 200, {"message": "Airline deleted", "id": id}
+
+    # --------------------------------------------------
+    # Vuelos
+    # --------------------------------------------------
+    FLIGHT_FIELDS = ("name", "from", "to", "departure", "arrival", "duration", "stops", "price", "airline_id")
+
+    def _check_flight(self, flight):
+        missing = [field for field in self.FLIGHT_FIELDS if flight.get(field) in (None, "")]
+        if missing:
+            raise HTTPError(400, f"Missing required fields: {', '.join(missing)}")
+        for field in ("from", "to"):
+            if not _IATA.match(str(flight[field])):
+                raise HTTPError(400, f"Field '{field}' must be a 3-letter IATA code")
+        if not isinstance(flight["stops"], int) or flight["stops"] < 0:
+            raise HTTPError(400, "Field 'stops' must be a non-negative integer")
+        if not isinstance(flight["price"], (int, float)) or flight["price"] < 0:
+            raise HTTPError(400, "Field 'price' must be a non-negative number")
+        if "date" in flight:
+            try:
+                date.fromisoformat(flight["date"])
+            except (TypeError, ValueError):
+                raise HTTPError(400, f"Invalid date format: {flight['date']!r} (expected YYYY-MM-DD)")
+        if flight["airline_id"] not in self.airlines:
+            raise HTTPError(422, f"Airline {flight['airline_id']} not found")
+
+    def list_flights(self, request):
+        params = request.params
+        try:
+            min_price = float(params["minPrice"]) if "minPrice" in params else None
+            max_price = float(params["maxPrice"]) if "maxPrice" in params else None
+        except ValueError:
+            raise HTTPError(422, "minPrice y maxPrice deben ser números")
+        flights = [
+            flight for flight in self.flights.values()
+            if ("from" not in params or flight["from"] == params["from"])
+            and ("to" not in params or flight["to"] == params["to"])
+            and ("date" not in params or flight.get("date") == params["date"])
+            and (min_price is None or flight["price"] >= min_price)
+            and (max_price is None or flight["price"] <= max_price)
+        ]
+        return 200, _page(flights, params)
+
+    def create_flight(self, request):
+        allowed = set(self.FLIGHT_FIELDS) | {"id", "date"}
+        flight = {key: value for key, value in request.body.items() if key in allowed}
+        flight["id"] = str(flight.get("id") or _new_id("FL"))
+        self._check_flight(flight)
+        if flight["id"] in self.flights:
+            raise HTTPError(400, f"Flight {flight['id']} already exists")
+        self.flights[flight["id"]] = flight
+        return 201, dict(flight)
+
+    def get_flight(self, request, id):
+        return 200, self._get(self.flights, id, "Flight")
+
+    def update_flight(self, request, id):
+        allowed = set(self.FLIGHT_FIELDS) | {"date"}
+        changes = {key: value for key, value in request.body.items() if key in allowed}
+        flight = dict(self._get(self.flights, id, "Flight"), **changes)
+        self._check_flight(flight)
+        self.flights[id] = flight
+        return 200, dict(flight)
+
+    def delete_flight(self, request, id):
+        self._get(self.flights, id, "Flight")
+        del self.flights[id]
+        return 200, {"message": "Flight deleted", "id": id}
+
+    # --------------------------------------------------
+    # Reservas
+    # --------------------------------------------------
+    def list_bookings(self, request):
+        return 200, _page(list(self.bookings.values()), request.params)
+
+    def create_booking(self, request):
+        data = request.body
+        fields = ("flight_id", "passenger_name", "passenger_email", "seat", "class")
+        missing = [field for field in fields if not data.get(field)]
+        if missing:
+            raise HTTPError(400, f"Missing required fields: {', '.join(missing)}")
+        if data["flight_id"] not in self.flights:
+            raise HTTPError(400, f"Flight {data['flight_id']} not found")
+        if data["class"] not in ("economy", "business", "first"):
+            raise HTTPError(400, f"Invalid class: {data['class']}")
+        booking = {field: data[field] for field in fields}
+        booking["id"] = _new_id("BK")
+        booking["status"] = "confirmed"
+        self.bookings[booking["id"]] = booking
+        return 201, dict(booking)
+
+    def get_booking(self, request, id):
+        return 200, self._get(self.bookings, id, "Booking")
+
+    def cancel_booking(self, request, id):
+        booking = self.bookings.get(id)
+        if booking is None:
+            raise HTTPError(404, f"Booking {id} not found")
+        if booking["status"] == "cancelled":
+            raise HTTPError(400, f"Booking {id} is already cancelled")
+        booking["status"] = "cancelled"
+        return 200, dict(booking)
+
+    @staticmethod
+    def _get(collection, key, name):
+        item = collection.get(key)
+        if item is None:
+            raise HTTPError(404, f"{name} {key} not found")
+        return dict(item)
+
+
+# ======================================================
+# Servidor HTTP local
+# ======================================================
+
+class _WSGIHandler(BaseHTTPRequestHandler):
+    """Handler HTTP/1.1 keep-alive que delega cada request en una app WSGI."""
+
+    protocol_version = "HTTP/1.1"
+    app = None
+
+    def _handle(self):
+        path, _, query = self.path.partition("?")
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        environ = {
+            "REQUEST_METHOD": self.command,
+            "PATH_INFO": path,
+            "QUERY_STRING": query,
+            "CONTENT_TYPE": self.headers.get("Content-Type", ""),
+            "CONTENT_LENGTH": str(len(body)),
+            "SERVER_NAME": self.server.server_address[0],
+            "SERVER_PORT": str(self.server.server_address[1]),
+            "SERVER_PROTOCOL": self.request_version,
+            "wsgi.version": (1, 0),
+            "wsgi.url_scheme": "http",
+            "wsgi.input": BytesIO(body),
+            "wsgi.errors": BytesIO(),
+            "wsgi.multithread": True,
+            "wsgi.multiprocess": False,
+            "wsgi.run_once": False,
+        }
+        for name, value in self.headers.items():
+            key = "HTTP_" + name.upper().replace("-", "_")
+            if key not in ("HTTP_CONTENT_TYPE", "HTTP_CONTENT_LENGTH"):
+                environ[key] = value
+
+        response = {}
+
+        def start_response(status, headers, exc_info=None):
+            response["status"] = status
+            response["headers"] = headers
+
+        payload = b"".join(self.app(environ, start_response))
+        self.send_response(int(response["status"].split()[0]))
+        for name, value in response["headers"]:
+            if name.lower() != "content-length":
+                self.send_header(name, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+    def log_message(self, *args):
+        pass
+
+
+class StandInServer:
+    """Sirve una app WSGI (por defecto AirlineAPI) en un hilo, en un puerto libre."""
+
+    def __init__(self, app=None, host="127.0.0.1", port=0):
+        """
+        Args:
+            app (callable, optional): Aplicación WSGI. Por defecto una AirlineAPI nueva.
+            host (str): Interfaz donde escuchar.
+            port (int): Puerto; 0 elige uno libre.
+        """
+        self.app = app if app is not None else AirlineAPI()
+        handler = type("Handler", (_WSGIHandler,), {"app": self.app})
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="API de aerolíneas en memoria")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.0, help="demora por request (s)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="probabilidad de error 0-1")
+    parser.add_argument("--error-status", type=int, default=503)
+    args = parser.parse_args(argv)
+
+    app = AirlineAPI(latency=args.latency, error_rate=args.error_rate, error_status=args.error_status)
+    server = StandInServer(app, host=args.host, port=args.port).start()
+    print(f"API local escuchando en {server.url} (Ctrl+C para salir)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
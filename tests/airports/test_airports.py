@@ -2,79 +2,40 @@
 # Archivo: test_airports.py
 # Descripción:
 #   Conjunto de pruebas automatizadas con pytest para la API
-#   de aeropuertos. Incluye creación con reintentos, consulta,
-#   actualización y eliminación de aeropuertos.
+#   de aeropuertos. Incluye consulta, actualización y
+#   eliminación de aeropuertos creados por la fábrica de
+#   entidades (entity_factory.py).
 # -----------------------------------------------------------
 
 import pytest
-from jsonschema import validate
+from schema_registry import validate
 from tests.airports.test_schema_airports import airport_schema  # Esquema esperado de un aeropuerto
-import random
-import string
-from requests.exceptions import RetryError
+from requests.exceptions import RequestException
+from entity_factory import EntityCreationError
 
 
 # -----------------------------------------------------------
-# Función auxiliar: generar código IATA único
+# Pool de aeropuertos del módulo
 # -----------------------------------------------------------
-def unique_iata():
-    """Genera un código IATA válido y único (3 letras mayúsculas)."""
-    return ''.join(random.choices(string.ascii_uppercase, k=3))
-
-
-# -----------------------------------------------------------
-# Función auxiliar: creación de aeropuerto con reintentos
-# -----------------------------------------------------------
-def create_airport_with_retry(base_url, auth_headers, session_with_retries, max_attempts=3):
+@pytest.fixture(scope="module", autouse=True)
+def airport_pool(entities):
     """
-    Intenta crear un aeropuerto con reintentos para evitar
-    fallos por códigos IATA ya existentes.
-
-    Parámetros:
-      - base_url: URL base de la API
-      - auth_headers: headers de autenticación
-      - session_with_retries: sesión HTTP con reintentos
-      - max_attempts: número máximo de intentos (default=3)
-
-    Retorna:
-      - JSON del aeropuerto creado si es exitoso
+    Crea en paralelo, antes del primer test, los aeropuertos mutables
+    que usan los tests del módulo (fixture `airport`). Los códigos IATA
+    ya existentes se reintentan dentro de la fábrica.
     """
-    for attempt in range(max_attempts):
-        data = {
-            "iata_code": unique_iata(),
-            "city": "Test City",
-            "country": "Test Country"
-        }
-
-        response = session_with_retries.post(
-            f"{base_url}/airports",
-            json=data,
-            headers=auth_headers,
-            timeout=10
-        )
-
-        # Caso exitoso
-        if response.status_code in [201, 200]:
-            return response.json()
-        # Caso de código IATA ya existente -> reintentar
-        elif response.status_code == 400 and 'exists' in response.text:
-            continue
-        # Cualquier otro error inesperado
-        else:
-            pytest.fail(f"Error inesperado al crear aeropuerto: {response.text}")
-
-    # Si después de los intentos no se pudo crear, fallar la prueba
-    pytest.fail("No se pudo crear un aeropuerto después de 3 intentos")
+    try:
+        entities.prefill("airport", 2)
+    except (EntityCreationError, RequestException):
+        pass  # cada test vuelve a intentarlo al pedir su aeropuerto
 
 
 # -----------------------------------------------------------
 # TEST: Obtener aeropuerto por código
 # -----------------------------------------------------------
-def test_get_airport_by_code(base_url, auth_headers, session_with_retries):
+def test_get_airport_by_code(base_url, auth_headers, session_with_retries, shared_airport):
     """Valida la consulta de un aeropuerto específico por su código IATA."""
-    # Crear aeropuerto con reintentos
-    airport = create_airport_with_retry(base_url, auth_headers, session_with_retries)
-    code = airport["iata_code"]
+    code = shared_airport["iata_code"]
 
     # Consultar aeropuerto recién creado
     response = session_with_retries.get(
@@ -93,9 +54,8 @@ def test_get_airport_by_code(base_url, auth_headers, session_with_retries):
 # -----------------------------------------------------------
 # TEST: Actualizar aeropuerto existente
 # -----------------------------------------------------------
-def test_update_airport(base_url, auth_headers, session_with_retries):
+def test_update_airport(base_url, auth_headers, session_with_retries, airport):
     """Valida la actualización de datos de un aeropuerto existente."""
-    airport = create_airport_with_retry(base_url, auth_headers, session_with_retries)
     code = airport["iata_code"]
 
     # Datos actualizados
@@ -115,9 +75,8 @@ def test_update_airport(base_url, auth_headers, session_with_retries):
 # -----------------------------------------------------------
 # TEST: Eliminar aeropuerto existente
 # -----------------------------------------------------------
-def test_delete_airport(base_url, auth_headers, session_with_retries):
+def test_delete_airport(base_url, auth_headers, session_with_retries, airport):
     """Valida la eliminación de un aeropuerto existente."""
-    airport = create_airport_with_retry(base_url, auth_headers, session_with_retries)
     code = airport["iata_code"]
 
     # Eliminar aeropuerto
@@ -8,6 +8,8 @@
 #     - Aerolíneas (airline_schema)
 # -----------------------------------------------------------
 
+from schema_registry import register_schema
+
 # -----------------------------------------------------------
 # Esquema de validación para un aeropuerto
 # -----------------------------------------------------------
@@ -40,3 +42,6 @@ airline_schema = {
     },
     "additionalProperties": True   # Se permiten otros campos extra no definidos
 }
+
+register_schema("airport", airport_schema)
+register_schema("airline", airline_schema)
@@ -7,81 +7,24 @@
 # -----------------------------------------------------------
 
 import pytest
-from jsonschema import validate
+from schema_registry import validate
 from tests.bookings.test_schema_bookings import booking_schema  # Esquema esperado de reservas
-from requests.exceptions import RetryError
-import random
-import string
-
-
-# -----------------------------------------------------------
-# Función auxiliar: generar IDs aleatorios
-# -----------------------------------------------------------
-def random_id(length=8):
-    """Genera un identificador alfanumérico aleatorio de longitud configurable (default=8)."""
-    return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
+from requests.exceptions import ConnectionError
 
 
 # -----------------------------------------------------------
 # TEST 1: Crear una reserva exitosa
 # -----------------------------------------------------------
-def test_create_booking_success(base_url, auth_headers, session_with_retries):
+def test_create_booking_success(base_url, auth_headers, session_with_retries, shared_flight):
     """
     Flujo completo:
-      1. Crear aerolínea.
-      2. Crear vuelo asociado a la aerolínea.
-      3. Crear reserva para el vuelo.
+      1. Usar el vuelo compartido de la sesión (con su aerolínea).
+      2. Crear reserva para el vuelo.
     Valida que la reserva se confirme y cumpla el esquema esperado.
     """
+    flight_id = shared_flight["id"]
 
-    # Crear aerolínea de prueba
-    airline_id = random_id()
-    airline_data = {
-        "id": airline_id,
-        "name": "Test Airline",
-        "country": "USA"
-    }
-
-    try:
-        response_airline = session_with_retries.post(
-            f"{base_url}/airlines",
-            json=airline_data,
-            headers=auth_headers,
-            timeout=10
-        )
-        if response_airline.status_code not in [200, 201]:
-            pytest.skip("No se pudo crear la aerolínea necesaria para el test")
-    except Exception as e:
-        pytest.skip(f"No se pudo crear la aerolínea: {str(e)}")
-
-    # Crear vuelo asociado
-    flight_id = random_id()
-    flight_data = {
-        "id": flight_id,
-        "name": "SKY123",
-        "from": "JFK",
-        "to": "LAX",
-        "departure": "08:00",
-        "arrival": "11:30",
-        "duration": 3.5,
-        "stops": 0,
-        "price": 299.99,
-        "airline_id": airline_id
-    }
-
-    try:
-        response_flight = session_with_retries.post(
-            f"{base_url}/flights",
-            json=flight_data,
-            headers=auth_headers,
-            timeout=10
-        )
-        if response_flight.status_code not in [200, 201]:
-            pytest.skip("No se pudo crear el vuelo necesario para el test")
-    except Exception as e:
-        pytest.skip(f"No se pudo crear el vuelo: {str(e)}")
-
-    # Crear la reserva sobre el vuelo recién creado
+    # Crear la reserva sobre el vuelo compartido
     booking_data = {
         "flight_id": flight_id,
         "passenger_name": "John",
@@ -107,7 +50,7 @@ def test_create_booking_success(base_url, auth_headers, session_with_retries):
         assert "id" in booking
         assert booking["status"] == "confirmed"
         validate(instance=booking, schema=booking_schema)
-    except RetryError as e:
+    except ConnectionError as e:
         pytest.xfail(f"Error de conexión después de múltiples intentos: {e}")
     except Exception as e:
         pytest.xfail(f"Error al crear reserva: {str(e)}")
@@ -138,7 +81,7 @@ def test_create_booking_nonexistent_flight(base_url, auth_headers, session_with_
             pytest.xfail(f"Error del servidor (500) al crear reserva: {response.text}")
 
         assert response.status_code == 400, f"Expected 400, got {response.status_code}"
-    except RetryError as e:
+    except ConnectionError as e:
         pytest.xfail(f"Error de conexión después de múltiples intentos: {e}")
     except Exception as e:
         pytest.xfail(f"Error al crear reserva: {str(e)}")
@@ -162,7 +105,7 @@ def test_get_all_bookings(base_url, auth_headers, session_with_retries):
         assert response.status_code == 200, f"Expected 200, got {response.status_code}"
         bookings = response.json()
         assert isinstance(bookings, list)
-    except RetryError as e:
+    except ConnectionError as e:
         pytest.xfail(f"Error de conexión después de múltiples intentos: {e}")
     except Exception as e:
         pytest.xfail(f"Error al obtener reservas: {str(e)}")
@@ -171,20 +114,10 @@ def test_get_all_bookings(base_url, auth_headers, session_with_retries):
 # -----------------------------------------------------------
 # TEST 4: Obtener una reserva específica
 # -----------------------------------------------------------
-def test_get_booking_by_id(base_url, auth_headers, session_with_retries):
+def test_get_booking_by_id(base_url, auth_headers, session_with_retries, shared_booking):
     """Valida la obtención de una reserva específica por ID."""
+    booking_id = shared_booking["id"]
     try:
-        # Buscar reservas existentes
-        response_all = session_with_retries.get(
-            f"{base_url}/bookings",
-            headers=auth_headers,
-            timeout=10
-        )
-        if response_all.status_code != 200 or len(response_all.json()) == 0:
-            pytest.skip("No hay reservas existentes para probar la obtención por ID")
-
-        booking_id = response_all.json()[0]["id"]
-
         # Obtener reserva por ID
         response = session_with_retries.get(
             f"{base_url}/bookings/{booking_id}",
@@ -198,7 +131,7 @@ def test_get_booking_by_id(base_url, auth_headers, session_with_retries):
         assert response.status_code == 200, f"Expected 200, got {response.status_code}"
         booking = response.json()
         validate(instance=booking, schema=booking_schema)
-    except RetryError as e:
+    except ConnectionError as e:
         pytest.xfail(f"Error de conexión después de múltiples intentos: {e}")
     except Exception as e:
         pytest.xfail(f"Error al obtener reserva por ID: {str(e)}")
@@ -207,26 +140,10 @@ def test_get_booking_by_id(base_url, auth_headers, session_with_retries):
 # -----------------------------------------------------------
 # TEST 5: Cancelar una reserva
 # -----------------------------------------------------------
-def test_cancel_booking(base_url, auth_headers, session_with_retries):
-    """Valida que una reserva confirmada pueda cancelarse exitosamente."""
+def test_cancel_booking(base_url, auth_headers, session_with_retries, booking):
+    """Valida que una reserva confirmada (propia del test) pueda cancelarse exitosamente."""
+    booking_id = booking["id"]
     try:
-        response_all = session_with_retries.get(
-            f"{base_url}/bookings",
-            headers=auth_headers,
-            timeout=10
-        )
-        if response_all.status_code != 200:
-            pytest.skip("No se pudieron obtener reservas")
-
-        # Buscar una reserva confirmada
-        bookings = response_all.json()
-        booking_to_cancel = next((b for b in bookings if b.get("status") == "confirmed"), None)
-
-        if not booking_to_cancel:
-            pytest.skip("No hay reservas confirmadas para cancelar")
-
-        booking_id = booking_to_cancel["id"]
-
         # Cancelar la reserva
         response = session_with_retries.delete(
             f"{base_url}/bookings/{booking_id}",
@@ -248,7 +165,7 @@ def test_cancel_booking(base_url, auth_headers, session_with_retries):
         if response_updated.status_code == 200:
             updated_booking = response_updated.json()
             assert updated_booking["status"] == "cancelled"
-    except RetryError as e:
+    except ConnectionError as e:
         pytest.xfail(f"Error de conexión después de múltiples intentos: {e}")
     except Exception as e:
         pytest.xfail(f"Error al cancelar reserva: {str(e)}")
@@ -288,7 +205,7 @@ def test_cancel_already_cancelled_booking(base_url, auth_headers, session_with_r
             pytest.xfail(f"Error del servidor (500) al cancelar reserva: {response.text}")
 
         assert response.status_code == 400, f"Expected 400, got {response.status_code}"
-    except RetryError as e:
+    except ConnectionError as e:
         pytest.xfail(f"Error de conexión después de múltiples intentos: {e}")
     except Exception as e:
         pytest.xfail(f"Error al cancelar reserva ya cancelada: {str(e)}")
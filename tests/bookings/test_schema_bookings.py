@@ -6,6 +6,8 @@
 # que las respuestas de la API cumplen con el contrato esperado.
 # ================================================================
 
+from schema_registry import register_schema
+
 booking_schema = {
     "type": "object",  # El objeto raíz debe ser de tipo JSON "objeto"
     "required": [
@@ -49,3 +51,5 @@ booking_schema = {
     # No se permiten propiedades adicionales más allá de las definidas
     "additionalProperties": False
 }
+
+register_schema("booking", booking_schema)
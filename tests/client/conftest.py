@@ -0,0 +1,145 @@
+# -----------------------------------------------------------
+# Archivo: conftest.py (tests/client)
+# Descripción:
+#   Fixtures locales para probar el cliente sin depender de la
+#   API real: un servidor HTTP/1.1 keep-alive en un puerto libre.
+# -----------------------------------------------------------
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+# Tamaño de la colección paginada que expone /paged
+PAGED_TOTAL = 237
+
+
+class LocalServerState:
+    """Estado compartido del servidor local (concurrencia observada)."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests = 0
+
+
+class _LocalHandler(BaseHTTPRequestHandler):
+    """
+    Handler mínimo que imita algunas respuestas de la API:
+
+    - POST /auth/login → token de acceso.
+    - /slow/...        → responde tras 50 ms (para medir concurrencia).
+    - /status/<código> → responde con ese código (con `Retry-After: 0` si es 429/503).
+    - /etag/...        → incluye ETag y responde 304 si llega If-None-Match.
+    - /items/<n>       → array JSON con n reservas, enviado en trozos (chunked).
+    - /paged?skip&limit → página de una colección de PAGED_TOTAL usuarios (limit máx. 40).
+    - cualquier otra   → {"status": "ok"}.
+    """
+
+    protocol_version = "HTTP/1.1"
+    state = None
+
+    def _reply(self):
+        state = self.state
+        with state.lock:
+            state.requests += 1
+            state.in_flight += 1
+            state.max_in_flight = max(state.max_in_flight, state.in_flight)
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            if length:
+                self.rfile.read(length)
+
+            if self.path.startswith("/slow"):
+                time.sleep(0.05)
+
+            if self.command == "POST" and self.path.startswith("/auth/login"):
+                payload = {"access_token": "tok-123", "token_type": "bearer"}
+            else:
+                payload = {"status": "ok"}
+
+            if self.path.startswith("/items/"):
+                self._reply_items(int(self.path.split("/")[2]))
+                return
+
+            status = 200
+            if self.path.startswith("/paged"):
+                query = parse_qs(urlsplit(self.path).query)
+                skip = int(query.get("skip", ["0"])[0])
+                limit = min(int(query.get("limit", ["10"])[0]), 40)
+                payload = [
+                    {"id": str(i), "email": f"user{i}@demo.com"}
+                    for i in range(skip, min(skip + limit, PAGED_TOTAL))
+                ]
+            if self.path.startswith("/etag") and self.headers.get("If-None-Match") == '"v1"':
+                self.send_response(304)
+                self.send_header("ETag", '"v1"')
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            if self.path.startswith("/status/"):
+                status = int(self.path.split("/")[2])
+                payload = {"detail": f"status {status}"}
+
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            if status in (429, 503):
+                self.send_header("Retry-After", "0")
+            if self.path.startswith("/etag"):
+                self.send_header("ETag", '"v1"')
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with state.lock:
+                state.in_flight -= 1
+
+    def _reply_items(self, count):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        def write_chunk(data):
+            self.wfile.write(f"{len(data):X}\r\n".encode() + data + b"\r\n")
+
+        write_chunk(b"[")
+        for i in range(count):
+            item = {
+                "id": f"BK{i}", "flight_id": "FL1", "passenger_name": "John",
+                "passenger_email": "john@email.com", "seat": "15A",
+                "class": "economy", "status": "confirmed",
+            }
+            write_chunk((b"," if i else b"") + json.dumps(item).encode())
+        write_chunk(b"]")
+        self.wfile.write(b"0\r\n\r\n")
+
+    do_GET = do_POST = do_PUT = do_DELETE = _reply
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    """Levanta el servidor local y devuelve (url, estado)."""
+    state = LocalServerState()
+    handler = type("Handler", (_LocalHandler,), {"state": state})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", state
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def local_url(local_server):
+    """URL base del servidor local."""
+    return local_server[0]
@@ -0,0 +1,110 @@
+# -----------------------------------------------------------
+# Archivo: test_allocator.py
+# Descripción:
+#   Pruebas del asignador de valores únicos (allocator.py):
+#   particiones por worker, siembra con lo existente y
+#   agotamiento del espacio de códigos IATA.
+# -----------------------------------------------------------
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from allocator import IATA_SPACE, ValueAllocator, iata_code, iata_index, run_tag_of, worker_partition
+
+
+def test_iata_code_roundtrip():
+    assert iata_code(0) == "AAA" and iata_code(IATA_SPACE - 1) == "ZZZ"
+    assert all(iata_index(iata_code(i)) == i for i in range(0, IATA_SPACE, 97))
+    assert iata_index("jfk") is None and iata_index("JFKX") is None
+
+
+def test_worker_partition(monkeypatch):
+    monkeypatch.delenv("PYTEST_XDIST_WORKER", raising=False)
+    monkeypatch.delenv("PYTEST_XDIST_WORKER_COUNT", raising=False)
+    assert worker_partition() == (0, 1)
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw3")
+    monkeypatch.setenv("PYTEST_XDIST_WORKER_COUNT", "4")
+    assert worker_partition() == (3, 4)
+
+
+def test_workers_never_share_values():
+    """Cada worker asigna de su propia partición: sin choques entre workers."""
+    workers = [ValueAllocator(partition=(i, 4), run_tag="zz") for i in range(4)]
+    codes = [{w.iata() for _ in range(500)} for w in workers]
+    ids = [{w.id() for _ in range(500)} for w in workers]
+    emails = [{w.email() for _ in range(500)} for w in workers]
+    for values in (codes, ids, emails):
+        assert sum(len(v) for v in values) == 2000
+        assert len(set().union(*values)) == 2000
+    assert all(len(value) == 8 and value.isalnum() for value in ids[0])
+
+
+def test_seed_marks_existing_codes_once():
+    calls = []
+
+    def seed():
+        calls.append(1)
+        return [iata_code(i) for i in range(IATA_SPACE) if i != 42]
+
+    allocator = ValueAllocator(partition=(0, 1), seed=seed)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda _: _try_iata(allocator), range(4)))
+    # Solo queda un código libre: lo obtiene un hilo, los demás ven el espacio agotado
+    assert [code for code in results if code] == [iata_code(42)]
+    assert calls == [1]
+
+
+def _try_iata(allocator):
+    try:
+        return allocator.iata()
+    except RuntimeError:
+        return None
+
+
+def test_run_tag_avoids_tags_already_on_server(monkeypatch):
+    """La etiqueta elegida no aparece en ningún ID ni email existente."""
+    monkeypatch.delenv("API_RUN_TAG", raising=False)
+    assert run_tag_of("k302000f") == "k3" and run_tag_of("test.k3-02-15@demo.com") == "k3"
+
+    free = "zz"
+    existing = [f"{tag}0200001" for tag in _all_tags() if tag != free and tag < "m"]
+    existing += [f"test.{tag}-00-1@demo.com" for tag in _all_tags() if tag != free and tag >= "m"]
+    calls = []
+
+    def seed():
+        calls.append(1)
+        return existing
+
+    allocator = ValueAllocator(partition=(2, 4))
+    allocator.set_tag_seed(seed)
+    assert allocator.id().startswith(free)
+    assert allocator.email() == "test.zz-02-2@demo.com"
+    assert calls == [1]
+
+
+def test_fixed_run_tag_is_kept():
+    allocator = ValueAllocator(partition=(0, 1), run_tag="ab")
+    allocator.set_tag_seed(lambda: ["ab000001"])
+    assert allocator.id().startswith("ab00")
+
+
+def _all_tags():
+    digits = "0123456789abcdefghijklmnopqrstuvwxyz"
+    return [a + b for a in digits for b in digits]
+
+
+def test_partition_exhaustion_is_reported():
+    allocator = ValueAllocator(partition=(1, 2))
+    codes = {allocator.iata() for _ in range(IATA_SPACE // 2)}
+    assert len(codes) == IATA_SPACE // 2
+    with pytest.raises(RuntimeError):
+        allocator.iata()
+
+
+def test_concurrent_allocations_are_unique():
+    allocator = ValueAllocator(partition=(0, 1))
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        codes = list(pool.map(lambda _: allocator.iata(), range(2000)))
+        ids = list(pool.map(lambda _: allocator.id(), range(2000)))
+    assert len(set(codes)) == 2000 and len(set(ids)) == 2000
@@ -0,0 +1,85 @@
+# -----------------------------------------------------------
+# Archivo: test_api_response.py
+# Descripción:
+#   Pruebas de APIResponse: el body JSON se decodifica una
+#   sola vez y el codec se puede cambiar.
+# -----------------------------------------------------------
+
+import pytest
+import requests
+
+import json_codec
+from api_client import APIClient, SUCCESS_SCHEMA
+from api_response import APIResponse
+
+
+class CountingCodec(json_codec.StdlibCodec):
+    """Codec que cuenta cuántas veces se decodifica."""
+
+    name = "counting"
+
+    def __init__(self):
+        self.calls = 0
+
+    def loads(self, data):
+        self.calls += 1
+        return super().loads(data)
+
+
+def _response(body, encoding="utf-8"):
+    resp = requests.Response()
+    resp.status_code = 200
+    resp._content = body
+    resp.encoding = encoding
+    return resp
+
+
+def test_api_request_decodes_once(local_url):
+    """Token, validación y llamador comparten una única decodificación."""
+    codec = CountingCodec()
+    previous = json_codec.set_codec(codec)
+    try:
+        with APIClient(base_url=local_url) as client:
+            resp = client.api_request("GET", "/health", validate_schema=SUCCESS_SCHEMA)
+            assert resp.json() == {"status": "ok"}
+            assert resp.json() is resp.json()
+    finally:
+        json_codec.set_codec(previous)
+
+    assert codec.calls == 1
+    assert resp.status_code == 200
+    assert resp.raw_response.headers["Content-Type"].startswith("application/json")
+
+
+def test_invalid_json_raises_requests_error():
+    """Un body inválido lanza el mismo error que requests, también en llamadas repetidas."""
+    resp = APIResponse(_response(b"<html>"), codec=json_codec.StdlibCodec())
+    for _ in range(2):
+        with pytest.raises(requests.exceptions.JSONDecodeError):
+            resp.json()
+
+
+@pytest.mark.parametrize("name", ["json", "orjson"])
+def test_codecs_decode_non_utf8(name):
+    """Los bodies en otras codificaciones se decodifican vía `.text`."""
+    pytest.importorskip(name)
+    codec = json_codec.get_codec(name)
+    resp = APIResponse(_response('{"ciudad": "Bogotá"}'.encode("latin-1"), "ISO-8859-1"), codec=codec)
+    assert resp.json() == {"ciudad": "Bogotá"}
+    assert codec.dumps({"a": 1}) == b'{"a":1}'
+
+
+def test_behaves_as_requests_response():
+    """Es un requests.Response y los atributos asignados llegan a la respuesta original."""
+    raw = _response('{"ciudad": "Bogotá"}'.encode("utf-8"), encoding="ISO-8859-1")
+    resp = APIResponse(raw)
+    assert isinstance(resp, requests.Response)
+    resp.encoding = "utf-8"
+    assert raw.encoding == "utf-8"
+    assert resp.text == '{"ciudad": "Bogotá"}'
+    assert resp.ok and resp.json() == {"ciudad": "Bogotá"}
+
+
+def test_unknown_codec():
+    with pytest.raises(ValueError, match="Codec JSON desconocido"):
+        json_codec.get_codec("yaml")
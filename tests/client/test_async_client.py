@@ -0,0 +1,66 @@
+# -----------------------------------------------------------
+# Archivo: test_async_client.py
+# Descripción:
+#   Pruebas de AsyncAPIClient contra el servidor HTTP local:
+#   token, validación, límite de concurrencia y timeouts.
+# -----------------------------------------------------------
+
+import asyncio
+
+import pytest
+import requests
+
+from api_client import LOGIN_SCHEMA
+from async_api_client import AsyncAPIClient
+from retry_policy import RetryPolicy
+
+
+def test_login_stores_token(local_url, monkeypatch):
+    """El login asíncrono guarda el access_token igual que el cliente síncrono."""
+    monkeypatch.delenv("API_TOKEN", raising=False)
+
+    async def scenario():
+        async with AsyncAPIClient(base_url=local_url) as client:
+            data = await client.login("admin@demo.com", "admin123")
+            return client.token, data
+
+    token, data = asyncio.run(scenario())
+    assert token == "tok-123"
+    assert data["token_type"] == "bearer"
+
+
+def test_validate_schema_failure(local_url):
+    """Una respuesta 2xx que no cumple el esquema lanza excepción."""
+
+    async def scenario():
+        async with AsyncAPIClient(base_url=local_url) as client:
+            await client.api_request("GET", "/health", validate_schema=LOGIN_SCHEMA)
+
+    with pytest.raises(Exception, match="Validación de esquema falló"):
+        asyncio.run(scenario())
+
+
+def test_concurrency_is_bounded(local_server):
+    """Nunca hay más requests en vuelo que el límite del semáforo."""
+    url, state = local_server
+
+    async def scenario():
+        async with AsyncAPIClient(base_url=url, max_concurrency=3) as client:
+            responses = await asyncio.gather(
+                *(client.api_request("GET", f"/slow/{i}") for i in range(12))
+            )
+            return [r.status_code for r in responses]
+
+    assert asyncio.run(scenario()) == [200] * 12
+    assert state.max_in_flight == 3
+
+
+def test_timeout_raises_requests_timeout(local_url):
+    """Un timeout en el último intento se reporta como requests.Timeout."""
+
+    async def scenario():
+        async with AsyncAPIClient(base_url=local_url, retry_policy=RetryPolicy(max_attempts=1)) as client:
+            await client.api_request("GET", "/slow/timeout", timeout=0.01)
+
+    with pytest.raises(requests.exceptions.Timeout):
+        asyncio.run(scenario())
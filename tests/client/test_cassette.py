@@ -0,0 +1,151 @@
+# -----------------------------------------------------------
+# Archivo: test_cassette.py
+# Descripción:
+#   Pruebas del modo grabación/reproducción (cassette.py):
+#   normalización de requests, almacenamiento indexado y
+#   reproducción sin red.
+# -----------------------------------------------------------
+
+import json
+import zlib
+
+import pytest
+import requests
+
+from api_client import APIClient, build_session
+from cassette import Cassette, CassetteMissError, cassette_key
+
+
+def _client(url, cassette):
+    return APIClient(
+        base_url=url, session=build_session(retry_policy=None, rate_limiter=None, cassette=cassette),
+        single_flight=None,
+    )
+
+
+def _record(url, directory, scope="test_a"):
+    cassette = Cassette(str(directory), mode="record")
+    cassette.set_scope(scope)
+    with _client(url, cassette) as client:
+        client.token = "secreto"
+        client.api_request("GET", "/bookings/BK1")
+        client.api_request("GET", "/status/404")
+        client.api_request("POST", "/bookings/", json={"flight_id": "FL1", "seat": "1A"})
+        list(client.iter_items("/items/3"))
+    cassette.close()
+    return cassette
+
+
+def test_key_templates_ids_and_ignores_values():
+    """Los IDs de la ruta y los valores del cuerpo no forman parte de la clave."""
+    first = requests.Request(
+        "POST", "http://api/users/abc123", json={"email": "a@x.com", "role": "admin"}, params={"b": 2, "a": 1}
+    ).prepare()
+    second = requests.Request(
+        "POST", "http://otra/users/zzz999", json={"role": "passenger", "email": "b@y.com"}, params={"a": 1, "b": 2}
+    ).prepare()
+    assert cassette_key(first) == cassette_key(second) == "POST /users/{id}?a=1&b=2 {email,role}"
+
+
+def test_replay_without_network(local_server, tmp_path):
+    """Lo grabado se reproduce aunque el servidor ya no exista."""
+    url, state = local_server
+    _record(url, tmp_path)
+    recorded = state.requests
+
+    replay = Cassette(str(tmp_path), mode="replay")
+    replay.set_scope("test_a")
+    with _client("http://127.0.0.1:9", replay) as client:
+        assert client.api_request("GET", "/bookings/BK2").json() == {"status": "ok"}
+        assert client.api_request("GET", "/status/404").status_code == 404
+        created = client.api_request("POST", "/bookings/", json={"flight_id": "FL9", "seat": "2B"})
+        assert created.json() == {"status": "ok"}
+        assert [item["id"] for item in client.iter_items("/items/3")] == ["BK0", "BK1", "BK2"]
+
+        with pytest.raises(CassetteMissError):
+            client.api_request("DELETE", "/bookings/BK1")
+    assert state.requests == recorded
+    replay.close()
+
+
+def test_authorization_is_not_stored(local_server, tmp_path):
+    url, _ = local_server
+    _record(url, tmp_path)
+
+    data = (tmp_path / "responses.bin").read_bytes()
+    index = json.loads((tmp_path / "index.json").read_text())["entries"]
+    offset, length = index["GET /bookings/{id}"]["test_a"][0]
+    meta = json.loads(zlib.decompress(data[offset:offset + length]).partition(b"\n")[0])
+    assert "Authorization" not in meta["request"]["headers"]
+    assert b"secreto" not in b"".join(
+        zlib.decompress(data[o:o + n]) for spans in index.values() for s in spans.values() for o, n in s
+    )
+
+
+def test_repeated_keys_replay_in_order(local_server, tmp_path):
+    """Dentro de un test, una misma clave devuelve las respuestas en orden."""
+    url, _ = local_server
+    cassette = Cassette(str(tmp_path), mode="record")
+    cassette.set_scope("test_b")
+    with _client(url, cassette) as client:
+        client.api_request("GET", "/status/503")
+        client.api_request("GET", "/status/200")
+    cassette.close()
+
+    replay = Cassette(str(tmp_path), mode="replay")
+    replay.set_scope("test_b")
+    with _client(url, replay) as client:
+        statuses = [client.api_request("GET", f"/status/{n}").status_code for n in (1, 2, 3)]
+    assert statuses == [503, 200, 200]  # la última se repite
+    replay.close()
+
+
+def test_rerecording_replaces_only_its_tests(local_server, tmp_path):
+    """Regrabar un test reemplaza sus respuestas y conserva las de los demás."""
+    url, _ = local_server
+    _record(url, tmp_path, scope="test_a")
+    _record(url, tmp_path, scope="test_c")
+    _record(url, tmp_path, scope="test_a")
+
+    cassette = Cassette(str(tmp_path), mode="replay")
+    assert set(json.loads((tmp_path / "index.json").read_text())["entries"]["GET /bookings/{id}"]) == {
+        "test_a", "test_c"
+    }
+    assert len(cassette) == 8
+
+
+def test_tokens_are_scrubbed_from_response_bodies(tmp_path):
+    """Los tokens de las respuestas JSON no llegan a responses.bin."""
+    request = requests.Request("POST", "http://api/auth/login", data={"username": "a", "password": "b"}).prepare()
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = "application/json"
+    response._content = json.dumps({"access_token": "eyJ.secreto.firma", "token_type": "bearer"}).encode()
+
+    cassette = Cassette(str(tmp_path), mode="record")
+    cassette.record(request, response)
+    cassette.close()
+
+    data = zlib.decompress((tmp_path / "responses.bin").read_bytes())
+    assert b"secreto" not in data
+    assert json.loads(data.partition(b"\n")[2]) == {"access_token": "REDACTED", "token_type": "bearer"}
+
+
+def test_rerecording_does_not_grow_the_data_file(local_server, tmp_path):
+    """Las respuestas reemplazadas se descartan al guardar."""
+    url, _ = local_server
+    for _ in range(4):
+        _record(url, tmp_path)
+
+    # El archivo contiene exactamente las respuestas del índice
+    index = json.loads((tmp_path / "index.json").read_text())["entries"]
+    spans = [span for scopes in index.values() for s in scopes.values() for span in s]
+    assert len(spans) == 4
+    assert sum(length for _, length in spans) == (tmp_path / "responses.bin").stat().st_size
+    assert [path.name for path in tmp_path.iterdir() if path.name.endswith(".tmp")] == []
+
+    replay = Cassette(str(tmp_path), mode="replay")
+    replay.set_scope("test_a")
+    with _client("http://127.0.0.1:9", replay) as client:
+        assert client.api_request("GET", "/bookings/BK2").json() == {"status": "ok"}
+    replay.close()
@@ -0,0 +1,91 @@
+# -----------------------------------------------------------
+# Archivo: test_deadline.py
+# Descripción:
+#   Pruebas del presupuesto de tiempo por test (deadline.py):
+#   recorte de timeouts, reintentos que no entran en lo que
+#   queda y el marcador @pytest.mark.budget.
+# -----------------------------------------------------------
+
+import time
+
+import pytest
+
+from api_client import build_session
+from deadline import Deadline, DeadlineExceeded, current_deadline
+from rate_limiter import RateLimiter, endpoint_group
+from retry_policy import RetryBudget, RetryPolicy
+from standin_api import AirlineAPI, StandInServer
+
+
+@pytest.fixture
+def server():
+    with StandInServer(AirlineAPI(seed=1)) as server:
+        yield server
+
+
+def test_cap_timeout():
+    deadline = Deadline()
+    assert deadline.cap_timeout(10) == 10 and deadline.remaining() is None
+
+    deadline.start(2)
+    assert deadline.cap_timeout(10) <= 2
+    assert deadline.cap_timeout(0.5) == 0.5
+    connect, read = deadline.cap_timeout((1, 30))
+    assert connect == 1 and read <= 2
+    assert deadline.cap_timeout(None) <= 2
+
+    deadline.start(0.01)
+    time.sleep(0.02)
+    with pytest.raises(DeadlineExceeded, match="Presupuesto"):
+        deadline.cap_timeout(10)
+
+
+def test_suspended_time_is_not_charged():
+    deadline = Deadline()
+    deadline.start(0.2)
+    with deadline.suspended():
+        assert deadline.remaining() is None
+        time.sleep(0.3)
+    assert not deadline.expired and deadline.elapsed < 0.2
+
+
+@pytest.mark.budget(7)
+def test_marker_sets_budget():
+    assert current_deadline.budget == 7
+    assert 0 < current_deadline.remaining() <= 7
+
+
+@pytest.mark.budget(0.5)
+def test_slow_request_is_cut_at_budget(server):
+    server.app.configure(latency=2)
+    session = build_session(retry_policy=None, rate_limiter=None)
+    start = time.monotonic()
+    with pytest.raises(DeadlineExceeded):
+        session.get(f"{server.url}/", timeout=10)
+    assert time.monotonic() - start < 1.5
+    current_deadline.clear()  # el corte es el resultado esperado: no se informa
+
+
+@pytest.mark.budget(1)
+def test_retry_not_scheduled_past_budget(server):
+    server.app.configure(error_rate=1.0, error_status=500)
+    policy = RetryPolicy(max_attempts=5, base_delay=2, max_delay=2, budget=RetryBudget(min_retries=10))
+    session = build_session(retry_policy=policy, rate_limiter=None)
+    start = time.monotonic()
+    assert session.get(f"{server.url}/").status_code == 500
+    assert time.monotonic() - start < 0.5
+    assert server.app.requests == 1
+
+
+@pytest.mark.budget(1)
+def test_rate_limiter_wait_counts_against_budget(server):
+    """Una pausa del limitador más larga que el presupuesto corta la request sin enviarla."""
+    limiter = RateLimiter(rate=100, burst=5)
+    limiter.on_response(endpoint_group(f"{server.url}/flights"), 429, retry_after=6)
+    session = build_session(retry_policy=None, rate_limiter=limiter)
+    start = time.monotonic()
+    with pytest.raises(DeadlineExceeded):
+        session.get(f"{server.url}/flights", timeout=10)
+    assert time.monotonic() - start < 0.5
+    assert server.app.requests == 0
+    current_deadline.clear()
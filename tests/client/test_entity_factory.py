@@ -0,0 +1,119 @@
+# -----------------------------------------------------------
+# Archivo: test_entity_factory.py
+# Descripción:
+#   Pruebas de la fábrica de entidades (entity_factory.py):
+#   cadenas memoizadas, creación en paralelo, pool de
+#   entidades mutables y reintento ante colisiones.
+# -----------------------------------------------------------
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from api_client import build_session
+from entity_factory import SPECS, EntityCreationError, EntityFactory, EntitySpec
+from inproc_adapter import register_app, unregister_app
+from standin_api import AirlineAPI, issue_token
+
+
+@pytest.fixture
+def api():
+    app = AirlineAPI(seed=1)
+    url = register_app("entities-test", app)
+    yield app, url
+    unregister_app("entities-test")
+
+
+def _factory(url, specs=SPECS):
+    token = issue_token("admin@demo.com")
+    return EntityFactory(
+        build_session(retry_policy=None, rate_limiter=None), url,
+        headers=lambda: {"Authorization": f"Bearer {token}"}, specs=specs,
+    )
+
+
+def test_chain_is_built_once_and_shared(api):
+    """aerolínea → vuelo → reserva se crea una vez; los pedidos siguientes no hacen requests."""
+    app, url = api
+    factory = _factory(url)
+    booking = factory.shared("booking")
+    flight = factory.shared("flight")
+    before = app.requests
+
+    assert factory.shared("booking") is booking
+    assert booking["flight_id"] == flight["id"]
+    assert flight["airline_id"] == factory.shared("airline")["id"]
+    assert booking.shared and not booking.mutable
+    assert app.requests == before
+    assert factory.stats()["created"] == 3
+    factory.close()
+
+
+def test_overrides_are_separate_shared_entities(api):
+    _, url = api
+    factory = _factory(url)
+    dated = factory.shared("flight", date="2024-03-15")
+    assert dated["date"] == "2024-03-15"
+    assert factory.shared("flight") is not dated
+    assert factory.shared("flight")["airline_id"] == dated["airline_id"]  # mismo padre
+    factory.close()
+
+
+def test_concurrent_requests_create_one_entity(api):
+    """Pedidos simultáneos de la misma entidad compartida hacen un solo POST."""
+    _, url = api
+    factory = _factory(url)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        flights = list(pool.map(lambda _: factory.shared("flight"), range(16)))
+    assert all(flight is flights[0] for flight in flights)
+    assert factory.stats()["created"] == 2
+    factory.close()
+
+
+def test_warm_creates_independent_chains(api):
+    _, url = api
+    factory = _factory(url)
+    booking, airport, user = factory.warm("booking", "airport", "user")
+    assert booking.kind == "booking" and airport.kind == "airport" and user.kind == "user"
+    assert factory.stats()["created"] == 5
+    factory.close()
+
+
+def test_lease_hands_out_prefilled_mutable_entities(api):
+    _, url = api
+    factory = _factory(url)
+    factory.prefill("booking", 3)
+    created = factory.stats()["created"]
+
+    leased = [factory.lease("booking") for _ in range(3)]
+    assert len({booking["id"] for booking in leased}) == 3
+    assert all(booking.mutable for booking in leased)
+    assert factory.stats()["created"] == created
+    assert factory.pooled() == []
+
+    factory.lease("booking")  # pool vacío: se crea en el momento
+    assert factory.stats()["created"] == created + 1
+    factory.close()
+
+
+def test_identifier_collision_is_retried(api):
+    """Un 400 'already exists' se reintenta con un cuerpo nuevo."""
+    _, url = api
+    codes = iter(["JFK", "QQQ"])
+    specs = dict(SPECS, airport=EntitySpec(
+        "/airports", lambda: {"iata_code": next(codes), "city": "X", "country": "Y"},
+        id_field="iata_code", retry_on="exists",
+    ))
+    factory = _factory(url, specs)
+    assert factory.mutable("airport")["iata_code"] == "QQQ"
+    assert factory.url("airport", {"iata_code": "QQQ"}).endswith("/airports/QQQ")
+    factory.close()
+
+
+def test_rejected_creation_raises(api):
+    _, url = api
+    factory = _factory(url)
+    with pytest.raises(EntityCreationError) as info:
+        factory.mutable("flight", airline_id="no-existe")
+    assert info.value.response.status_code == 422
+    factory.close()
@@ -0,0 +1,95 @@
+# -----------------------------------------------------------
+# Archivo: test_health_gate.py
+# Descripción:
+#   Pruebas de la compuerta de salud (health_gate.py): se
+#   abre tras fallos seguidos, falla rápido sin tocar la red
+#   y se vuelve a cerrar cuando la API se recupera.
+# -----------------------------------------------------------
+
+import time
+
+import pytest
+import requests
+
+from api_client import build_session
+from health_gate import APIUnavailableError, HealthGate
+from retry_policy import RetryPolicy
+from standin_api import AirlineAPI, StandInServer
+
+
+@pytest.fixture
+def server():
+    with StandInServer(AirlineAPI(seed=1)) as server:
+        yield server
+
+
+def _session(gate):
+    return build_session(retry_policy=None, rate_limiter=None, health_gate=gate)
+
+
+def test_opens_after_consecutive_failures_and_fails_fast(server):
+    gate = HealthGate(threshold=3, probe_interval=60)
+    session = _session(gate)
+    server.app.configure(error_rate=1.0, error_status=502)
+
+    for _ in range(3):
+        assert session.get(f"{server.url}/airlines").status_code == 502
+    assert gate.is_open and gate.trips == 1
+    assert "HTTP 502 en GET /airlines" in gate.cause
+
+    served = server.app.requests
+    with pytest.raises(APIUnavailableError, match="HTTP 502"):
+        session.get(f"{server.url}/airlines")
+    assert server.app.requests == served  # no llegó al servidor
+
+
+def test_success_resets_consecutive_count(server):
+    gate = HealthGate(threshold=3, probe_interval=60)
+    session = _session(gate)
+    for _ in range(5):
+        server.app.fail_next(2, status=503)
+        session.get(f"{server.url}/")
+        session.get(f"{server.url}/")
+        session.get(f"{server.url}/")
+    assert not gate.is_open and gate.failures == 0
+
+
+def test_endpoint_errors_do_not_open_gate(server):
+    """Un 500 o un circuito abierto en un endpoint no hacen caer toda la API."""
+    gate = HealthGate(threshold=3, probe_interval=60)
+    policy = RetryPolicy(max_attempts=1, breaker_threshold=3, breaker_reset=60)
+    session = build_session(retry_policy=policy, rate_limiter=None, health_gate=gate)
+    server.app.configure(error_rate=1.0, error_status=500)
+    for _ in range(3):
+        assert session.get(f"{server.url}/users").status_code == 500
+    for _ in range(2):
+        with pytest.raises(requests.exceptions.ConnectionError, match="Circuito abierto"):
+            session.get(f"{server.url}/users")
+    assert not gate.is_open and gate.failures == 0
+
+    server.app.configure(error_rate=0.0)
+    assert session.get(f"{server.url}/health").status_code == 200
+
+
+def test_transport_errors_count():
+    gate = HealthGate(threshold=2, probe_interval=60)
+    session = _session(gate)
+    for _ in range(2):
+        with pytest.raises(requests.exceptions.ConnectionError):
+            session.get("http://127.0.0.1:9/flights", timeout=1)
+    assert gate.is_open and "ConnectionError en GET /flights" in gate.cause
+
+
+def test_probe_closes_gate_when_api_recovers(server):
+    gate = HealthGate(threshold=2, probe_interval=0.05)
+    session = _session(gate)
+    server.app.fail_next(2, status=503)
+    session.get(f"{server.url}/airlines")
+    session.get(f"{server.url}/airlines")
+    assert gate.is_open
+
+    deadline = time.monotonic() + 5
+    while gate.is_open and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert not gate.is_open
+    assert session.get(f"{server.url}/").status_code == 200
@@ -0,0 +1,26 @@
+# -----------------------------------------------------------
+# Archivo: test_import_time.py
+# Descripción:
+#   Verifica que el arranque no cargue dependencias pesadas.
+#   El tiempo de import depende de la máquina y no se mide
+#   aquí: se comprueba con `python import_benchmark.py`.
+# -----------------------------------------------------------
+
+import pytest
+
+from import_benchmark import eager_modules, parse_importtime
+
+
+@pytest.mark.parametrize("module", ["conftest", "api_client"])
+def test_heavy_dependencies_are_lazy(module):
+    """faker y jsonschema no se importan hasta que se usan."""
+    assert eager_modules(module) == []
+
+
+def test_parse_importtime():
+    output = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   json.decoder\n"
+        "import time:       300 |        420 | json\n"
+    )
+    assert parse_importtime(output) == {"json.decoder": (120, 120), "json": (300, 420)}
@@ -0,0 +1,105 @@
+# -----------------------------------------------------------
+# Archivo: test_inproc_adapter.py
+# Descripción:
+#   Pruebas del transporte en proceso (inproc_adapter.py):
+#   requests a apps WSGI y ASGI sin abrir sockets.
+# -----------------------------------------------------------
+
+import json
+import socket
+
+import pytest
+import requests
+
+from api_client import APIClient, build_session
+from inproc_adapter import register_app, unregister_app
+from standin_api import AirlineAPI
+
+
+@pytest.fixture
+def no_sockets(monkeypatch):
+    """Falla si algo intenta abrir una conexión de red."""
+    def refuse(*args, **kwargs):
+        raise AssertionError("se intentó abrir un socket")
+    monkeypatch.setattr(socket.socket, "connect", refuse)
+    monkeypatch.setattr(socket, "create_connection", refuse)
+
+
+@pytest.fixture
+def airline():
+    url = register_app("airline-test", AirlineAPI(seed=1))
+    yield url
+    unregister_app("airline-test")
+
+
+@pytest.fixture
+def client(airline, no_sockets):
+    with APIClient(base_url=airline, single_flight=None, rate_limiter=None) as client:
+        client.login("admin@demo.com", "admin123")
+        yield client
+
+
+async def echo_asgi(scope, receive, send):
+    """App ASGI mínima que devuelve lo que recibió."""
+    message = await receive()
+    payload = {
+        "method": scope["method"],
+        "path": scope["path"],
+        "query": scope["query_string"].decode(),
+        "body": message["body"].decode(),
+    }
+    await send({
+        "type": "http.response.start", "status": 201,
+        "headers": [(b"content-type", b"application/json")],
+    })
+    await send({"type": "http.response.body", "body": json.dumps(payload).encode()})
+
+
+def test_wsgi_app_through_api_client(client):
+    """APIClient habla con la app WSGI: login, params, POST JSON y errores."""
+    resp = client.api_request("GET", "/users", params={"limit": 5})
+    assert resp.status_code == 200
+    assert len(resp.json()) == 5
+
+    booking = {
+        "flight_id": "FL456", "passenger_name": "Ana", "passenger_email": "ana@demo.com",
+        "seat": "12A", "class": "economy",
+    }
+    created = client.api_request("POST", "/bookings", json=booking)
+    assert created.status_code == 201
+    assert created.json()["flight_id"] == "FL456"
+
+    assert client.api_request("GET", "/bookings/NOPE").status_code == 404
+
+
+def test_streamed_items(client):
+    """iter_items decodifica el cuerpo en memoria igual que uno de red."""
+    ids = [user["id"] for user in client.iter_items("/users", params={"limit": 10})]
+    assert len(ids) == 10
+
+
+def test_asgi_app(no_sockets):
+    """Las apps ASGI se ejecutan en el loop en segundo plano."""
+    url = register_app("echo", echo_asgi)
+    try:
+        session = build_session(retry_policy=None, rate_limiter=None)
+        resp = session.post(url + "/items/a%20b", params={"q": "1"}, data=b"hola", timeout=5)
+    finally:
+        unregister_app("echo")
+
+    assert resp.status_code == 201
+    assert resp.reason == "Created"
+    assert resp.json() == {"method": "POST", "path": "/items/a b", "query": "q=1", "body": "hola"}
+
+
+def test_unknown_app_is_connection_error():
+    session = build_session(retry_policy=None, rate_limiter=None)
+    with pytest.raises(requests.exceptions.ConnectionError):
+        session.get("http+inproc://desconocida/health")
+
+
+def test_many_requests_without_sockets(client):
+    """Mil requests seguidas se atienden en proceso: todas 200 y ninguna conexión abierta."""
+    statuses = {client.api_request("GET", "/health").status_code for _ in range(1000)}
+    assert statuses == {200}
+    assert client.pool_stats == {"opened": 0, "reused": 0}
@@ -0,0 +1,45 @@
+# -----------------------------------------------------------
+# Archivo: test_json_stream.py
+# Descripción:
+#   Pruebas del parser incremental de arrays JSON y de
+#   APIClient.iter_items().
+# -----------------------------------------------------------
+
+import json
+
+import pytest
+
+from api_client import APIClient
+from json_stream import iter_json_array
+from tests.bookings.test_schema_bookings import booking_schema
+
+
+def chunked(data, size):
+    return (data[i:i + size] for i in range(0, len(data), size))
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 1024])
+def test_items_are_parsed_regardless_of_chunking(size):
+    """Cualquier partición del body produce los mismos elementos."""
+    document = [{"id": "ñandú", "price": 299.99}, 12345, "txt", [1, [2]], None, {}]
+    raw = json.dumps(document).encode("utf-8")
+    assert list(iter_json_array(chunked(raw, size))) == document
+
+
+def test_empty_array_and_invalid_documents():
+    """Array vacío, documentos que no son arrays y arrays truncados."""
+    assert list(iter_json_array([b" [ ] "])) == []
+    with pytest.raises(ValueError):
+        list(iter_json_array([b'{"a": 1}']))
+    with pytest.raises(ValueError):
+        list(iter_json_array([b"[1, 2"]))
+
+
+def test_iter_items_streams_and_validates(local_url):
+    """iter_items recorre una respuesta chunked validando cada elemento."""
+    with APIClient(base_url=local_url) as client:
+        client.token = None
+        items = list(client.iter_items("/items/500", schema=booking_schema))
+
+    assert len(items) == 500
+    assert items[-1]["id"] == "BK499"
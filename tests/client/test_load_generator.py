@@ -0,0 +1,125 @@
+# -----------------------------------------------------------
+# Archivo: test_load_generator.py
+# Descripción:
+#   Pruebas del generador de carga (load_generator.py) contra
+#   la API en memoria: usuarios virtuales, modelo abierto con
+#   tasa de llegada, histogramas de latencia, tasa de errores
+#   y ejecución desde la línea de comandos.
+# -----------------------------------------------------------
+
+import json
+
+import pytest
+
+import load_generator
+from load_generator import Action, LatencyHistogram, LoadGenerator, LoadReport, OpenLoadGenerator, RateCurve
+from standin_api import AirlineAPI, StandInServer, issue_token
+
+
+@pytest.fixture
+def server():
+    with StandInServer(AirlineAPI(seed=1)) as server:
+        yield server
+
+
+def test_histogram_percentiles():
+    histogram = LatencyHistogram()
+    for ms in range(1, 1001):
+        histogram.record(ms / 1000)
+    assert histogram.percentile(50) == pytest.approx(0.5, rel=0.01)
+    assert histogram.percentile(99) == pytest.approx(0.99, rel=0.01)
+    assert histogram.percentile(99.9) == pytest.approx(0.999, rel=0.01)
+    assert histogram.max == 1_000_000 and histogram.total == 1000
+    assert LatencyHistogram().percentile(50) == 0.0
+
+    # Valores chicos exactos; combinar suma contadores
+    other = LatencyHistogram()
+    other.record(0.000100, count=1000)
+    histogram.merge(other)
+    assert histogram.percentile(50) == 0.0001 and histogram.total == 2000
+
+
+def test_report_summary():
+    report = LoadReport(users=2, elapsed=2.0)
+    for i in range(100):
+        report.record("GET /a", (i + 1) / 1000, error=i < 5)
+    report.record("POST /b", 0.5, error=False)
+
+    summary = report.summary()
+    assert summary["GET /a"]["requests"] == 100 and summary["GET /a"]["error_rate"] == 0.05
+    assert summary["GET /a"]["p95"] == pytest.approx(95.0, rel=0.01)
+    assert summary["TOTAL"]["requests"] == 101 and summary["TOTAL"]["throughput"] == 50.5
+    assert "GET /a" in report.format_table()
+
+
+def test_virtual_users_run_the_scenario(server):
+    scenario = [
+        Action("GET /flights", "GET", "/flights", weight=3),
+        Action("GET /missing", "GET", "/nothing-here", weight=1),
+    ]
+    generator = LoadGenerator(
+        server.url, scenario=scenario, users=4, ramp_up=0.2, duration=0.5, think_time=0.01, seed=7,
+        token=issue_token("admin@demo.com"),
+    )
+    report = generator.run()
+    summary = report.summary()
+
+    assert summary["GET /flights"]["requests"] > summary["GET /missing"]["requests"] > 0
+    assert summary["GET /flights"]["error_rate"] == 0
+    assert summary["GET /missing"]["error_rate"] == 1
+    assert 0.7 <= report.elapsed < 2
+
+
+def test_rate_curve_arrivals():
+    assert len(list(RateCurve.constant(50, 2).arrivals())) == pytest.approx(100, abs=1)
+    ramp = RateCurve.parse("1:100,1:100")
+    assert ramp.rate(0.5) == 50 and ramp.rate(1.5) == 100 and ramp.duration == 2
+    arrivals = list(ramp.arrivals())
+    assert len(arrivals) == pytest.approx(150, abs=2)
+    assert sum(1 for t in arrivals if t < 1) == pytest.approx(50, abs=2)
+
+
+def test_open_model_counts_queueing_delay(server):
+    """Con el servidor saturado, la latencia crece desde el envío previsto (sin coordinated omission)."""
+    server.app.configure(latency=0.1)
+    generator = OpenLoadGenerator(
+        server.url, RateCurve.constant(20, 0.5), scenario=[Action("GET /flights", "GET", "/flights")],
+        max_in_flight=1, token=issue_token("admin@demo.com"),
+    )
+    report = generator.run()
+    row = report.summary()["GET /flights"]
+
+    # 10 llegadas cada 50 ms contra 100 ms de servicio: la última espera ~0,5 s
+    assert row["requests"] == pytest.approx(10, abs=1) and row["errors"] == 0
+    assert row["p50"] > 150 and row["max"] > 400
+    assert report.send_lag.max > 300_000  # µs
+    assert "modelo abierto, 20 req/s" in report.format_table()
+
+
+def test_main_runs_default_scenario_and_cleans_up(server, tmp_path, capsys):
+    output = tmp_path / "carga.json"
+    seed_flights, seed_bookings = set(server.app.flights), set(server.app.bookings)
+    code = load_generator.main([
+        "--base-url", server.url, "--users", "3", "--ramp-up", "0", "--duration", "0.5",
+        "--think-time", "0", "--json", str(output), "--max-error-rate", "0",
+    ])
+
+    assert code == 0
+    summary = json.loads(output.read_text())
+    assert {"GET /flights/{id}", "POST /bookings", "TOTAL"} <= set(summary)
+    assert "p99.9" in capsys.readouterr().out
+    # Lo creado durante la carga se borró (las reservas se cancelan)
+    assert set(server.app.flights) == seed_flights
+    created = [b for key, b in server.app.bookings.items() if key not in seed_bookings]
+    assert created and all(booking["status"] == "cancelled" for booking in created)
+
+
+def test_main_open_model_only_selected_actions(server, tmp_path):
+    output = tmp_path / "carga.json"
+    code = load_generator.main([
+        "--base-url", server.url, "--rate", "40", "--duration", "0.5", "--only", "POST /bookings",
+        "--only", "GET /flights?date", "--json", str(output),
+    ])
+
+    assert code == 0
+    assert set(json.loads(output.read_text())) == {"POST /bookings", "GET /flights?date", "TOTAL"}
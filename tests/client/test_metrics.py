@@ -0,0 +1,73 @@
+# -----------------------------------------------------------
+# Archivo: test_metrics.py
+# Descripción:
+#   Pruebas de las métricas de tiempos por fase: registro de
+#   cada intento, plantillas de endpoint y exportación.
+# -----------------------------------------------------------
+
+import json
+
+from api_client import APIClient, build_session
+from metrics import MetricsRegistry, metrics
+from retry_policy import RetryPolicy
+
+
+def _histogram(data, endpoint, phase):
+    return next(
+        (h for h in data["phases"] if h["endpoint"] == endpoint and h["phase"] == phase), None
+    )
+
+
+def test_phases_recorded_per_endpoint_template(local_url):
+    """Cada request registra sus fases bajo la plantilla del endpoint."""
+    metrics.reset()
+    with APIClient(base_url=local_url, session=build_session(retry_policy=None)) as client:
+        client.api_request("GET", "/bookings/BK1")
+        resp = client.api_request("GET", "/bookings/BK2")
+
+    assert resp.timing.ttfb > 0
+    data = metrics.to_json()
+    for phase in ("connect", "ttfb", "download", "json_decode"):
+        assert _histogram(data, "/bookings/{id}", phase) is not None, phase
+    # La conexión se abre una vez y se reutiliza en la segunda request
+    assert _histogram(data, "/bookings/{id}", "connect")["count"] == 1
+    assert _histogram(data, "/bookings/{id}", "ttfb")["count"] == 2
+
+
+def test_retries_counted_by_attempt(local_url):
+    """Los reintentos quedan registrados con su número de intento y status."""
+    metrics.reset()
+    policy = RetryPolicy(max_attempts=3, base_delay=0)
+    with APIClient(base_url=local_url, session=build_session(retry_policy=policy)) as client:
+        client.api_request("GET", "/status/503")
+
+    attempts = [(r["status"], r["attempt"]) for r in metrics.to_json()["requests"]]
+    assert attempts == [("503", 1), ("503", 2), ("503", 3)]
+
+
+def test_prometheus_export(tmp_path):
+    """La exportación Prometheus tiene buckets acumulativos, suma y conteo."""
+    registry = MetricsRegistry(enabled=True)
+    registry.observe("GET", "/flights", "validation", 0.003)
+    registry.observe("GET", "/flights", "validation", 0.2)
+
+    path = tmp_path / "api_metrics.prom"
+    registry.write_prometheus(str(path))
+    text = path.read_text(encoding="utf-8")
+
+    labels = 'method="GET",endpoint="/flights",phase="validation"'
+    assert f'api_client_phase_seconds_bucket{{{labels},le="0.005"}} 1' in text
+    assert f'api_client_phase_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+    assert f"api_client_phase_seconds_count{{{labels}}} 2" in text
+
+    registry.write_json(str(tmp_path / "api_metrics.json"))
+    data = json.loads((tmp_path / "api_metrics.json").read_text(encoding="utf-8"))
+    assert data["phases"][0]["count"] == 2
+
+
+def test_disabled_registry_records_nothing():
+    """Con API_METRICS=0 no se crea ninguna medición."""
+    registry = MetricsRegistry(enabled=False)
+    assert registry.begin() is None
+    registry.observe("GET", "/flights", "ttfb", 0.1)
+    assert registry.to_json() == {"phases": [], "requests": [], "counters": []}
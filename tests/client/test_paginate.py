@@ -0,0 +1,31 @@
+# -----------------------------------------------------------
+# Archivo: test_paginate.py
+# Descripción:
+#   Pruebas de APIClient.paginate() y del ajuste del tamaño
+#   de página.
+# -----------------------------------------------------------
+
+from api_client import APIClient, PageSizeTuner
+from tests.client.conftest import PAGED_TOTAL
+
+
+def test_paginate_walks_whole_collection_in_order(local_url):
+    """Se recorren todos los elementos, en orden, aunque el servidor limite `limit`."""
+    with APIClient(base_url=local_url) as client:
+        client.token = None
+        ids = [item["id"] for item in client.paginate("/paged", page_size=100, prefetch=3)]
+
+    assert ids == [str(i) for i in range(PAGED_TOTAL)]
+
+
+def test_tuner_grows_on_fast_pages_and_shrinks_on_large_ones():
+    """Páginas rápidas agrandan la página; páginas pesadas la achican."""
+    tuner = PageSizeTuner(page_size=50, target_seconds=0.5, max_bytes=100_000)
+    tuner.observe(50, elapsed=0.05, size=10_000)
+    assert tuner.page_size == 100
+
+    tuner.observe(100, elapsed=0.05, size=400_000)
+    assert tuner.page_size == 25
+
+    tuner.cap(20)
+    assert tuner.page_size == 20
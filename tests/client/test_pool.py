@@ -0,0 +1,60 @@
+# -----------------------------------------------------------
+# Archivo: test_pool.py
+# Descripción:
+#   Pruebas del pool de conexiones keep-alive de APIClient y de batch()
+#   contra un servidor HTTP local (no requieren la API real).
+# -----------------------------------------------------------
+
+import api_client
+from api_client import APIClient
+
+
+def test_connections_are_reused(local_url):
+    """Varias requests seguidas deben viajar por una sola conexión TCP."""
+    with APIClient(base_url=local_url) as client:
+        client.token = None
+        for _ in range(3):
+            assert client.api_request("GET", "/health").status_code == 200
+
+        assert client.pool_stats == {"opened": 1, "reused": 2}
+
+
+def test_prewarm_opens_connections(local_url):
+    """El pre-calentamiento deja conexiones listas que luego se reutilizan."""
+    with APIClient(base_url=local_url, prewarm=2) as client:
+        client.token = None
+        assert client.pool_stats["opened"] == 2
+
+        client.api_request("GET", "/health")
+        assert client.pool_stats == {"opened": 2, "reused": 1}
+
+
+def test_module_helper_uses_shared_pool(local_url, monkeypatch):
+    """La función global api_request reutiliza la sesión compartida."""
+    monkeypatch.delenv("API_TOKEN", raising=False)
+    monkeypatch.setattr(api_client, "BASE", local_url)
+    session = api_client.get_shared_session()
+
+    api_client.api_request("GET", "/health")
+    api_client.api_request("GET", "/health")
+
+    assert api_client.get_shared_session() is session
+    assert session.get_adapter(local_url).pool_stats.snapshot()["reused"] >= 1
+
+
+def test_batch_runs_concurrently_in_order(local_server):
+    """batch() devuelve un resultado por request, en orden y con errores aislados."""
+    url, state = local_server
+    requests_list = [("GET", f"/slow/{i}", None, None) for i in range(6)]
+    requests_list.append(("GET", "/health", None, {"type": "array"}))
+
+    with APIClient(base_url=url) as client:
+        client.token = None
+        results = client.batch(requests_list, max_workers=4)
+
+    assert [r.path for r in results] == [item[1] for item in requests_list]
+    assert all(r.ok and r.response.status_code == 200 for r in results[:6])
+    assert not results[-1].ok
+    assert "Validación de esquema falló" in str(results[-1].error)
+    assert all(r.elapsed > 0 for r in results)
+    assert state.max_in_flight > 1
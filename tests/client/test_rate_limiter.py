@@ -0,0 +1,105 @@
+# -----------------------------------------------------------
+# Archivo: test_rate_limiter.py
+# Descripción:
+#   Pruebas del limitador de tasa: espaciado por grupo,
+#   adaptación ante 429/Retry-After y estado compartido.
+# -----------------------------------------------------------
+
+import time
+
+import pytest
+
+from api_client import APIClient
+from deadline import Deadline, DeadlineExceeded
+from rate_limiter import RateLimiter, endpoint_group
+from retry_policy import RetryPolicy
+
+
+def test_endpoint_group():
+    assert endpoint_group("http://api:8000/flights/FL1?x=1") == "api:8000/flights"
+    assert endpoint_group("https://api/") == "api/"
+
+
+def test_bucket_spaces_requests_after_burst():
+    """Con burst 2 y 20 req/s, 6 requests tardan al menos 4/20 s."""
+    limiter = RateLimiter(rate=20, burst=2, max_rate=20)
+    start = time.monotonic()
+    for _ in range(6):
+        limiter.acquire("g")
+    assert time.monotonic() - start >= 0.18
+
+
+def test_groups_are_independent():
+    limiter = RateLimiter(rate=1, burst=1)
+    limiter.acquire("a")
+    start = time.monotonic()
+    limiter.acquire("b")
+    assert time.monotonic() - start < 0.1
+
+
+def test_rate_adapts_to_429_and_success():
+    """AIMD: un 429 reduce la tasa a la mitad; las respuestas aceptadas la suben."""
+    limiter = RateLimiter(rate=10, burst=1, max_rate=11)
+    limiter.on_response("g", 429)
+    assert limiter.rate("g") == 5
+    for _ in range(20):
+        limiter.on_response("g", 200)
+    assert limiter.rate("g") == 11
+
+
+def test_retry_after_pauses_group():
+    limiter = RateLimiter(rate=100, burst=5)
+    limiter.on_response("g", 429, retry_after=0.2)
+    assert limiter.acquire("g") >= 0.15
+
+
+def test_503_with_retry_after_slows_down_and_pauses():
+    """Un 503 con Retry-After frena el grupo igual que un 429; un 500 sin él no."""
+    limiter = RateLimiter(rate=100, burst=5)
+    limiter.on_response("g", 500)
+    assert limiter.rate("g") == 100
+    limiter.on_response("g", 503, retry_after=0.2)
+    assert limiter.rate("g") == 50
+    assert limiter.acquire("g") >= 0.15
+
+
+def test_retry_after_pause_is_capped():
+    """Un Retry-After enorme no pausa el grupo más que `max_pause`."""
+    limiter = RateLimiter(rate=100, burst=5, max_pause=0.2)
+    limiter.on_response("g", 429, retry_after=3600)
+    assert limiter.acquire("g") < 1
+
+
+def test_acquire_does_not_wait_past_deadline():
+    """Si la pausa no entra en el presupuesto se falla sin esperar."""
+    limiter = RateLimiter(rate=100, burst=5)
+    limiter.on_response("g", 429, retry_after=5)
+    deadline = Deadline()
+    deadline.start(0.5)
+    start = time.monotonic()
+    with pytest.raises(DeadlineExceeded):
+        limiter.acquire("g", deadline=deadline)
+    assert time.monotonic() - start < 0.1
+
+
+def test_state_shared_through_file(tmp_path):
+    """Dos limitadores con el mismo archivo (como dos procesos) comparten el bucket."""
+    path = str(tmp_path / "limits.json")
+    first = RateLimiter(rate=10, burst=1, path=path)
+    second = RateLimiter(rate=10, burst=1, path=path)
+    first.acquire("g")
+    assert second.acquire("g") > 0.05
+    first.on_response("g", 429)
+    assert second.rate("g") == 5
+
+
+def test_client_slows_down_on_429(local_url):
+    """El adaptador informa los 429 al limitador y respeta su espera en los reintentos."""
+    limiter = RateLimiter(rate=50, burst=5)
+    client = APIClient(
+        base_url=local_url, retry_policy=RetryPolicy(max_attempts=2, base_delay=0), rate_limiter=limiter
+    )
+    with client:
+        assert client.api_request("GET", "/status/429").status_code == 429
+    group = endpoint_group(local_url + "/status/429")
+    assert limiter.rate(group) == 12.5
@@ -0,0 +1,101 @@
+# -----------------------------------------------------------
+# Archivo: test_resource_ledger.py
+# Descripción:
+#   Pruebas del registro de recursos (resource_ledger.py):
+#   anotación de lo creado, limpieza por niveles, puntos de
+#   control y reporte de lo que no se pudo borrar.
+# -----------------------------------------------------------
+
+import pytest
+
+from api_client import build_session
+from entity_factory import EntityFactory
+from inproc_adapter import register_app, unregister_app
+from resource_ledger import ResourceLedger
+from standin_api import AirlineAPI, issue_token
+
+TOKEN = issue_token("admin@demo.com")
+
+
+def _headers():
+    return {"Authorization": f"Bearer {TOKEN}"}
+
+
+@pytest.fixture
+def api():
+    """API en proceso que además anota el orden de los DELETE."""
+    app = AirlineAPI(seed=1)
+    deletes = []
+
+    def recording_app(environ, start_response):
+        if environ["REQUEST_METHOD"] == "DELETE":
+            deletes.append(environ["PATH_INFO"].split("/")[1])
+        return app(environ, start_response)
+
+    url = register_app("ledger-test", recording_app)
+    yield app, url, deletes
+    unregister_app("ledger-test")
+
+
+@pytest.fixture
+def ledger():
+    return ResourceLedger()
+
+
+@pytest.fixture
+def session(ledger):
+    return ledger.track(build_session(retry_policy=None, rate_limiter=None))
+
+
+def test_records_creations_and_deletes_children_first(api, ledger, session):
+    app, url, deletes = api
+    factory = EntityFactory(session, url, headers=_headers, ledger=ledger)
+    factory.shared("booking")
+    factory.prefill("airport", 2)
+    # Un POST directo (fuera de la fábrica) también queda registrado
+    session.post(f"{url}/airlines", json={"id": "DIRECT1", "name": "X", "country": "Y"}, headers=_headers())
+    assert len(ledger) == 6
+
+    assert ledger.flush(session, _headers) == []
+    assert ledger.deleted == 6 and len(ledger) == 0
+    assert deletes.index("bookings") < deletes.index("flights") < max(
+        i for i, kind in enumerate(deletes) if kind == "airlines"
+    )
+    assert "DIRECT1" not in app.airlines
+    assert not any(code not in ("JFK", "LAX", "MEX") for code in app.airports)
+    factory.close()
+
+
+def test_entities_deleted_by_tests_are_forgotten(api, ledger, session):
+    _, url, deletes = api
+    session.post(f"{url}/airports", json={"iata_code": "QQQ", "city": "X", "country": "Y"}, headers=_headers())
+    session.delete(f"{url}/airports/QQQ", headers=_headers())
+    assert len(ledger) == 0
+    assert ledger.flush(session, _headers) == []
+    assert deletes == ["airports"]
+
+
+def test_checkpoint_keeps_pinned_shared_entities(api, ledger, session):
+    app, url, _ = api
+    factory = EntityFactory(session, url, headers=_headers, ledger=ledger)
+    flight = factory.shared("flight")
+    booking = factory.lease("booking")
+
+    ledger.checkpoint(session, _headers)
+    assert app.bookings[booking["id"]]["status"] == "cancelled"
+    assert flight["id"] in app.flights
+    assert len(ledger) == 2  # vuelo y aerolínea compartidos
+
+    ledger.flush(session, _headers)
+    assert flight["id"] not in app.flights
+    factory.close()
+
+
+def test_failures_are_reported(api, ledger, session):
+    app, url, _ = api
+    session.post(f"{url}/airlines", json={"id": "KEEP1", "name": "X", "country": "Y"}, headers=_headers())
+    app.fail_next(1, status=500)
+
+    failures = ledger.flush(session, _headers)
+    assert [(kind, status.split()[0]) for kind, _, status in failures] == [("airline", "500")]
+    assert ledger.failures == failures
@@ -0,0 +1,90 @@
+# -----------------------------------------------------------
+# Archivo: test_response_cache.py
+# Descripción:
+#   Pruebas de la caché de respuestas GET de APIClient:
+#   aciertos, invalidación por escritura, ETag y expulsiones.
+# -----------------------------------------------------------
+
+from api_client import APIClient
+from response_cache import ResponseCache
+
+
+def test_repeated_get_is_served_from_cache(local_server):
+    """Un GET repetido dentro del TTL no vuelve a tocar el servidor."""
+    url, state = local_server
+    cache = ResponseCache(ttl=60)
+
+    with APIClient(base_url=url, cache=cache) as client:
+        client.token = None
+        first = client.api_request("GET", "/flights", params={"b": 2, "a": 1})
+        second = client.api_request("GET", "/flights", params={"a": 1, "b": 2})
+
+    assert second.json() == first.json()
+    assert state.requests == 1
+    assert cache.stats()["hits"] == 1
+
+
+def test_write_invalidates_collection(local_server):
+    """Un POST sobre /bookings invalida los GET cacheados de esa colección."""
+    url, state = local_server
+    cache = ResponseCache(ttl=60)
+
+    with APIClient(base_url=url, cache=cache) as client:
+        client.token = None
+        client.api_request("GET", "/bookings")
+        client.api_request("GET", "/bookings/BK1")
+        client.api_request("GET", "/flights")
+        client.api_request("POST", "/bookings", json={"flight_id": "FL1"})
+        client.api_request("GET", "/bookings")
+        client.api_request("GET", "/flights")
+
+    assert cache.stats()["invalidations"] == 2
+    assert state.requests == 5
+
+
+def test_stale_entry_is_revalidated_with_etag(local_server):
+    """Una entrada vencida con ETag se revalida y un 304 reutiliza el body guardado."""
+    url, _ = local_server
+    cache = ResponseCache(ttl=0)
+
+    with APIClient(base_url=url, cache=cache) as client:
+        client.token = None
+        client.api_request("GET", "/etag/airports")
+        response = client.api_request("GET", "/etag/airports")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+    assert cache.stats()["revalidations"] == 1
+
+
+def test_revalidation_after_eviction_refetches(local_server):
+    """Si la entrada se expulsó antes del 304, se pide la respuesta completa sin If-None-Match."""
+    url, state = local_server
+
+    class EvictingCache(ResponseCache):
+        def revalidated(self, key):
+            self.clear()
+            return super().revalidated(key)
+
+    cache = EvictingCache(ttl=0)
+    with APIClient(base_url=url, cache=cache) as client:
+        client.token = None
+        client.api_request("GET", "/etag/airports")
+        response = client.api_request("GET", "/etag/airports")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+    assert state.requests == 3
+
+
+def test_lru_evictions_are_counted(local_url):
+    """Superado maxsize se expulsa la entrada menos usada."""
+    cache = ResponseCache(maxsize=2, ttl=60)
+
+    with APIClient(base_url=local_url, cache=cache) as client:
+        client.token = None
+        for code in ("AAA", "BBB", "CCC"):
+            client.api_request("GET", f"/airports/{code}")
+
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["size"] == 2
@@ -0,0 +1,91 @@
+# -----------------------------------------------------------
+# Archivo: test_retry_policy.py
+# Descripción:
+#   Pruebas de la política unificada de reintentos: jitter,
+#   Retry-After, presupuesto y circuit breaker.
+# -----------------------------------------------------------
+
+import time
+
+import pytest
+import requests
+
+from api_client import APIClient
+from retry_policy import CircuitBreaker, CircuitOpenError, RetryBudget, RetryPolicy, parse_retry_after
+
+
+class _FakeResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+def test_decorrelated_jitter_stays_within_bounds():
+    """Cada espera queda entre la base y el máximo configurado."""
+    policy = RetryPolicy(base_delay=0.1, max_delay=2.0)
+    delay = policy.base_delay
+    for _ in range(50):
+        delay = policy.next_delay(delay)
+        assert 0.1 <= delay <= 2.0
+
+
+def test_retry_after_is_honoured():
+    """Un 429 con Retry-After espera al menos lo indicado por el servidor."""
+    policy = RetryPolicy(base_delay=0.01, max_delay=10)
+    state = policy.start("GET", "http://api/flights")
+    assert state.on_response(_FakeResponse(429, {"Retry-After": "3"})) >= 3
+    assert parse_retry_after("no-es-fecha") is None
+
+
+def test_retry_after_beyond_max_delay_gives_up():
+    """Si el servidor pide esperar más que max_delay no se reintenta."""
+    policy = RetryPolicy(max_delay=1)
+    state = policy.start("GET", "http://api/flights")
+    assert state.on_response(_FakeResponse(503, {"Retry-After": "120"})) is None
+
+
+def test_budget_limits_retries():
+    """Con el presupuesto agotado ya no se permiten reintentos."""
+    budget = RetryBudget(ratio=0.0, min_retries=2)
+    assert budget.try_acquire()
+    assert budget.try_acquire()
+    assert not budget.try_acquire()
+
+
+def test_breaker_opens_and_fails_fast():
+    """Tras `threshold` fallos seguidos el endpoint falla sin tocar la red."""
+    policy = RetryPolicy(max_attempts=1, breaker_threshold=2, breaker_reset=60)
+    for _ in range(2):
+        policy.start("GET", "http://api/bookings/B1").on_error(requests.exceptions.ConnectionError())
+
+    # Otro ID del mismo endpoint comparte el circuito
+    with pytest.raises(CircuitOpenError):
+        policy.start("GET", "http://api/bookings/B2")
+    policy.start("GET", "http://api/flights")
+
+
+def test_half_open_probe_without_outcome_expires():
+    """Si la prueba semiabierta nunca informa su resultado, se permite otra."""
+    breaker = CircuitBreaker(threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+    assert breaker.allow()
+    assert not breaker.allow()
+
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_adapter_retries_server_errors(local_server):
+    """El adaptador del cliente reintenta los 503 y devuelve la última respuesta."""
+    url, state = local_server
+    policy = RetryPolicy(max_attempts=3, base_delay=0.01, max_delay=0.05)
+
+    with APIClient(base_url=url, retry_policy=policy) as client:
+        client.token = None
+        response = client.api_request("GET", "/status/503")
+
+    assert response.status_code == 503
+    assert state.requests == 3
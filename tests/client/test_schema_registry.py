@@ -0,0 +1,53 @@
+# -----------------------------------------------------------
+# Archivo: test_schema_registry.py
+# Descripción:
+#   Pruebas del registro de validadores precompilados.
+# -----------------------------------------------------------
+
+import jsonschema
+import pytest
+
+from schema_registry import SchemaRegistry, registry
+from tests.bookings.test_schema_bookings import booking_schema
+
+BOOKING = {
+    "id": "BK1",
+    "flight_id": "FL1",
+    "passenger_name": "John",
+    "passenger_email": "john@email.com",
+    "seat": "15A",
+    "class": "economy",
+    "status": "confirmed",
+}
+
+
+def test_validator_is_compiled_once():
+    """El mismo esquema (por identidad o por nombre) devuelve el mismo validador."""
+    # Registro propio: pytest puede importar dos veces los módulos de esquemas
+    # (como `tests.*` y `package.tests.*`) y el nombre global apunta al último
+    schemas = SchemaRegistry()
+    schemas.register("booking", booking_schema)
+    validator = schemas.validator_for(booking_schema)
+    assert schemas.validator_for(booking_schema) is validator
+    assert schemas.validator_for("booking") is validator
+
+
+def test_error_matches_jsonschema_validate():
+    """Los errores son los mismos que reporta jsonschema.validate()."""
+    invalid = dict(BOOKING, status="pending")
+
+    with pytest.raises(jsonschema.ValidationError) as expected:
+        jsonschema.validate(instance=invalid, schema=booking_schema)
+    with pytest.raises(jsonschema.ValidationError) as actual:
+        registry.validate(invalid, "booking")
+
+    assert actual.value.message == expected.value.message
+
+
+def test_format_checking_is_opt_in():
+    """El formato `email` solo se verifica si el registro lo habilita."""
+    invalid = dict(BOOKING, passenger_email="no-es-un-email")
+
+    SchemaRegistry(check_formats=False).validate(invalid, booking_schema)
+    with pytest.raises(jsonschema.ValidationError):
+        SchemaRegistry(check_formats=True).validate(invalid, booking_schema)
@@ -0,0 +1,125 @@
+# -----------------------------------------------------------
+# Archivo: test_single_flight.py
+# Descripción:
+#   Pruebas de la coalescencia de GETs idénticos en vuelo,
+#   con hilos (APIClient) y con tareas (AsyncAPIClient).
+# -----------------------------------------------------------
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from api_client import APIClient
+from async_api_client import AsyncAPIClient
+from deadline import Deadline, DeadlineExceeded
+from metrics import metrics
+from single_flight import SingleFlight
+
+
+def test_concurrent_identical_gets_share_one_request(local_server):
+    """Diez hilos piden el mismo GET lento: el servidor recibe una sola request."""
+    url, state = local_server
+    metrics.reset()
+    group = SingleFlight()
+    with APIClient(base_url=url, single_flight=group) as client:
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            responses = list(executor.map(
+                lambda _: client.api_request("GET", "/slow/flights", params={"minPrice": 200}),
+                range(10),
+            ))
+
+    assert [r.json() for r in responses] == [{"status": "ok"}] * 10
+    assert state.requests == 1
+    assert group.stats() == {"executed": 1, "coalesced": 9, "in_flight": 0}
+    counters = metrics.to_json()["counters"]
+    assert counters == [{"name": "coalesced", "method": "GET", "endpoint": "/{id}/flights", "count": 9}]
+
+
+def test_different_queries_are_not_coalesced(local_server):
+    url, state = local_server
+    with APIClient(base_url=url, single_flight=SingleFlight()) as client:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(
+                lambda i: client.api_request("GET", "/slow/flights", params={"minPrice": i}),
+                range(4),
+            ))
+    assert state.requests == 4
+
+
+def test_other_headers_and_sessions_are_not_coalesced(local_server):
+    """Distinto Accept, distintas credenciales o distinta sesión: requests separadas."""
+    url, state = local_server
+    group = SingleFlight()
+    with APIClient(base_url=url, single_flight=group) as first, \
+            APIClient(base_url=url, single_flight=group) as second:
+        calls = [
+            lambda: first.api_request("GET", "/slow/flights", headers={"Accept": "application/json"}),
+            lambda: first.api_request("GET", "/slow/flights", headers={"Accept": "text/csv"}),
+            lambda: first.api_request("GET", "/slow/flights", auth=("ana", "x")),
+            lambda: second.api_request("GET", "/slow/flights", auth=("ana", "x")),
+        ]
+        with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+            list(executor.map(lambda call: call(), calls))
+    assert state.requests == 4
+    assert group.stats()["coalesced"] == 0
+
+
+def test_waiter_gives_up_at_deadline():
+    """Quien espera una llamada en vuelo no se pasa del presupuesto del test."""
+    group = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow():
+        started.set()
+        release.wait()
+        return "ok"
+
+    deadline = Deadline()
+    deadline.start(0.1)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        leader = executor.submit(group.do, "k", slow)
+        started.wait()
+        with pytest.raises(DeadlineExceeded):
+            group.do("k", slow, deadline=deadline)
+        release.set()
+        assert leader.result() == ("ok", False)
+
+
+def test_waiters_receive_leader_error():
+    """Si la llamada líder falla, quienes esperaban reciben la misma excepción."""
+    group = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def failing():
+        started.set()
+        release.wait()
+        raise ValueError("caído")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(group.do, "k", failing)
+        started.wait()
+        waiter = executor.submit(group.do, "k", failing)
+        while group.stats()["coalesced"] == 0:
+            pass
+        release.set()
+        for future in (leader, waiter):
+            with pytest.raises(ValueError, match="caído"):
+                future.result()
+
+
+def test_async_identical_gets_share_one_request(local_server):
+    url, state = local_server
+
+    async def scenario():
+        async with AsyncAPIClient(base_url=url) as client:
+            responses = await asyncio.gather(*(client.api_request("GET", "/slow/x") for _ in range(5)))
+            return responses, client.single_flight.stats()
+
+    responses, stats = asyncio.run(scenario())
+    assert all(r.status_code == 200 for r in responses)
+    assert state.requests == 1
+    assert stats["coalesced"] == 4
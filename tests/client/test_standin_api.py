@@ -0,0 +1,107 @@
+# -----------------------------------------------------------
+# Archivo: test_standin_api.py
+# Descripción:
+#   Pruebas de la API local en memoria (standin_api.py):
+#   autenticación, reglas de negocio del .feature, esquemas
+#   y la inyección de latencia y errores.
+# -----------------------------------------------------------
+
+import time
+
+import pytest
+
+from api_client import APIClient, build_session
+from retry_policy import RetryPolicy
+from schema_registry import validate
+from standin_api import AirlineAPI, StandInServer
+from tests.bookings.test_schema_bookings import booking_schema
+from tests.flights.test_schema_flights import flight_schema
+from tests.users.test_schema_user import user_schema
+
+FLIGHT = {
+    "name": "SKY123", "from": "JFK", "to": "LAX", "departure": "08:00", "arrival": "11:30",
+    "duration": 3.5, "stops": 0, "price": 299.99, "airline_id": "123",
+}
+
+
+@pytest.fixture
+def standin():
+    """API en memoria propia del test (la de sesión es compartida)."""
+    with StandInServer(AirlineAPI(seed=1)) as server:
+        yield server
+
+
+@pytest.fixture
+def client(standin):
+    with APIClient(base_url=standin.url, single_flight=None, rate_limiter=None) as client:
+        client.login("admin@demo.com", "admin123")
+        yield client
+
+
+def test_requires_token(standin):
+    with APIClient(base_url=standin.url) as anonymous:
+        anonymous.token = None
+        assert anonymous.api_request("GET", "/flights").status_code == 401
+        assert anonymous.api_request("GET", "/health").json() == {"status": "ok"}
+        with pytest.raises(Exception, match="Login failed: 401"):
+            anonymous.login("admin@demo.com", "incorrecta")
+
+
+def test_flight_and_booking_lifecycle(client):
+    flight = client.api_request("POST", "/flights", json=FLIGHT, validate_schema=flight_schema)
+    assert flight.status_code == 201
+
+    booking = client.api_request("POST", "/bookings", json={
+        "flight_id": flight.json()["id"], "passenger_name": "John",
+        "passenger_email": "john@email.com", "seat": "15A", "class": "economy",
+    })
+    assert booking.status_code == 201
+    validate(booking.json(), booking_schema)
+
+    path = f"/bookings/{booking.json()['id']}"
+    assert client.api_request("DELETE", path).json()["status"] == "cancelled"
+    assert client.api_request("DELETE", path).status_code == 400
+
+
+def test_business_rules(client):
+    """Errores de validación según el .feature y los tests de la suite."""
+    assert client.api_request("POST", "/flights", json=dict(FLIGHT, airline_id="999")).status_code == 422
+    missing = client.api_request("POST", "/flights", json=dict(FLIGHT, name="", to=""))
+    assert missing.status_code == 400 and "name, to" in missing.json()["detail"]
+    bad_date = client.api_request("POST", "/airlines", json={"name": "X", "country": "USA", "established": "2024-13-45"})
+    assert bad_date.status_code == 400 and "date" in bad_date.json()["detail"]
+    assert client.api_request("POST", "/bookings", json={
+        "flight_id": "FL999", "passenger_name": "John", "passenger_email": "john@email.com",
+        "seat": "15A", "class": "economy",
+    }).status_code == 400
+
+
+def test_flight_filters(client):
+    client.api_request("POST", "/flights", json=dict(FLIGHT, price=800))
+    by_price = client.api_request("GET", "/flights", params={"minPrice": 200, "maxPrice": 500}).json()
+    assert by_price and all(200 <= f["price"] <= 500 for f in by_price)
+    by_date = client.api_request("GET", "/flights", params={"date": "2024-03-15"}).json()
+    assert [f["id"] for f in by_date] == ["FL456"]
+
+
+def test_users_are_paginated(client):
+    users = list(client.paginate("/users/", page_size=7))
+    assert len(users) == 25
+    for user in users:
+        validate(user, user_schema)
+
+
+def test_error_injection_is_retried(standin):
+    standin.app.fail_next(2, status=503)
+    policy = RetryPolicy(max_attempts=3, base_delay=0)
+    with APIClient(base_url=standin.url, session=build_session(retry_policy=policy, rate_limiter=None)) as client:
+        assert client.api_request("GET", "/health").status_code == 200
+    assert standin.app.requests == 3
+
+
+def test_latency_injection(standin):
+    standin.app.configure(latency=0.05)
+    with APIClient(base_url=standin.url) as client:
+        start = time.monotonic()
+        client.api_request("GET", "/health")
+    assert time.monotonic() - start >= 0.05
@@ -0,0 +1,119 @@
+# -----------------------------------------------------------
+# Archivo: test_token_cache.py
+# Descripción:
+#   Pruebas de la caché de tokens JWT compartida entre procesos.
+# -----------------------------------------------------------
+
+import base64
+import json
+import threading
+import time
+
+from api_client import APIClient
+from inproc_adapter import register_app, unregister_app
+from standin_api import ADMIN_PASS, ADMIN_USER, AirlineAPI
+from token_cache import TokenManager, decode_jwt_exp
+
+
+def make_jwt(exp):
+    """Arma un JWT sin firmar con el claim `exp` indicado."""
+    def encode(data):
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b"=").decode()
+
+    return f"{encode({'alg': 'none'})}.{encode({'sub': 'admin', 'exp': exp})}.firma"
+
+
+def test_decode_jwt_exp():
+    """El claim `exp` se lee sin verificar la firma; tokens opacos devuelven None."""
+    assert decode_jwt_exp(make_jwt(1700000000)) == 1700000000
+    assert decode_jwt_exp("token-opaco") is None
+
+
+def test_single_login_shared_between_managers(tmp_path):
+    """Varios gestores (como procesos distintos) comparten un único login."""
+    path = str(tmp_path / "tokens.json")
+    calls = []
+
+    def login():
+        calls.append(1)
+        time.sleep(0.05)
+        return make_jwt(time.time() + 3600)
+
+    managers = [TokenManager(path=path) for _ in range(5)]
+    tokens = []
+    threads = [
+        threading.Thread(target=lambda m=m: tokens.append(m.get_token("http://api", "admin", login)))
+        for m in managers
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len(set(tokens)) == 1
+
+
+def test_token_is_refreshed_before_expiry(tmp_path):
+    """Un token que vence dentro del margen se renueva proactivamente."""
+    manager = TokenManager(path=str(tmp_path / "tokens.json"), refresh_margin=60)
+    expiring = make_jwt(time.time() + 30)
+    fresh = make_jwt(time.time() + 3600)
+    logins = iter([expiring, fresh])
+
+    assert manager.get_token("http://api", "admin", lambda: next(logins)) == expiring
+    assert manager.get_token("http://api", "admin", lambda: next(logins)) == fresh
+
+
+def test_invalidate_only_drops_the_rejected_token(tmp_path):
+    """Tras un 401 se descarta el token rechazado, no uno que otro proceso ya renovó."""
+    path = str(tmp_path / "tokens.json")
+    first, second = TokenManager(path=path), TokenManager(path=path)
+    revoked, renewed = make_jwt(time.time() + 3600), make_jwt(time.time() + 7200)
+    first.get_token("http://api", "admin", lambda: revoked)
+
+    second.invalidate("http://api", "admin", revoked)
+    assert second.get_token("http://api", "admin", lambda: renewed) == renewed
+
+    first.invalidate("http://api", "admin", revoked)  # ya no es el guardado
+    assert first.get_token("http://api", "admin", lambda: make_jwt(0)) == renewed
+
+
+def test_client_invalidates_cached_token_on_401(tmp_path):
+    """Un token revocado que responde 401 sale de la caché y el siguiente authenticate() hace login."""
+    url = register_app("tokens-test", AirlineAPI(seed=1))
+    manager = TokenManager(path=str(tmp_path / "tokens.json"))
+    manager.get_token(url, ADMIN_USER, lambda: make_jwt(time.time() + 3600))  # token que la API no reconoce
+    try:
+        with APIClient(base_url=url, single_flight=None, rate_limiter=None) as client:
+            client.authenticate(ADMIN_USER, ADMIN_PASS, manager=manager)
+            assert client.api_request("GET", "/users").status_code == 401
+
+            client.authenticate(ADMIN_USER, ADMIN_PASS, manager=manager)
+            assert client.api_request("GET", "/users").status_code == 200
+    finally:
+        unregister_app("tokens-test")
+
+
+def test_rejected_login_with_stale_token_does_not_deadlock(tmp_path):
+    """Un 401 del propio login (credenciales inválidas) no invalida la caché desde dentro de get_token()."""
+    url = register_app("tokens-login-test", AirlineAPI(seed=1))
+    manager = TokenManager(path=str(tmp_path / "tokens.json"))
+    errors = []
+
+    def scenario():
+        with APIClient(base_url=url, single_flight=None, rate_limiter=None) as client:
+            client.token = "token-viejo"
+            try:
+                client.authenticate(ADMIN_USER, "clave-incorrecta", manager=manager)
+            except Exception as e:
+                errors.append(e)
+
+    try:
+        thread = threading.Thread(target=scenario, daemon=True)
+        thread.start()
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+        assert len(errors) == 1 and "Login failed: 401" in str(errors[0])
+    finally:
+        unregister_app("tokens-login-test")
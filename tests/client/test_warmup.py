@@ -0,0 +1,90 @@
+# -----------------------------------------------------------
+# Archivo: test_warmup.py
+# Descripción:
+#   Pruebas del calentamiento de la API (warmup.py): espera
+#   con reintentos mientras la API "despierta", plazo máximo
+#   y tareas pendientes al quedar lista.
+# -----------------------------------------------------------
+
+import threading
+
+import pytest
+
+import warmup
+from api_client import build_session
+from inproc_adapter import register_app, unregister_app
+from standin_api import AirlineAPI
+from warmup import Warmup
+
+
+@pytest.fixture(autouse=True)
+def _fast_backoff(monkeypatch):
+    monkeypatch.setattr(warmup, "INITIAL_DELAY", 0.01)
+    monkeypatch.setattr(warmup, "MAX_DELAY", 0.02)
+
+
+@pytest.fixture
+def api():
+    app = AirlineAPI(seed=1)
+    url = register_app("warmup-test", app)
+    yield app, url
+    unregister_app("warmup-test")
+
+
+@pytest.fixture
+def session():
+    return build_session(retry_policy=None, rate_limiter=None)
+
+
+def test_waits_until_api_answers(api, session):
+    app, url = api
+    app.fail_next(3, status=503)  # la API "arrancando"
+    ran = threading.Event()
+
+    api_warmup = Warmup(deadline=10)
+    api_warmup.start(url, session=session)
+    api_warmup.on_ready(ran.set)
+
+    assert api_warmup.wait(5)
+    assert api_warmup.attempts == 4 and api_warmup.error is None
+    assert ran.wait(1)
+
+
+def test_deadline_reports_error(api, session):
+    app, url = api
+    app.configure(error_rate=1.0, error_status=502)
+    ran = threading.Event()
+
+    api_warmup = Warmup(deadline=0.2)
+    api_warmup.on_ready(ran.set)  # sin start(): se ignora
+    api_warmup.start(url, session=session)
+    api_warmup.on_ready(ran.set)
+
+    assert not api_warmup.wait(5)
+    assert "HTTP 502" in api_warmup.error and api_warmup.attempts > 1
+    assert not ran.is_set()
+
+
+def test_tasks_after_ready_run_immediately(api, session):
+    _, url = api
+    api_warmup = Warmup(deadline=5)
+    api_warmup.start(url, session=session)
+    assert api_warmup.wait(5)
+
+    ran = threading.Event()
+    api_warmup.on_ready(ran.set)
+    assert ran.wait(1)
+
+
+def test_wait_without_start_does_not_block():
+    api_warmup = Warmup()
+    assert api_warmup.wait() is True and not api_warmup.started
+
+
+def test_unreachable_api_fails_fast():
+    """Una conexión rechazada (BASE_URL mal configurado) no espera hasta el plazo."""
+    api_warmup = Warmup(deadline=60)
+    api_warmup.start("http://127.0.0.1:9")
+    assert not api_warmup.wait(10)
+    assert api_warmup.attempts == warmup.PERMANENT_FAILURES
+    assert "no es accesible" in api_warmup.error and api_warmup.elapsed < 10
@@ -6,6 +6,8 @@
 # cumplan con la estructura esperada al manejar datos de vuelos.
 # ======================================================
 
+from schema_registry import register_schema
+
 # Esquema de validación JSON para vuelos
 flight_schema = {
     "type": "object",  # El objeto debe ser un JSON de tipo objeto
@@ -55,3 +57,5 @@ flight_schema = {
     },
     "additionalProperties": False  # No se permiten propiedades extra no definidas
 }
+
+register_schema("flight", flight_schema)
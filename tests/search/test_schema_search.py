@@ -12,6 +12,8 @@
 # (ej. promociones, disponibilidad, etc.).
 # ======================================================
 
+from schema_registry import register_schema
+
 flight_search_schema = {
     "type": "object",  # El resultado debe ser un objeto JSON
     "required": [
@@ -58,3 +60,5 @@ flight_search_schema = {
     },
     "additionalProperties": True  # Se permiten propiedades adicionales
 }
+
+register_schema("flight_search", flight_search_schema)
@@ -1,17 +1,12 @@
 import pytest
-from jsonschema import validate
+from schema_registry import validate
 from tests.search.test_schema_search import flight_search_schema
-from requests.exceptions import RetryError
-import random
-import string
+from requests.exceptions import ConnectionError
+from entity_factory import EntityCreationError
+from allocator import allocator
 
 
-def random_id(length=8):
-    """Genera un ID aleatorio"""
-    return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
-
-
-def test_search_flights_by_date(base_url, auth_headers, session_with_retries):
+def test_search_flights_by_date(base_url, auth_headers, session_with_retries, entities):
     """
     Buscar vuelos por fechas
     Given que existen vuelos para la fecha "2024-03-15"
@@ -20,50 +15,10 @@ def test_search_flights_by_date(base_url, auth_headers, session_with_retries):
     And todos los vuelos deben ser para la fecha especificada
     """
     try:
-        # Primero crear un vuelo para asegurar que hay datos
-        airline_id = random_id()
-        airline_data = {
-            "id": airline_id,
-            "name": "Test Airline",
-            "country": "USA"
-        }
-
-        # Crear aerolínea
-        airline_response = session_with_retries.post(
-            f"{base_url}/airlines",
-            json=airline_data,
-            headers=auth_headers,
-            timeout=10
-        )
-
-        if airline_response.status_code not in [200, 201]:
-            pytest.skip("No se pudo crear aerolínea para la prueba")
-
-        # Crear vuelo con fecha específica
-        flight_data = {
-            "name": "SKY123",
-            "from": "JFK",
-            "to": "LAX",
-            "departure": "08:00",
-            "arrival": "11:30",
-            "duration": 3.5,
-            "stops": 0,
-            "price": 299.99,
-            "airline_id": airline_id,
-            "date": "2024-03-15"  # Fecha específica
-        }
-
-        flight_response = session_with_retries.post(
-            f"{base_url}/flights",
-            json=flight_data,
-            headers=auth_headers,
-            timeout=10
-        )
-
-        if flight_response.status_code not in [200, 201]:
-            pytest.skip("No se pudo crear vuelo para la prueba")
+        # Asegurar que hay datos: vuelo compartido con fecha específica
+        entities.shared("flight", date="2024-03-15")
 
-        # Ahora buscar vuelos por fecha
+        # Buscar vuelos por fecha
         response = session_with_retries.get(
             f"{base_url}/flights?date=2024-03-15",
             headers=auth_headers,
@@ -82,7 +37,9 @@ def test_search_flights_by_date(base_url, auth_headers, session_with_retries):
         for flight in flights:
             assert flight.get("date") == "2024-03-15", f"Vuelo con fecha incorrecta: {flight}"
 
-    except RetryError as e:
+    except EntityCreationError as e:
+        pytest.skip(f"No se pudo crear vuelo para la prueba: {e.response.text}")
+    except ConnectionError as e:
         pytest.xfail(f"Error de conexión después de múltiples intentos: {e}")
     except Exception as e:
         pytest.xfail(f"Error al buscar vuelos por fecha: {str(e)}")
@@ -117,7 +74,7 @@ def test_search_flights_by_price_range(base_url, auth_headers, session_with_retr
             price = flight.get("price", 0)
             assert 200 <= price <= 500, f"Precio {price} fuera del rango 200-500"
 
-    except RetryError as e:
+    except ConnectionError as e:
         pytest.xfail(f"Error de conexión después de múltiples intentos: {e}")
     except Exception as e:
         pytest.xfail(f"Error al buscar vuelos por precio: {str(e)}")
@@ -132,7 +89,7 @@ def test_validate_airline_date_format(base_url, auth_headers, session_with_retri
     And el mensaje debe indicar error en el formato de fecha
     """
     airline_data = {
-        "id": random_id(),
+        "id": allocator.id(),
         "name": "Test Airline",
         "country": "USA",
         "established": "2024-13-45"  # Fecha inválida
@@ -157,7 +114,7 @@ def test_validate_airline_date_format(base_url, auth_headers, session_with_retri
         assert any(
             keyword in error_message for keyword in ["date", "fecha", "format", "formato", "invalid", "inválido"])
 
-    except RetryError as e:
+    except ConnectionError as e:
         pytest.xfail(f"Error de conexión después de múltiples intentos: {e}")
     except Exception as e:
         pytest.xfail(f"Error al validar formato de fecha: {str(e)}")
@@ -203,7 +160,7 @@ def test_validate_required_fields_flight(base_url, auth_headers, session_with_re
         assert any(
             keyword in error_message for keyword in ["required", "requerido", "missing", "faltante", "field", "campo"])
 
-    except RetryError as e:
+    except ConnectionError as e:
         pytest.xfail(f"Error de conexión después de múltiples intentos: {e}")
     except Exception as e:
         pytest.xfail(f"Error al validar campos requeridos: {str(e)}")
\ No newline at end of file
@@ -1,3 +1,5 @@
+from schema_registry import register_schema
+
 # Esquema esperado para un usuario
 user_schema = {
     "type": "object",
@@ -9,4 +11,6 @@ user_schema = {
         "role": {"type": "string", "enum": ["passenger", "admin"]}
     },
     "additionalProperties": False
-}
\ No newline at end of file
+}
+
+register_schema("user", user_schema)
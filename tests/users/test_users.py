@@ -1,7 +1,7 @@
-import random
 import pytest
-from jsonschema import validate
-from requests.exceptions import RetryError
+from allocator import allocator
+from schema_registry import validate
+from requests.exceptions import ConnectionError, HTTPError
 from tests.users.test_schema_user import user_schema
 
 
@@ -10,38 +10,20 @@ def test_create_user_schema(test_user):
     validate(instance=test_user, schema=user_schema)
 
 
-def test_get_all_users(base_url, auth_headers, session_with_retries):
+def test_get_all_users(authenticated_api_client):
     """
     Obtiene todos los usuarios de la API en bloques (paginación).
+    Las páginas siguientes se piden por adelantado mientras se procesa la actual.
     Verifica que devuelve una lista de usuarios con id and email válidos.
     """
-    limit = 10
-    skip = 0
-    results = []
-
     try:
-        while True:
-            r = session_with_retries.get(
-                f"{base_url}/users/",
-                headers=auth_headers,
-                params={"skip": skip, "limit": limit},
-                timeout=5
-            )
-
-            if r.status_code >= 500:
-                pytest.xfail(f"Error del servidor (500) al obtener usuarios: {r.text}")
-
-            r.raise_for_status()
-            users_list = r.json()
-
-            if not users_list:
-                break
-
-            results.extend(users_list)
-            skip += limit
-
-    except RetryError as e:
+        results = list(authenticated_api_client.paginate("/users/", page_size=10))
+    except ConnectionError as e:
         pytest.xfail(f"Error de conexión después de múltiples intentos: {e}")
+    except HTTPError as e:
+        if e.response is not None and e.response.status_code >= 500:
+            pytest.xfail(f"Error del servidor (500) al obtener usuarios: {e.response.text}")
+        raise
 
     assert isinstance(results, list)
     if results:
@@ -66,14 +48,14 @@ def test_delete_user_alondra(base_url, auth_headers, session_with_retries):
 
         r.raise_for_status()
         users = r.json()
-    except RetryError as e:
+    except ConnectionError as e:
         pytest.xfail(f"Error de conexión después de múltiples intentos: {e}")
 
     alondra = next((u for u in users if u.get("full_name") == "Alondra Tovar"), None)
 
     if not alondra:
         user_data = {
-            "email": f"alondra.{random.randint(1000, 9999)}@demo.com",
+            "email": allocator.email("alondra"),
             "password": "Alon12345",
             "full_name": "Alondra Tovar",
             "role": "admin"
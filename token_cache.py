@@ -0,0 +1,181 @@
+import base64
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# ======================================================
+# Caché de tokens JWT compartida entre procesos
+# ======================================================
+# Con varios workers de pytest-xdist o generadores de carga,
+# cada proceso hacía su propio login. Aquí el token se guarda
+# en un archivo protegido con un lock de archivo, de modo que
+# un solo proceso del host hace login y el resto lo reutiliza
+# hasta poco antes de que venza (claim `exp` del JWT) o hasta
+# que la API lo rechace con un 401 (revocado o rotado).
+# ======================================================
+
+# Archivo donde se guardan los tokens (uno por URL base y usuario)
+TOKEN_CACHE_PATH = os.getenv(
+    "API_TOKEN_CACHE", os.path.join(tempfile.gettempdir(), "airline_api_tokens.json")
+)
+
+# Segundos antes del vencimiento en los que el token se renueva
+REFRESH_MARGIN = float(os.getenv("API_TOKEN_REFRESH_MARGIN", "60"))
+
+# Vigencia asumida para tokens sin claim `exp` (en segundos)
+DEFAULT_TTL = float(os.getenv("API_TOKEN_DEFAULT_TTL", "900"))
+
+
+def decode_jwt_exp(token):
+    """
+    Lee el claim `exp` de un JWT sin verificar la firma.
+
+    Returns:
+        float | None: Vencimiento como timestamp Unix, o None si no se puede leer.
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+@contextmanager
+def file_lock(path):
+    """Lock exclusivo entre procesos sobre `path` + ".lock" (también lo usa rate_limiter.py)."""
+    with open(path + ".lock", "a+") as fh:
+        if fcntl is not None:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+        else:
+            fh.seek(0)
+            msvcrt.locking(fh.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+            else:
+                fh.seek(0)
+                msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class TokenManager:
+    """
+    Entrega tokens válidos haciendo login solo cuando hace falta.
+
+    Orden de búsqueda: memoria del proceso → archivo compartido → login.
+    El login se hace con el lock de archivo tomado, así que si varios
+    procesos arrancan a la vez solo uno llega a llamar a /auth/login.
+    """
+
+    def __init__(self, path=TOKEN_CACHE_PATH, refresh_margin=REFRESH_MARGIN):
+        """
+        Args:
+            path (str): Archivo JSON de la caché compartida.
+            refresh_margin (float): Segundos antes de `exp` en que el token se renueva.
+        """
+        self.path = path
+        self.refresh_margin = refresh_margin
+        self._memory = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(base_url, username):
+        return f"{base_url.rstrip('/')}|{username}"
+
+    def _is_fresh(self, entry):
+        return entry is not None and entry["expires_at"] - self.refresh_margin > time.time()
+
+    def _read(self):
+        try:
+            with open(self.path, encoding="utf-8") as fh:
+                return json.load(fh)
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, entries):
+        # Escritura atómica y con permisos solo para el usuario: el archivo contiene secretos
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tokens-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(entries, fh)
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def get_token(self, base_url, username, login):
+        """
+        Devuelve un token vigente para `username` en `base_url`.
+
+        Args:
+            base_url (str): URL base de la API.
+            username (str): Usuario/correo.
+            login (callable): Función sin argumentos que hace login y devuelve el token.
+
+        Returns:
+            str: Token de acceso.
+        """
+        key = self.key(base_url, username)
+        with self._lock:
+            entry = self._memory.get(key)
+            if self._is_fresh(entry):
+                return entry["token"]
+
+            entry = self._read().get(key)
+            if not self._is_fresh(entry):
+                with file_lock(self.path):
+                    # Otro proceso pudo renovarlo mientras se esperaba el lock
+                    entries = self._read()
+                    entry = entries.get(key)
+                    if not self._is_fresh(entry):
+                        token = login()
+                        expires_at = decode_jwt_exp(token) or time.time() + DEFAULT_TTL
+                        entry = {"token": token, "expires_at": expires_at}
+                        entries[key] = entry
+                        self._write(entries)
+
+            self._memory[key] = entry
+            return entry["token"]
+
+    def invalidate(self, base_url, username, token=None):
+        """
+        Descarta el token guardado (por ejemplo, tras un 401 por token revocado).
+
+        Args:
+            base_url (str): URL base de la API.
+            username (str): Usuario/correo.
+            token (str, optional): Token rechazado. Si se indica, solo se descarta
+                si sigue siendo el guardado: otro proceso pudo renovarlo ya.
+        """
+        key = self.key(base_url, username)
+
+        def matches(entry):
+            return entry is not None and (token is None or entry["token"] == token)
+
+        with self._lock:
+            if matches(self._memory.get(key)):
+                del self._memory[key]
+            with file_lock(self.path):
+                entries = self._read()
+                if matches(entries.get(key)):
+                    del entries[key]
+                    self._write(entries)
+
+
+# Gestor compartido por APIClient, conftest.py y master.py
+token_manager = TokenManager()
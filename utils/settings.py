@@ -1,7 +1,23 @@
-from dotenv import load_dotenv
 import os
 
-load_dotenv()
+_env_loaded = False
+
+
+def load_env():
+    """
+    Carga las variables del archivo .env una sola vez por proceso.
+
+    python-dotenv se importa solo aquí; conftest.py y master.py llaman a
+    esta función en lugar de repetir `load_dotenv()`.
+    """
+    global _env_loaded
+    if not _env_loaded:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _env_loaded = True
+
+
+load_env()
 
 # Configuración de la API
 BASE_URL = os.getenv("BASE_URL", "https://cf-automation-airline-api.onrender.com")
@@ -0,0 +1,222 @@
+import errno
+import os
+import random
+import socket
+import threading
+import time
+
+import requests
+from urllib3.exceptions import NameResolutionError
+
+from api_client import APIClient
+from health_gate import HEALTH_PATH
+
+# ======================================================
+# Calentamiento de la API antes de los tests
+# ======================================================
+# La API en Render se duerme cuando no recibe tráfico y la
+# primera request puede tardar casi un minuto. En lugar de
+# que el login de la sesión venza su timeout y corte la
+# corrida, un hilo en segundo plano consulta /health desde
+# que pytest arranca (mientras todavía recolecta tests):
+#
+#   - Backoff exponencial con jitter entre intentos y un
+#     timeout por intento que crece si la API no contesta.
+#   - Los errores que un arranque en frío no produce (DNS que
+#     no resuelve, conexión rechazada, sin red) cortan la
+#     espera tras PERMANENT_FAILURES intentos seguidos: suelen
+#     ser un BASE_URL mal configurado o una máquina sin red.
+#   - Cuando responde, abre conexiones del pool de las
+#     sesiones registradas y ejecuta las tareas pendientes
+#     (ej. el login del administrador).
+#
+# Los tests solo esperan (wait()) cuando necesitan la red
+# por primera vez.
+# ======================================================
+
+# Se desactiva con API_WARMUP=0
+WARMUP_ENABLED = os.getenv("API_WARMUP", "1") != "0"
+
+# Tiempo máximo que se espera a que la API despierte (segundos)
+WARMUP_DEADLINE = float(os.getenv("API_WARMUP_DEADLINE", "180"))
+
+# Conexiones a abrir por sesión registrada cuando la API está lista
+WARMUP_CONNECTIONS = int(os.getenv("API_WARMUP_CONNECTIONS", "4"))
+
+# Backoff entre intentos y timeout de cada intento (segundos)
+INITIAL_DELAY = 0.5
+MAX_DELAY = 8.0
+INITIAL_TIMEOUT = 5.0
+MAX_TIMEOUT = 60.0
+
+# Intentos seguidos con errores de DNS/conexión rechazada que dan la espera por perdida
+PERMANENT_FAILURES = 3
+
+# errno de los errores de socket que no se arreglan esperando
+_PERMANENT_ERRNOS = {errno.ECONNREFUSED, errno.ENETUNREACH, errno.EHOSTUNREACH}
+
+
+def is_permanent_error(error):
+    """
+    True si el error de requests viene de DNS, conexión rechazada o falta de red.
+
+    Recorre la cadena de excepciones (requests → urllib3 → socket).
+    """
+    seen = set()
+    pending = [error]
+    while pending:
+        current = pending.pop()
+        if current is None or id(current) in seen:
+            continue
+        seen.add(id(current))
+        if isinstance(current, (NameResolutionError, socket.gaierror)):
+            return True
+        if isinstance(current, OSError) and current.errno in _PERMANENT_ERRNOS:
+            return True
+        pending.extend([current.__cause__, current.__context__, getattr(current, "reason", None)])
+        pending.extend(arg for arg in getattr(current, "args", ()) if isinstance(arg, BaseException))
+    return False
+
+
+class Warmup:
+    """Espera en segundo plano a que la API responda y calienta las sesiones."""
+
+    def __init__(self, deadline=WARMUP_DEADLINE, health_path=HEALTH_PATH, connections=WARMUP_CONNECTIONS):
+        """
+        Args:
+            deadline (float): Segundos máximos de espera a que la API despierte.
+            health_path (str): Ruta consultada para saber si la API responde.
+            connections (int): Conexiones del pool a abrir por sesión registrada.
+        """
+        self.deadline = deadline
+        self.health_path = health_path
+        self.connections = connections
+        self.base_url = None
+        self.error = None
+        self.attempts = 0
+        self.elapsed = 0.0
+        self._ready = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._tasks = []
+
+    @property
+    def started(self):
+        return self._thread is not None
+
+    @property
+    def ready(self):
+        """bool: True si la API respondió (False mientras espera o si venció el plazo)."""
+        return self._ready.is_set() and self.error is None
+
+    def start(self, base_url, session=None):
+        """
+        Empieza a consultar la API en un hilo daemon. Llamarlo de nuevo no hace nada.
+
+        Args:
+            base_url (str): URL base de la API.
+            session (requests.Session, optional): Sesión para las consultas de
+                salud. Por defecto una sesión propia sin reintentos.
+        """
+        with self._lock:
+            if self._thread is not None:
+                return
+            self.base_url = base_url.rstrip("/")
+            self._thread = threading.Thread(
+                target=self._run, args=(session or requests.Session(),), name="api-warmup", daemon=True
+            )
+            self._thread.start()
+
+    def wait(self, timeout=None):
+        """
+        Bloquea hasta que la API esté lista o venza el plazo.
+
+        Si el calentamiento no se inició, vuelve de inmediato.
+
+        Returns:
+            bool: True si la API respondió.
+        """
+        if self._thread is None:
+            return True
+        self._ready.wait(timeout)
+        return self.ready
+
+    # --------------------------------------------------
+    # Tareas al quedar lista
+    # --------------------------------------------------
+    def attach(self, session, base_url=None):
+        """Abre conexiones del pool de `session` hacia la API en cuanto esté lista."""
+        self.on_ready(lambda: self._prewarm(session, base_url or self.base_url))
+
+    def on_ready(self, task):
+        """
+        Ejecuta `task()` en el hilo de calentamiento cuando la API responda
+        (o enseguida, en otro hilo, si ya respondió). Los errores se ignoran.
+        """
+        if self._thread is None:
+            return
+        with self._lock:
+            if not self._ready.is_set():
+                self._tasks.append(task)
+                return
+        if self.ready:
+            threading.Thread(target=_run_quietly, args=(task,), daemon=True).start()
+
+    def _prewarm(self, session, base_url):
+        APIClient(base_url=base_url, session=session, prewarm=0).prewarm(self.connections)
+
+    # --------------------------------------------------
+    # Hilo de calentamiento
+    # --------------------------------------------------
+    def _run(self, session):
+        start = time.monotonic()
+        delay, timeout = INITIAL_DELAY, INITIAL_TIMEOUT
+        url = self.base_url + self.health_path
+        permanent = 0
+        while True:
+            self.attempts += 1
+            remaining = self.deadline - (time.monotonic() - start)
+            try:
+                response = session.get(url, timeout=max(min(timeout, remaining), 0.1))
+                if response.status_code < 500:
+                    break
+                reason = f"HTTP {response.status_code}"
+                permanent = 0
+            except requests.exceptions.Timeout as e:
+                # La API todavía está arrancando: el próximo intento espera más
+                timeout = min(timeout * 2, MAX_TIMEOUT)
+                reason = str(e)
+                permanent = 0
+            except requests.exceptions.RequestException as e:
+                reason = str(e)
+                permanent = permanent + 1 if is_permanent_error(e) else 0
+                if permanent >= PERMANENT_FAILURES:
+                    self.error = f"La API no es accesible en {url} ({self.attempts} intentos): {reason}"
+                    break
+
+            remaining = self.deadline - (time.monotonic() - start)
+            if remaining <= 0:
+                self.error = f"La API no respondió en {self.deadline:.0f}s ({self.attempts} intentos): {reason}"
+                break
+            time.sleep(min(random.uniform(0, delay), remaining))
+            delay = min(delay * 2, MAX_DELAY)
+
+        self.elapsed = time.monotonic() - start
+        with self._lock:
+            tasks, self._tasks = self._tasks, []
+            if self.error is not None:
+                tasks = []
+            self._ready.set()
+        for task in tasks:
+            _run_quietly(task)
+
+
+def _run_quietly(task):
+    try:
+        task()
+    except Exception:
+        pass  # el calentamiento es solo una optimización
+
+
+# Calentamiento compartido por la sesión de pytest (ver conftest.py)
+api_warmup = Warmup()